@@ -31,6 +31,10 @@ from modelon.impact.client.experiment_definition.operators import (
     Range,
     Uniform,
 )
+from modelon.impact.client.operations.futures import to_future
+from modelon.impact.client.operations.polling import PollingStrategy
+from modelon.impact.client.operations.scheduler import SubmissionScheduler
+from modelon.impact.client.operations.waiter import as_completed, wait_all
 from modelon.impact.client.published_workspace_client import (
     OrphanPublishedWorkspaceOwner,
     PublishedWorkspaceAccessKind,
@@ -0,0 +1,3 @@
+from modelon.impact.client.aio.client import AsyncClient
+from modelon.impact.client.aio.operations import AwaitableOperation
+from modelon.impact.client.aio.transport import AsyncTransport
@@ -0,0 +1,174 @@
+"""This module provides an asyncio entry-point to the client APIs."""
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Any, List, Optional
+
+from modelon.impact.client.aio.entities import AsyncWorkspace, wrap
+from modelon.impact.client.aio.operations import AwaitableOperation
+from modelon.impact.client.aio.service import AsyncService
+from modelon.impact.client.aio.transport import AsyncTransport
+from modelon.impact.client.client import Client
+from modelon.impact.client.credential_manager import CredentialManager
+from modelon.impact.client.operations.polling import PollingStrategy
+from modelon.impact.client.sal.context import Context
+
+
+class AsyncClient:
+    """Asyncio counterpart of :obj:`~modelon.impact.client.Client`.
+
+    A convenience wrapper for using the client from asyncio code without blocking
+    the event loop. Requests are sent by the synchronous client on a thread pool
+    sized to the connection pool of the client context, see
+    :obj:`~modelon.impact.client.aio.transport.AsyncTransport`, so each request in
+    flight still occupies a thread. Only waiting between status polls happens on
+    the event loop without a thread.
+
+    Args:
+        client: The client to use for communicating with the server.
+        max_workers: The maximum number of requests running at the same time.
+            Default is None and then the 'pool_maxsize' of the client context
+            is used.
+
+    Example::
+
+        import asyncio
+        from modelon.impact.client.aio import AsyncClient
+
+        async def main():
+            async with await AsyncClient.connect(url=impact_url) as client:
+                workspace = await client.get_workspace('my_workspace')
+                experiments = await asyncio.gather(
+                    *[
+                        workspace.execute(definition).wait()
+                        for definition in definitions
+                    ]
+                )
+
+        asyncio.run(main())
+
+    """
+
+    def __init__(self, client: Client, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = client._context.pool_maxsize
+        self._client = client
+        self._transport = AsyncTransport(max_workers=max_workers)
+        self._service = AsyncService(client._sal, self._transport)
+
+    @classmethod
+    async def connect(
+        cls,
+        url: Optional[str] = None,
+        interactive: Optional[bool] = None,
+        credential_manager: Optional[CredentialManager] = None,
+        context: Optional[Context] = None,
+        max_workers: Optional[int] = None,
+        polling: Optional[PollingStrategy] = None,
+    ) -> AsyncClient:
+        """Creates a client and authenticates to the server without blocking the event
+        loop. Takes the same arguments as :obj:`~modelon.impact.client.Client`.
+
+        Example::
+
+            client = await AsyncClient.connect(url=impact_url)
+
+        """
+        loop = asyncio.get_running_loop()
+        create = functools.partial(
+            Client,
+            url=url,
+            interactive=interactive,
+            credential_manager=credential_manager,
+            context=context,
+            polling=polling,
+        )
+        client = await loop.run_in_executor(None, create)
+        return cls(client, max_workers=max_workers)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def sync(self) -> Client:
+        """The synchronous client."""
+        return self._client
+
+    @property
+    def service(self) -> AsyncService:
+        """The async service layer of the client."""
+        return self._service
+
+    async def get_workspace(self, workspace_id: str) -> AsyncWorkspace:
+        """Returns an AsyncWorkspace class object.
+
+        Example::
+
+            workspace = await client.get_workspace('my_workspace')
+
+        """
+        workspace = await self._transport.run(self._client.get_workspace, workspace_id)
+        return AsyncWorkspace(workspace, self._transport)
+
+    async def get_workspaces(
+        self,
+        only_app_mode: bool = False,
+        name: Optional[str] = None,
+        sharing_id: Optional[str] = None,
+    ) -> List[AsyncWorkspace]:
+        """Returns a list of AsyncWorkspace class objects.
+
+        Example::
+
+            workspaces = await client.get_workspaces()
+
+        """
+        workspaces = await self._transport.run(
+            self._client.get_workspaces, only_app_mode, name, sharing_id
+        )
+        return [AsyncWorkspace(workspace, self._transport) for workspace in workspaces]
+
+    async def create_workspace(self, workspace_name: str) -> AsyncWorkspace:
+        """Creates and returns an AsyncWorkspace.
+
+        Example::
+
+            workspace = await client.create_workspace('my_workspace')
+
+        """
+        workspace = await self._transport.run(
+            self._client.create_workspace, workspace_name
+        )
+        return AsyncWorkspace(workspace, self._transport)
+
+    async def get_executions(
+        self, workspace_id: Optional[str] = None
+    ) -> List[AwaitableOperation]:
+        """Returns the running/active executions as awaitable operations.
+
+        Example::
+
+            for operation in await client.get_executions():
+                await operation.wait()
+
+        """
+        operations = await self._transport.run(
+            lambda: list(self._client.get_executions(workspace_id))
+        )
+        return [
+            AwaitableOperation(
+                operation,
+                self._transport,
+                functools.partial(wrap, transport=self._transport),
+            )
+            for operation in operations
+            if operation is not None
+        ]
+
+    async def close(self) -> None:
+        """Shuts down the thread pool of the client."""
+        self._transport.close()
@@ -0,0 +1,440 @@
+"""Async entity classes.
+
+The async entities wrap the synchronous entities, see for example
+:obj:`~modelon.impact.client.entities.workspace.Workspace`, and provide
+coroutine versions of the methods that communicate with the server. The
+synchronous entity is available through the 'sync' property for anything not
+covered here.
+
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from modelon.impact.client.aio.operations import AwaitableOperation
+from modelon.impact.client.aio.transport import AsyncTransport
+from modelon.impact.client.entities.case import Case, CaseRunInfo
+from modelon.impact.client.entities.experiment import (
+    Experiment,
+    ExperimentResultPoint,
+    ExperimentRunInfo,
+)
+from modelon.impact.client.entities.log import Log
+from modelon.impact.client.entities.model import Model
+from modelon.impact.client.entities.model_executable import ModelExecutable
+from modelon.impact.client.entities.result import Result
+from modelon.impact.client.entities.workspace import ExperimentDefinition, Workspace
+
+
+class _AsyncEntity:
+    def __init__(self, entity: Any, transport: AsyncTransport):
+        self._entity = entity
+        self._transport = transport
+
+    def __repr__(self) -> str:
+        return f"Async {self._entity!r}"
+
+    def __eq__(self, obj: object) -> bool:
+        return isinstance(obj, type(self)) and obj._entity == self._entity
+
+    @property
+    def id(self) -> str:
+        """ID of the entity."""
+        return self._entity.id
+
+    async def _run(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        return await self._transport.run(fn, *args, **kwargs)
+
+
+class AsyncResult(_AsyncEntity):
+    """Async counterpart of :obj:`~modelon.impact.client.entities.result.Result`."""
+
+    def __init__(self, entity: Result, transport: AsyncTransport):
+        super().__init__(entity, transport)
+
+    @property
+    def sync(self) -> Result:
+        """The synchronous entity."""
+        return self._entity
+
+    def keys(self) -> List[str]:
+        """Returns the variables in the result."""
+        return list(self._entity.keys())
+
+    async def get(self, variable: str) -> Any:
+        """Returns the trajectory for a variable.
+
+        Example::
+
+            time = await result.get('time')
+
+        """
+        return await self._run(self._entity.__getitem__, variable)
+
+    async def get_many(self, variables: List[str]) -> Dict[str, Any]:
+        """Returns the trajectories for the variables, fetched in concurrent batches.
+
+        Example::
+
+            trajectories = await result.get_many(['h', 'time'])
+
+        """
+        return await self._run(self._entity.get_many, variables)
+
+    async def to_dict(self) -> Dict[str, Any]:
+        """Returns the trajectories for all variables in the result.
+
+        Example::
+
+            trajectories = await result.to_dict()
+
+        """
+        return await self._run(lambda: dict(self._entity.items()))
+
+
+class AsyncCase(_AsyncEntity):
+    """Async counterpart of :obj:`~modelon.impact.client.entities.case.Case`."""
+
+    def __init__(self, entity: Case, transport: AsyncTransport):
+        super().__init__(entity, transport)
+
+    @property
+    def sync(self) -> Case:
+        """The synchronous entity."""
+        return self._entity
+
+    async def is_successful(self) -> bool:
+        return await self._run(self._entity.is_successful)
+
+    async def run_info(self) -> CaseRunInfo:
+        return await self._run(lambda: self._entity.run_info)
+
+    async def get_log(self) -> Log:
+        return await self._run(self._entity.get_log)
+
+    async def get_result(self, format: str = "mat") -> Tuple[Union[bytes, str], str]:
+        return await self._run(self._entity.get_result, format=format)
+
+    async def download_result(
+        self, path: Optional[str] = None, format: str = "mat"
+    ) -> str:
+        return await self._run(self._entity.download_result, path, format=format)
+
+    async def get_trajectories(self) -> AsyncResult:
+        return AsyncResult(
+            await self._run(self._entity.get_trajectories), self._transport
+        )
+
+    async def get_variables(self) -> List[str]:
+        return await self._run(self._entity.get_variables)
+
+    async def sync_case(self) -> None:
+        """Syncs the local changes of the case with the server."""
+        await self._run(self._entity.sync)
+
+    def execute(self, sync_case_changes: bool = True) -> AwaitableOperation[AsyncCase]:
+        """Executes the case. Returns an awaitable operation, the case is submitted once
+        the operation is awaited.
+
+        Example::
+
+            case = await case.execute().wait()
+
+        """
+        return _DeferredOperation(
+            self._transport,
+            lambda: self._entity.execute(sync_case_changes=sync_case_changes),
+        )
+
+
+class AsyncExperiment(_AsyncEntity):
+    """Async counterpart of
+    :obj:`~modelon.impact.client.entities.experiment.Experiment`."""
+
+    def __init__(self, entity: Experiment, transport: AsyncTransport):
+        super().__init__(entity, transport)
+
+    @property
+    def sync(self) -> Experiment:
+        """The synchronous entity."""
+        return self._entity
+
+    def execute(
+        self,
+        with_cases: Optional[List[AsyncCase]] = None,
+        sync_case_changes: bool = True,
+    ) -> AwaitableOperation[AsyncExperiment]:
+        """Executes the experiment. Returns an awaitable operation, the experiment is
+        submitted once the operation is awaited.
+
+        Example::
+
+            experiment = await experiment.execute().wait()
+
+        """
+        cases = [case.sync for case in with_cases] if with_cases is not None else None
+        return _DeferredOperation(
+            self._transport,
+            lambda: self._entity.execute(cases, sync_case_changes=sync_case_changes),
+        )
+
+    async def is_successful(self) -> bool:
+        return await self._run(self._entity.is_successful)
+
+    async def run_info(self) -> ExperimentRunInfo:
+        return await self._run(lambda: self._entity.run_info)
+
+    async def get_variables(self) -> List[str]:
+        return await self._run(self._entity.get_variables)
+
+    async def get_cases(self) -> List[AsyncCase]:
+        cases = await self._run(self._entity.get_cases)
+        return [AsyncCase(case, self._transport) for case in cases]
+
+    async def get_case(self, case_id: str) -> AsyncCase:
+        return AsyncCase(
+            await self._run(self._entity.get_case, case_id), self._transport
+        )
+
+    async def get_trajectories(self, variables: List[str]) -> Dict[str, Any]:
+        return await self._run(self._entity.get_trajectories, variables)
+
+    async def get_last_point(
+        self, variables: Optional[List[str]] = None
+    ) -> ExperimentResultPoint:
+        return await self._run(self._entity.get_last_point, variables)
+
+    async def delete(self) -> None:
+        await self._run(self._entity.delete)
+
+
+class AsyncModelExecutable(_AsyncEntity):
+    """Async counterpart of
+    :obj:`~modelon.impact.client.entities.model_executable.ModelExecutable`."""
+
+    def __init__(self, entity: ModelExecutable, transport: AsyncTransport):
+        super().__init__(entity, transport)
+
+    @property
+    def sync(self) -> ModelExecutable:
+        """The synchronous entity."""
+        return self._entity
+
+    async def is_successful(self) -> bool:
+        return await self._run(self._entity.is_successful)
+
+    async def get_log(self) -> Log:
+        return await self._run(self._entity.get_log)
+
+    async def get_settable_parameters(self) -> List[str]:
+        return await self._run(self._entity.get_settable_parameters)
+
+    async def download(self, path: Optional[str] = None) -> str:
+        return await self._run(self._entity.download, path)
+
+    async def delete(self) -> None:
+        await self._run(self._entity.delete)
+
+
+class AsyncModel(_AsyncEntity):
+    """Async counterpart of :obj:`~modelon.impact.client.entities.model.Model`."""
+
+    def __init__(self, entity: Model, transport: AsyncTransport):
+        super().__init__(entity, transport)
+
+    @property
+    def sync(self) -> Model:
+        """The synchronous entity."""
+        return self._entity
+
+    @property
+    def id(self) -> str:
+        """Name of the model."""
+        return self._entity.name
+
+    def compile(
+        self, *args: Any, **kwargs: Any
+    ) -> AwaitableOperation[AsyncModelExecutable]:
+        """Compiles the model to an FMU. Takes the same arguments as
+        :obj:`~modelon.impact.client.entities.model.Model.compile`. Returns an awaitable
+        operation, the compilation is submitted once the operation is awaited.
+
+        Example::
+
+            fmu = await model.compile({'c_compiler': 'gcc'}).wait()
+
+        """
+        return _DeferredOperation(
+            self._transport, lambda: self._entity.compile(*args, **kwargs)
+        )
+
+
+class AsyncWorkspace(_AsyncEntity):
+    """Async counterpart of
+    :obj:`~modelon.impact.client.entities.workspace.Workspace`."""
+
+    def __init__(self, entity: Workspace, transport: AsyncTransport):
+        super().__init__(entity, transport)
+
+    @property
+    def sync(self) -> Workspace:
+        """The synchronous entity."""
+        return self._entity
+
+    async def get_model(self, class_name: str) -> AsyncModel:
+        return AsyncModel(
+            await self._run(self._entity.get_model, class_name), self._transport
+        )
+
+    async def get_fmus(self) -> List[AsyncModelExecutable]:
+        fmus = await self._run(self._entity.get_fmus)
+        return [AsyncModelExecutable(fmu, self._transport) for fmu in fmus]
+
+    async def get_fmu(self, fmu_id: str) -> AsyncModelExecutable:
+        return AsyncModelExecutable(
+            await self._run(self._entity.get_fmu, fmu_id), self._transport
+        )
+
+    async def get_experiments(
+        self, class_path: Optional[str] = None
+    ) -> List[AsyncExperiment]:
+        experiments = await self._run(self._entity.get_experiments, class_path)
+        return [AsyncExperiment(exp, self._transport) for exp in experiments]
+
+    async def get_experiment(self, experiment_id: str) -> AsyncExperiment:
+        return AsyncExperiment(
+            await self._run(self._entity.get_experiment, experiment_id),
+            self._transport,
+        )
+
+    async def create_experiment(
+        self,
+        definition: ExperimentDefinition,
+        user_data: Optional[Dict[str, Any]] = None,
+    ) -> AsyncExperiment:
+        return AsyncExperiment(
+            await self._run(self._entity.create_experiment, definition, user_data),
+            self._transport,
+        )
+
+    def execute(
+        self,
+        definition: ExperimentDefinition,
+        user_data: Optional[Dict[str, Any]] = None,
+    ) -> AwaitableOperation[AsyncExperiment]:
+        """Executes an experiment. Returns an awaitable operation, the experiment is
+        created and submitted once the operation is awaited.
+
+        Example::
+
+            experiment = await workspace.execute(experiment_definition).wait()
+
+        """
+        return _DeferredOperation(
+            self._transport, lambda: self._entity.execute(definition, user_data)
+        )
+
+    async def download(self, path: str) -> str:
+        return await self._run(self._entity.download, path)
+
+    async def delete(self) -> None:
+        await self._run(self._entity.delete)
+
+
+class _DeferredOperation(AwaitableOperation):
+    """Awaitable operation whose submitting request is only sent once the operation is
+    first awaited, so that submitting never blocks the event loop.
+
+    The operation is submitted once, however many tasks await it concurrently.
+
+    """
+
+    def __init__(self, transport: AsyncTransport, submit: Any):
+        super().__init__(
+            None, transport, lambda entity: wrap(entity, transport)  # type: ignore
+        )
+        self._submit = submit
+        self._submission: Optional[asyncio.Future] = None
+
+    def __repr__(self) -> str:
+        if self._operation is None:
+            return "Awaitable operation that has not been submitted"
+        return super().__repr__()
+
+    @property
+    def sync(self) -> Any:
+        """The synchronous operation, or None if not yet submitted."""
+        return self._operation
+
+    @property
+    def id(self) -> str:
+        if self._operation is None:
+            raise RuntimeError("The operation has not been submitted yet")
+        return super().id
+
+    @property
+    def name(self) -> str:
+        if self._operation is None:
+            raise RuntimeError("The operation has not been submitted yet")
+        return super().name
+
+    async def submit(self) -> AwaitableOperation:
+        """Submits the operation, if not already done, and returns it.
+
+        Tasks awaiting the operation while it is being submitted wait for the same
+        submission. If the submission fails, awaiting the operation again raises the
+        same error instead of submitting it again.
+
+        """
+        if self._submission is None:
+            self._submission = asyncio.ensure_future(self._transport.run(self._submit))
+        # Shielded so that a cancelled task does not cancel the shared submission
+        self._operation = await asyncio.shield(self._submission)
+        return self
+
+    async def status(self) -> Any:
+        await self.submit()
+        return await super().status()
+
+    async def cancel(self) -> None:
+        """Terminates the operation.
+
+        Does nothing if the operation has not been submitted, so the operation is never
+        submitted only to be cancelled.
+
+        """
+        if self._submission is None:
+            return
+        await self.submit()
+        await super().cancel()
+
+    async def _status_snapshot(self) -> Tuple[Any, Optional[float]]:
+        await self.submit()
+        return await super()._status_snapshot()
+
+    async def data(self) -> Any:
+        await self.submit()
+        return await super().data()
+
+    def __await__(self) -> Any:
+        return self.submit().__await__()
+
+
+_WRAPPERS: List[Tuple[type, type]] = [
+    (Workspace, AsyncWorkspace),
+    (Experiment, AsyncExperiment),
+    (Case, AsyncCase),
+    (ModelExecutable, AsyncModelExecutable),
+    (Model, AsyncModel),
+    (Result, AsyncResult),
+]
+
+
+def wrap(entity: Any, transport: AsyncTransport) -> Any:
+    """Returns the async counterpart of a synchronous entity, or the entity itself if
+    there is no async counterpart."""
+    for entity_type, async_type in _WRAPPERS:
+        if isinstance(entity, entity_type):
+            return async_type(entity, transport)
+    return entity
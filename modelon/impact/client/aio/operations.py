@@ -0,0 +1,143 @@
+"""Async operation classes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar, Union
+
+from modelon.impact.client import exceptions
+from modelon.impact.client.aio.transport import AsyncTransport
+from modelon.impact.client.operations.base import (
+    AsyncOperationStatus,
+    BaseOperation,
+    Status,
+)
+from modelon.impact.client.operations.polling import (
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+from modelon.impact.client.sal import retry_after
+
+logger = logging.getLogger(__name__)
+AsyncEntity = TypeVar("AsyncEntity")
+
+
+class AwaitableOperation(Generic[AsyncEntity]):
+    """Async counterpart of the operation classes, for example
+    :obj:`~modelon.impact.client.operations.experiment.ExperimentOperation`.
+
+    Waiting sleeps on the event loop between status polls, while each status request
+    runs on the thread pool of the transport.
+
+    """
+
+    def __init__(
+        self,
+        operation: BaseOperation,
+        transport: AsyncTransport,
+        wrap: Callable[[Any], AsyncEntity],
+    ):
+        self._operation = operation
+        self._transport = transport
+        self._wrap = wrap
+
+    def __repr__(self) -> str:
+        return f"Awaitable {self._operation!r}"
+
+    @property
+    def sync(self) -> BaseOperation:
+        """The synchronous operation."""
+        return self._operation
+
+    @property
+    def id(self) -> str:
+        """ID of the operation."""
+        return getattr(self._operation, "id")
+
+    @property
+    def name(self) -> str:
+        """Name of the operation."""
+        return self._operation.name
+
+    async def status(self) -> Any:
+        """Returns the operation status as an enumeration."""
+        return await self._transport.run(lambda: self._operation.status)
+
+    async def cancel(self) -> None:
+        """Terminates the operation."""
+        await self._transport.run(self._operation.cancel)
+
+    async def data(self) -> AsyncEntity:
+        """Returns the async entity the operation results in."""
+        return self._wrap(await self._transport.run(self._operation.data))
+
+    async def wait(
+        self,
+        timeout: Optional[float] = None,
+        status: Union[Status, Tuple[Status, ...]] = (Status.DONE, Status.CANCELLED),
+        polling: Optional[PollingStrategy] = None,
+    ) -> AsyncEntity:
+        """Waits until the operation achieves the set status. Returns the async entity
+        the operation results in.
+
+        Args:
+            timeout: Time to wait in seconds for achieving the status. By default
+                the timeout is set to 'None', which signifies an infinite time
+                to wait until the status is achieved.
+            status: Operation status to be achieved. Only used for execution
+                operations, other operations wait until they are done.
+                Default: (Status.DONE, Status.CANCELLED)
+            polling: The strategy deciding how often the status is requested.
+                Default is None and then the polling strategy of the client is
+                used, see
+                :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+
+        Returns:
+            Async entity class instance if the set status is achieved.
+
+        Raises:
+            OperationTimeOutError if time exceeds set timeout.
+
+        Example::
+
+            experiment = await workspace.execute(experiment_definition).wait()
+
+            experiments = await asyncio.gather(
+                *[workspace.execute(definition).wait() for definition in definitions]
+            )
+
+        """
+        start_t = time.time()
+        status_tuple = status if isinstance(status, tuple) else (status,)
+        schedule = None
+        while True:
+            current, server_hint = await self._status_snapshot()
+            logger.info(f"{self.name} in progress! Status : {current.name}")
+            if self._is_done(current, status_tuple):
+                logger.info(f"{self.name} completed! Status : {current.name}")
+                return await self.data()
+
+            elapsed = time.time() - start_t
+            if timeout and elapsed >= timeout:
+                raise exceptions.OperationTimeOutError(
+                    timeout=timeout, current_status_name=current.name
+                )
+
+            if schedule is None:
+                service = self._operation._sal
+                schedule = resolve_polling_strategy(polling, service).schedule()
+            remaining = timeout - elapsed if timeout else None
+            await asyncio.sleep(schedule.next_interval(server_hint, remaining))
+
+    async def _status_snapshot(self) -> Tuple[Any, Optional[float]]:
+        def snapshot() -> Tuple[Any, Optional[float]]:
+            return self._operation.status, retry_after.pop_hint()
+
+        return await self._transport.run(snapshot)
+
+    @staticmethod
+    def _is_done(current: Any, status_tuple: Tuple[Status, ...]) -> bool:
+        if isinstance(current, AsyncOperationStatus):
+            return current.done()
+        return current in status_tuple
@@ -0,0 +1,68 @@
+"""Async service classes."""
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Dict
+
+from modelon.impact.client.aio.transport import AsyncTransport
+
+if TYPE_CHECKING:
+    from modelon.impact.client.sal.service import Service
+
+
+class AsyncServiceProxy:
+    """Exposes every method of a synchronous service, for example
+    :obj:`~modelon.impact.client.sal.workspace.WorkspaceService`, as a coroutine
+    function taking the same arguments."""
+
+    def __init__(self, service: Any, transport: AsyncTransport):
+        self._service = service
+        self._transport = transport
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._transport.run(attr, *args, **kwargs)
+
+        return call
+
+
+class AsyncService:
+    """Async counterpart of :obj:`~modelon.impact.client.sal.service.Service`.
+
+    Example::
+
+        data = await async_service.workspace.workspace_get(
+            'my_workspace', size_info=False
+        )
+        executions = await async_service.get_executions()
+
+    """
+
+    def __init__(self, service: Service, transport: AsyncTransport):
+        self._service = service
+        self._transport = transport
+        self.workspace = AsyncServiceProxy(service.workspace, transport)
+        self.project = AsyncServiceProxy(service.project, transport)
+        self.model_executable = AsyncServiceProxy(service.model_executable, transport)
+        self.experiment = AsyncServiceProxy(service.experiment, transport)
+        self.custom_function = AsyncServiceProxy(service.custom_function, transport)
+        self.external_result = AsyncServiceProxy(service.external_result, transport)
+        self.users = AsyncServiceProxy(service.users, transport)
+        self.exports = AsyncServiceProxy(service.exports, transport)
+        self.imports = AsyncServiceProxy(service.imports, transport)
+
+    @property
+    def sync(self) -> Service:
+        """The synchronous service."""
+        return self._service
+
+    async def api_get_metadata(self) -> Dict[str, Any]:
+        return await self._transport.run(self._service.api_get_metadata)
+
+    async def get_executions(self) -> Dict[str, Any]:
+        return await self._transport.run(self._service.get_executions)
@@ -0,0 +1,51 @@
+"""Async transport class."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncTransport:
+    """Runs blocking calls to the Modelon Impact server from asyncio code.
+
+    This is not an asynchronous HTTP transport. Each call runs the regular blocking
+    requests of the synchronous client in a bounded thread pool, and occupies one
+    thread for as long as its request is in flight. It lets asyncio applications call
+    the server without blocking the event loop, but it does not reduce the number of
+    threads needed per concurrent request. At most max_workers requests are in flight
+    at the same time and further calls wait for a free thread.
+
+    Size the pool to the connection pool of the context, so that each thread gets a
+    kept-alive connection.
+
+    Args:
+        max_workers: The maximum number of blocking calls running at the same
+            time. Default: None, meaning the default size of a
+            'ThreadPoolExecutor'.
+
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="impact-client"
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs fn with the given arguments in the thread pool and returns its result.
+
+        Context variables, such as the current tracing span, are propagated to the call.
+
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def close(self) -> None:
+        """Shuts down the thread pool once all running calls are done."""
+        self._executor.shutdown(wait=False)
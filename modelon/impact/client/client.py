@@ -24,15 +24,28 @@ from modelon.impact.client.entities.project import (
     VcsUri,
 )
 from modelon.impact.client.entities.workspace import Workspace, WorkspaceDefinition
+from modelon.impact.client.operations.base import BaseOperation
 from modelon.impact.client.operations.experiment import ExperimentOperation
+from modelon.impact.client.operations.journal import (
+    JournalEntry,
+    OperationJournal,
+    OperationKind,
+)
 from modelon.impact.client.operations.model_executable import ModelExecutableOperation
+from modelon.impact.client.operations.polling import PollingStrategy
 from modelon.impact.client.operations.project_import import ProjectImportOperation
 from modelon.impact.client.operations.workspace.conversion import (
     WorkspaceConversionOperation,
 )
+from modelon.impact.client.operations.workspace.exports import (
+    Export,
+    WorkspaceExportOperation,
+)
 from modelon.impact.client.operations.workspace.imports import WorkspaceImportOperation
 from modelon.impact.client.published_workspace_client import PublishedWorkspacesClient
 from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.metrics import MetricsRegistry
+from modelon.impact.client.sal.multipart import ProgressCallback
 from modelon.impact.client.sal.service import Service, is_jupyterhub_url
 from modelon.impact.client.sal.uri import URI
 
@@ -206,8 +219,30 @@ class Client:
             Help class for managing credentials for the Impact server. Default is None
             and then the default credential manager is used.
         context:
-            Request contexts to pass data alongside a HTTP request. Default is None and
-            then the default context is used.
+            Request contexts to pass data alongside a HTTP request. The context
+            holds the HTTP session and connection pool shared by all requests done
+            by the client, see :obj:`~modelon.impact.client.sal.context.Context`
+            for the available connection pool and keep-alive settings. Default is
+            None and then the default context is used.
+        polling:
+            The strategy deciding how often the status of operations is requested
+            when waiting for them, see
+            :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+            Can be overridden per call to 'wait'. Default is None and then an
+            exponential backoff from 0.5 up to 10 seconds is used.
+        push_completion:
+            If True, experiments, cases and compilations being waited for learn
+            that they are done from notifications pushed by the server on the
+            workspace WebSocket, instead of polling their status. The status is
+            then only requested when a notification about the operation is
+            received, or every 30 seconds in case one is missed. Polling is used
+            whenever the WebSocket connection is unavailable. Default is False.
+        journal:
+            Journal recording the experiment executions, compilations and
+            workspace exports started through the client, so that they can be
+            waited for after a restart of the process, see
+            :obj:`~modelon.impact.client.Client.resume_operations`. Default is
+            None and then no operations are recorded.
 
     Example::
 
@@ -216,6 +251,16 @@ class Client:
         client = Client(url=impact_url)
         client = Client(url=impact_url, interactive=True)
 
+        # Tuned connection pool for many threads using the same client
+        from modelon.impact.client.sal.context import Context
+
+        client = Client(url=impact_url, context=Context(pool_maxsize=32))
+
+        # Less frequent status requests when waiting for long running operations
+        from modelon.impact.client.operations.polling import PollingStrategy
+
+        client = Client(url=impact_url, polling=PollingStrategy(max_interval=60))
+
     """
 
     _SUPPORTED_VERSION_RANGE = ">=4.29.0,<5.0.0"
@@ -226,6 +271,9 @@ class Client:
         interactive: Optional[bool] = None,
         credential_manager: Optional[CredentialManager] = None,
         context: Optional[Context] = None,
+        polling: Optional[PollingStrategy] = None,
+        push_completion: bool = False,
+        journal: Optional[OperationJournal] = None,
     ):
         if url is None:
             url = get_client_url()
@@ -233,6 +281,10 @@ class Client:
         if interactive is None:
             interactive = get_client_interactive()
 
+        if context is None:
+            context = Context()
+        self._context = context
+
         self._uri = URI(url)
         if credential_manager is None:
             uri = (
@@ -259,10 +311,34 @@ class Client:
                 )
             else:
                 raise
+        self._sal.polling = polling
+        self._sal.journal = journal
+        if push_completion:
+            self._sal.enable_workspace_events()
 
         # TODO Update to use the unprotected API route https://impact.modelon.cloud/api
         self._validate_compatible_api_version()
 
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """The registry recording per endpoint metrics for the requests sent by the
+        client, or None if metrics are not enabled.
+
+        Metrics are enabled by giving a context with a
+        :obj:`~modelon.impact.client.sal.metrics.MetricsRegistry`.
+
+        Example::
+
+            from modelon.impact.client.sal.context import Context
+            from modelon.impact.client.sal.metrics import MetricsRegistry
+
+            client = Client(url=impact_url, context=Context(metrics=MetricsRegistry()))
+            workspace = client.get_workspace('my_workspace')
+            client.metrics.snapshot()
+
+        """
+        return self._context.metrics
+
     def _validate_compatible_api_version(self) -> None:
         try:
             version = self._sal.api_get_metadata()["version"]
@@ -504,7 +580,9 @@ class Client:
         return self.import_workspace_from_zip(path_to_workspace).wait()
 
     def import_workspace_from_zip(
-        self, path_to_workspace: str
+        self,
+        path_to_workspace: str,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> WorkspaceImportOperation:
         """Imports a Workspace from a compressed(.zip) workspace file. Similar to
         :obj:`~modelon.impact.client.Client.upload_workspace`, but gives more control
@@ -514,6 +592,9 @@ class Client:
         Args:
             path_to_workspace: The path for the compressed
             workspace(.zip) to be uploaded.
+            progress_callback: Optional callable called with the number of bytes
+                uploaded so far and the total number of bytes to upload.
+                Default: None.
 
         Returns:
             A WorkspaceImportOperation class object.
@@ -523,7 +604,9 @@ class Client:
             client.import_workspace_from_zip(path_to_workspace).wait()
 
         """
-        resp = self._sal.workspace.import_from_zip(path_to_workspace)
+        resp = self._sal.workspace.import_from_zip(
+            path_to_workspace, progress_callback=progress_callback
+        )
         return WorkspaceImportOperation[Workspace](
             resp["data"]["location"], self._sal, Workspace.from_import_operation
         )
@@ -634,13 +717,20 @@ class Client:
             )
         return ProjectMatchings(project_matchings)
 
-    def import_project_from_zip(self, path_to_project: str) -> ProjectImportOperation:
+    def import_project_from_zip(
+        self,
+        path_to_project: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> ProjectImportOperation:
         """Imports a Project from a compressed(.zip) project file. Returns the project
         class object.
 
         Args:
             path_to_project: The path for the compressed project(.zip)
             to be uploaded.
+            progress_callback: Optional callable called with the number of bytes
+                uploaded so far and the total number of bytes to upload.
+                Default: None.
 
         Returns:
             A ProjectImportOperation class object.
@@ -650,7 +740,9 @@ class Client:
             client.import_project_from_zip(path_to_project).wait()
 
         """
-        resp = self._sal.project.import_from_zip(path_to_project)
+        resp = self._sal.project.import_from_zip(
+            path_to_project, progress_callback=progress_callback
+        )
         return ProjectImportOperation[Project](
             resp["data"]["location"], self._sal, Project.from_operation
         )
@@ -705,6 +797,51 @@ class Client:
                 continue
             yield self._operation_from_execution(execution)
 
+    def _operation_from_journal_entry(self, entry: JournalEntry) -> BaseOperation:
+        if entry.kind == OperationKind.WORKSPACE_EXPORT:
+            assert entry.location is not None
+            return WorkspaceExportOperation[Export](
+                entry.location, self._sal, Export.from_operation
+            )
+        assert entry.workspace_id is not None
+        if entry.kind == OperationKind.EXPERIMENT:
+            return self._experiment_operation_from_execution(
+                Execution(ExecutionKind.EXPERIMENT, entry.workspace_id, entry.id)
+            )
+        return self._model_executable_operation_from_execution(
+            Execution(ExecutionKind.COMPILATION, entry.workspace_id, entry.id)
+        )
+
+    def resume_operations(self) -> List[BaseOperation]:
+        """Returns the operations recorded in the journal of the client that have not
+        been waited for until done, for example because the process waiting for them was
+        stopped. The operations are rebuilt without requesting anything from the server,
+        waiting for them removes them from the journal.
+
+        Returns:
+            A list of ExperimentOperation, ModelExecutableOperation and
+            WorkspaceExportOperation class objects, in the order they were
+            started.
+
+        Raises:
+            ValueError if the client has no journal.
+
+        Example::
+
+            from modelon.impact.client import Client, wait_all
+            from modelon.impact.client.operations.journal import OperationJournal
+
+            client = Client(url=impact_url, journal=OperationJournal('ops.jsonl'))
+            entities = wait_all(client.resume_operations())
+
+        """
+        journal = self._sal.journal
+        if journal is None:
+            raise ValueError("The client was created without an operation journal")
+        return [
+            self._operation_from_journal_entry(entry) for entry in journal.entries()
+        ]
+
     def get_published_workspaces_client(self) -> PublishedWorkspacesClient:
         """Return the PublishedWorkspacesClient class object.
 
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Text, Tuple, Union
 
 from modelon.impact.client import exceptions
-from modelon.impact.client.entities.asserts import assert_successful_operation
+from modelon.impact.client.entities.asserts import (
+    assert_successful_operation,
+    assert_variable_in_result,
+)
 from modelon.impact.client.entities.custom_artifact import CustomArtifact
 from modelon.impact.client.entities.custom_function import (
     CustomFunction,
@@ -14,14 +19,25 @@ from modelon.impact.client.entities.custom_function import (
 from modelon.impact.client.entities.external_result import ExternalResult
 from modelon.impact.client.entities.interfaces.case import CaseReference
 from modelon.impact.client.entities.log import Log
+from modelon.impact.client.entities.mat_result import MatResult
 from modelon.impact.client.entities.model import (
     Model,
     SimpleModelicaExperimentDefinition,
     to_domain_parameter_value,
 )
 from modelon.impact.client.entities.model_executable import ModelExecutable
-from modelon.impact.client.entities.result import Result
+from modelon.impact.client.entities.result import (
+    DEFAULT_BATCH_SIZE,
+    Result,
+    _fetch_case_trajectories,
+    _result_version,
+    _trajectory_cache,
+)
 from modelon.impact.client.entities.status import CaseStatus
+from modelon.impact.client.entities.trajectory_arrays import (
+    TrajectoryArrays,
+    _import_numpy,
+)
 from modelon.impact.client.experiment_definition.modifiers import Enumeration
 from modelon.impact.client.operations.base import BaseOperation
 from modelon.impact.client.operations.case import CaseOperation
@@ -30,8 +46,10 @@ from modelon.impact.client.operations.custom_artifact import (
     CustomArtifactImportOperation,
 )
 from modelon.impact.client.sal.experiment import ResultFormat
+from modelon.impact.client.tracing import traced
 
 if TYPE_CHECKING:
+    from modelon.impact.client.sal.multipart import ProgressCallback
     from modelon.impact.client.sal.service import Service
 
 logger = logging.getLogger(__name__)
@@ -522,6 +540,7 @@ class Case(CaseReference):
         """
         return self.run_info.status == CaseStatus.SUCCESSFUL
 
+    @traced
     def get_log(self) -> Log:
         """Returns the log class object for a finished case.
 
@@ -540,8 +559,12 @@ class Case(CaseReference):
             )
         )
 
+    @traced
     def get_result(self, format: str = "mat") -> Tuple[Union[bytes, Text], str]:
-        """Returns the result stream and the file name for a finished case.
+        """Returns the result stream and the file name for a finished case. The whole
+        result is read into memory, use
+        :obj:`~modelon.impact.client.entities.case.Case.download_result` to stream large
+        results directly to disk.
 
         Args:
             format: The file format to download the result in. The only possible values
@@ -573,9 +596,100 @@ class Case(CaseReference):
         )
         return result, file_name
 
-    def get_trajectories(self) -> Result:
+    @traced
+    def download_result(self, path: Optional[str] = None, format: str = "mat") -> str:
+        """Downloads the result for a finished case. Returns the local path to the
+        downloaded result file. Unlike
+        :obj:`~modelon.impact.client.entities.case.Case.get_result` the result is
+        streamed to disk in chunks and is never held in memory as a whole, which makes
+        it suitable for large results.
+
+        If the server supports range requests, the result is downloaded in parts
+        concurrently. An interrupted download is resumed when downloading the
+        result to the same directory again.
+
+        Args:
+            path: The local path to the directory to store the downloaded result.
+                Default: None. If no path is given, the result will be downloaded
+                in a temporary directory.
+            format: The file format to download the result in. The only possible values
+                are 'mat' and 'csv'. Default: 'mat'
+
+        Returns:
+            Local path to the downloaded result file.
+
+        Raises:
+
+            OperationNotCompleteError if simulation process is in progress.
+            OperationFailureError if simulation process has failed or was cancelled.
+            ValueError if the format is not supported.
+
+        Example::
+
+            result_path = case.download_result()
+            result_path = case.download_result('/home/Downloads', format='csv')
+
+        """
+        assert_successful_operation(self.is_successful(), self._case_id)
+        result_format = ResultFormat(format)
+        if path is None:
+            path = os.path.join(tempfile.gettempdir(), "impact-downloads")
+        os.makedirs(path, exist_ok=True)
+        download_path = os.path.join(
+            path, f".{self._exp_id}_{self._case_id}.{result_format.value}"
+        )
+        file_name = self._sal.experiment.case_result_download_to(
+            self._workspace_id,
+            self._exp_id,
+            self._case_id,
+            download_path,
+            result_format,
+        )
+        result_path = os.path.join(
+            path, file_name or f"{self._case_id}.{result_format.value}"
+        )
+        os.replace(download_path, result_path)
+        return result_path
+
+    @traced
+    def download_mat_result(self, path: Optional[str] = None) -> MatResult:
+        """Downloads the MAT result file for a finished case and opens it for reading
+        trajectories locally, without further requests to the server. Requires the
+        'numpy' package to be installed.
+
+        Args:
+            path: The local path to the directory to store the downloaded file.
+                Default is None, meaning the file is downloaded to a temporary
+                directory, see
+                :obj:`~modelon.impact.client.entities.case.Case.download_result`.
+
+        Returns:
+            A MatResult object (mapping) with the trajectories of the variables in
+            the result file, as NumPy arrays.
+
+        Raises:
+            OperationNotCompleteError if simulation process is in progress.
+            OperationFailureError if simulation process has failed or was cancelled.
+            ImportError if 'numpy' is not installed.
+
+        Example::
+
+            with case.download_mat_result() as result:
+                height = result['h']
+                time = result['time']
+
+        """
+        _import_numpy()
+        return MatResult(self.download_result(path, format="mat"))
+
+    @traced
+    def get_trajectories(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Result:
         """Returns result(Mapping) object containing the result trajectories.
 
+        Args:
+            batch_size: The number of variables fetched per request when iterating
+                the result. Default: 100
+
         Returns:
             A Result object (mapping) that allows requesting trajectory data given
             a variable name.
@@ -601,8 +715,58 @@ class Case(CaseReference):
             self._workspace_id,
             self._exp_id,
             self._sal,
+            version=_result_version(self._get_info()["run_info"]),
+            batch_size=batch_size,
+        )
+
+    @traced
+    def get_trajectory_arrays(self, variables: List[str]) -> TrajectoryArrays:
+        """Returns the result trajectories for a list of result variables as float64
+        NumPy arrays, one array per variable. Requires the 'numpy' package to be
+        installed.
+
+        Args:
+            variables: A list of result variables to fetch trajectories for.
+
+        Returns:
+            A TrajectoryArrays object (mapping) with an array of shape (1, points)
+            per variable, with the case as the only row.
+
+        Raises:
+            OperationNotCompleteError if simulation process is in progress.
+            OperationFailureError if simulation process was cancelled.
+            TypeError if the variable is not a list object.
+            ValueError if trajectory variable is not present in the result.
+            ImportError if 'numpy' is not installed.
+
+        Example::
+
+            arrays = case.get_trajectory_arrays(['h', 'time'])
+            height = arrays.case(case.id, 'h')
+
+        """
+        _import_numpy()
+        _assert_case_is_complete(self.run_info.status, "Simulation")
+        if not isinstance(variables, list):
+            raise TypeError(
+                "Please specify the list of result keys for the trajectories of "
+                "interest!"
+            )
+        version = _result_version(self._get_info()["run_info"])
+        assert_variable_in_result(variables, self.get_variables())
+        response = _fetch_case_trajectories(
+            self._sal,
+            self._workspace_id,
+            self._exp_id,
+            self._case_id,
+            variables,
+            version,
+        )
+        return TrajectoryArrays.from_trajectories(
+            [self._case_id], variables, [[trajectory] for trajectory in response]
         )
 
+    @traced
     def get_variables(self) -> List[str]:
         """Returns a list of variables available in the result.
 
@@ -623,6 +787,7 @@ class Case(CaseReference):
             self._workspace_id, self._exp_id, self._case_id
         )
 
+    @traced
     def get_artifact(
         self, artifact_id: str, download_as: Optional[str] = None
     ) -> CustomArtifact:
@@ -666,6 +831,7 @@ class Case(CaseReference):
             )
         return meta["downloadAs"]
 
+    @traced
     def get_artifacts(self) -> List[CustomArtifact]:
         """Returns a list of CustomArtifact classes for a finished case.
 
@@ -721,6 +887,7 @@ class Case(CaseReference):
                     fmu_id = case.input.fmu_id
         return ModelExecutable(self._workspace_id, fmu_id, self._sal)
 
+    @traced
     def sync(self) -> None:
         """Sync case state against server, pushing any changes that has been done to the
         object client side.
@@ -734,6 +901,7 @@ class Case(CaseReference):
             self._workspace_id, self._exp_id, self._case_id, self._info
         )
 
+    @traced
     def execute(self, sync_case_changes: bool = True) -> CaseOperation:
         """Executes a case. Returns an CaseOperation class object.
 
@@ -844,6 +1012,7 @@ class Case(CaseReference):
             info=reference._info,
         )
 
+    @traced
     def import_custom_artifact(
         self,
         path_to_artifact: str,
@@ -882,10 +1051,12 @@ class Case(CaseReference):
             CustomArtifact.from_operation,
         )
 
+    @traced
     def import_result(
         self,
         path_to_result: str,
         overwrite: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> CaseResultImportOperation:
         """Upload result to a case.
 
@@ -895,6 +1066,9 @@ class Case(CaseReference):
                 result file format is supported for import.
             overwrite: Overwrite, if a result already exists
                 for the case. Default: False.
+            progress_callback: Optional callable called with the number of bytes
+                uploaded so far and the total number of bytes to upload.
+                Default: None.
 
 
         Example::
@@ -908,7 +1082,16 @@ class Case(CaseReference):
             self._exp_id,
             self._case_id,
             overwrite,
+            progress_callback=progress_callback,
         )
+        cache = _trajectory_cache(self._sal)
+        if cache is not None:
+            cache.invalidate_case(
+                self._sal.experiment.base_url,
+                self._workspace_id,
+                self._exp_id,
+                self._case_id,
+            )
         return CaseResultImportOperation[Result](
             resp["data"]["location"],
             self._workspace_id,
@@ -49,7 +49,8 @@ class CustomArtifact(CustomArtifactInterface):
 
     def download(self, path: Optional[str] = None) -> str:
         """Downloads a custom artifact. Returns the local path to the downloaded
-        artifact.
+        artifact. The artifact is streamed to disk in chunks and is never held in memory
+        as a whole.
 
         Args:
             path: The local path to the directory to store the downloaded custom
@@ -65,15 +66,13 @@ class CustomArtifact(CustomArtifactInterface):
             artifact_path = artifact.download('/home/Downloads')
 
         """
-        artifact, _ = self._exp_sal.case_artifact_get(
-            self._workspace_id, self._exp_id, self._case_id, self.id
-        )
         if path is None:
             path = os.path.join(tempfile.gettempdir(), "impact-downloads")
         os.makedirs(path, exist_ok=True)
         artifact_path = os.path.join(path, self.download_as)
-        with open(artifact_path, mode="wb") as f:
-            f.write(artifact)
+        self._exp_sal.case_artifact_download_to(
+            self._workspace_id, self._exp_id, self._case_id, self.id, artifact_path
+        )
         return artifact_path
 
     def get_data(self) -> Union[Text, bytes]:
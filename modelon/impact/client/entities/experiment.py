@@ -24,7 +24,12 @@ from modelon.impact.client.entities.model_executable import (
     ModelExecutable,
     SimpleFMUExperimentDefinition,
 )
+from modelon.impact.client.entities.result import _result_version, _trajectory_cache
 from modelon.impact.client.entities.status import ExperimentStatus
+from modelon.impact.client.entities.trajectory_arrays import (
+    TrajectoryArrays,
+    _import_numpy,
+)
 from modelon.impact.client.experiment_definition.extension import (
     SimpleExperimentExtension,
 )
@@ -39,6 +44,7 @@ from modelon.impact.client.options import (
     SimulationOptions,
     SolverOptions,
 )
+from modelon.impact.client.tracing import traced
 
 if TYPE_CHECKING:
     from modelon.impact.client.operations.base import BaseOperation
@@ -282,6 +288,7 @@ class Experiment(ExperimentReference):
         logger.warning("This attribute is deprectated, use 'run_info' instead")
         return self._get_info(cached=False)
 
+    @traced
     def execute(
         self, with_cases: Optional[List[Case]] = None, sync_case_changes: bool = True
     ) -> experiment.ExperimentOperation:
@@ -314,7 +321,7 @@ class Experiment(ExperimentReference):
                 case.sync()
 
         case_ids = [case.id for case in with_cases] if with_cases is not None else None
-        return experiment.ExperimentOperation[Experiment](
+        operation = experiment.ExperimentOperation[Experiment](
             self._workspace_id,
             self._sal.experiment.experiment_execute(
                 self._workspace_id, self._exp_id, case_ids
@@ -322,6 +329,8 @@ class Experiment(ExperimentReference):
             self._sal,
             Experiment.from_operation,
         )
+        operation._record_in_journal()
+        return operation
 
     def is_successful(self) -> bool:
         """Returns True if the Experiment is done and no cases has failed. Use the
@@ -342,6 +351,7 @@ class Experiment(ExperimentReference):
             and self.run_info.cancelled == 0
         )
 
+    @traced
     def get_variables(self) -> List[str]:
         """Returns a list of variables available in the result.
 
@@ -361,6 +371,7 @@ class Experiment(ExperimentReference):
             self._workspace_id, self._exp_id
         )
 
+    @traced
     def get_cases(self) -> List[Case]:
         """Returns a list of case objects for an experiment.
 
@@ -378,6 +389,7 @@ class Experiment(ExperimentReference):
             for case in resp["data"]["items"]
         ]
 
+    @traced
     def get_case(self, case_id: str) -> Case:
         """Returns a case object for a given case_id.
 
@@ -399,6 +411,7 @@ class Experiment(ExperimentReference):
             case_data["id"], self._workspace_id, self._exp_id, self._sal, case_data
         )
 
+    @traced
     def get_cases_with_label(self, case_label: str) -> List[Case]:
         """Returns a list of case objects for an experiment with the label.
 
@@ -420,18 +433,82 @@ class Experiment(ExperimentReference):
         variables: List[str],
         only_last_point: bool = False,
         format: _TrajectoryResponseFormat = _TrajectoryResponseFormat.V1,
+        validate: bool = True,
     ) -> Any:
-        if not isinstance(variables, list):
-            raise TypeError(
-                "Please specify the list of result keys for the trajectories of "
-                "interest!"
+        if validate:
+            if not isinstance(variables, list):
+                raise TypeError(
+                    "Please specify the list of result keys for the trajectories of "
+                    "interest!"
+                )
+            assert_variable_in_result(variables, self.get_variables())
+
+        def fetch(missing: List[str]) -> Any:
+            return self._sal.experiment.trajectories_get(
+                self._workspace_id, self._exp_id, missing, only_last_point, format.value
+            )
+
+        cache = _trajectory_cache(self._sal)
+        # Full trajectories are cached in the V1 format and last points in the V2
+        # format, as they are fetched by 'get_trajectories' and 'get_last_point'
+        if cache is None or only_last_point != (format == _TrajectoryResponseFormat.V2):
+            return fetch(variables)
+
+        versions = self._case_versions()
+        if not only_last_point:
+            return cache.get_or_fetch(
+                self._sal.experiment.base_url,
+                self._workspace_id,
+                self._exp_id,
+                versions,
+                variables,
+                False,
+                fetch,
             )
-        assert_variable_in_result(variables, self.get_variables())
 
-        return self._sal.experiment.trajectories_get(
-            self._workspace_id, self._exp_id, variables, only_last_point, format.value
+        def fetch_last_points(missing: List[str]) -> List[List[Any]]:
+            items = {
+                case["caseId"]: case["items"]
+                for case in fetch(missing)["data"]["items"]
+            }
+            return [
+                [
+                    items[case_id][i] if case_id in items else None
+                    for case_id in versions
+                ]
+                for i in range(len(missing))
+            ]
+
+        last_points = cache.get_or_fetch(
+            self._sal.experiment.base_url,
+            self._workspace_id,
+            self._exp_id,
+            versions,
+            variables,
+            True,
+            fetch_last_points,
         )
+        return {
+            "data": {
+                "items": [
+                    {"caseId": case_id, "items": [points[j] for points in last_points]}
+                    for j, case_id in enumerate(versions)
+                ]
+            }
+        }
+
+    def _case_versions(self) -> Dict[str, Optional[str]]:
+        """Returns the version of the result of each case for the trajectory cache, in
+        the order of the cases in the trajectories returned by the server."""
+        items = self._sal.experiment.cases_get(self._workspace_id, self._exp_id)[
+            "data"
+        ]["items"]
+        versions = {case["id"]: _result_version(case["run_info"]) for case in items}
+        return {
+            f"case_{j + 1}": versions.get(f"case_{j + 1}") for j in range(len(items))
+        }
 
+    @traced
     def get_trajectories(self, variables: List[str]) -> Dict[str, Any]:
         """Returns a dictionary containing the result trajectories for a list of result
         variables for all the cases.
@@ -469,6 +546,53 @@ class Experiment(ExperimentReference):
             for j in case_nbrs
         }
 
+    @traced
+    def get_trajectory_arrays(self, variables: List[str]) -> TrajectoryArrays:
+        """Returns the result trajectories for a list of result variables for all the
+        cases as float64 NumPy arrays, one array per variable.
+
+        Uses far less memory than
+        :obj:`~modelon.impact.client.entities.experiment.Experiment.get_trajectories`
+        for experiments with many cases, as the values are stored in contiguous
+        arrays instead of lists of Python floats. Requires the 'numpy' package to be
+        installed.
+
+        Args:
+            variables: A list of result variables to fetch trajectories for.
+
+        Returns:
+            A TrajectoryArrays object (mapping) with an array per variable, shaped
+            (cases, points), or ragged with offsets if the cases have different
+            numbers of points.
+
+        Raises:
+            TypeError if the variable is not a list object.
+            ValueError if trajectory variable is not present in the result.
+            ImportError if 'numpy' is not installed.
+
+        Example::
+
+            arrays = experiment.get_trajectory_arrays(['h', 'time'])
+            height = arrays['h']
+            mean_final_height = arrays['h'][:, -1].mean()
+            time_case_1 = arrays.case('case_1', 'time')
+
+        """
+        _import_numpy()
+        response = self._validate_and_fetch_trajectories(
+            variables, only_last_point=False, format=_TrajectoryResponseFormat.V1
+        )
+
+        if response:
+            case_nbrs = range(len(response[0]))
+        else:
+            case_nbrs = range(len(self.get_cases()))
+
+        return TrajectoryArrays.from_trajectories(
+            [f"case_{j + 1}" for j in case_nbrs], variables, response
+        )
+
+    @traced
     def get_last_point(
         self, variables: Optional[List[str]] = None
     ) -> ExperimentResultPoint:
@@ -498,12 +622,8 @@ class Experiment(ExperimentReference):
         format = _TrajectoryResponseFormat.V2
         if variables is None:
             variables = self.get_variables()
-            trajectories = self._sal.experiment.trajectories_get(
-                self._workspace_id,
-                self._exp_id,
-                variables,
-                last_point_only=True,
-                format=format.value,
+            trajectories = self._validate_and_fetch_trajectories(
+                variables, only_last_point=True, format=format, validate=False
             )
         else:
             trajectories = self._validate_and_fetch_trajectories(
@@ -511,6 +631,7 @@ class Experiment(ExperimentReference):
             )
         return ExperimentResultPoint(trajectories["data"]["items"], variables)
 
+    @traced
     def delete(self) -> None:
         """Deletes an experiment.
 
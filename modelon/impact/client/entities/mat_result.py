@@ -0,0 +1,232 @@
+"""Reading result files in the Dymola MAT v4 format."""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from modelon.impact.client.entities.trajectory_arrays import _import_numpy
+
+_HEADER = struct.Struct("<5i")
+_HEADER_BE = struct.Struct(">5i")
+_TRANSPOSED = "binTrans"
+# Precision digit of the matrix type to element type, see the MAT v4 format
+_PRECISIONS = {0: "f8", 1: "f4", 2: "i4", 3: "i2", 4: "u2", 5: "u1"}
+
+
+class _Matrix(NamedTuple):
+    offset: int
+    rows: int
+    columns: int
+    dtype: Any
+
+
+class MissingVariableError(KeyError, ValueError):
+    """Raised when a variable is not present in a result file.
+
+    A KeyError, so that the methods of the mapping such as 'get' treat the variable as
+    missing, and a ValueError, like the error raised by
+    :obj:`~modelon.impact.client.entities.result.Result` for missing variables.
+
+    """
+
+    def __str__(self) -> str:
+        # KeyError quotes its message, show it as given like a ValueError
+        return str(self.args[0]) if self.args else ""
+
+
+def _read_matrices(buffer: Any) -> Dict[str, _Matrix]:
+    """Returns the matrices in a MAT v4 file by name, only reading their headers."""
+    np = _import_numpy()
+    matrices = {}
+    offset = 0
+    size = len(buffer)
+    while offset + _HEADER.size <= size:
+        # The header is in the byte order of the matrix, given by its first digit
+        header = _HEADER if 0 <= _HEADER.unpack_from(buffer, offset)[0] < 1000 else None
+        mopt, rows, columns, imaginary, name_length = (
+            header or _HEADER_BE
+        ).unpack_from(buffer, offset)
+        if not 0 <= mopt < 2000 or rows < 0 or columns < 0 or name_length <= 0:
+            raise ValueError("The file is not a MAT v4 file")
+        byte_order = "<" if header else ">"
+        precision, kind = (mopt // 10) % 10, mopt % 10
+        if precision not in _PRECISIONS or kind not in (0, 1):
+            raise ValueError(f"Unsupported MAT v4 matrix type {mopt}")
+        offset += _HEADER.size
+        name = bytes(buffer[offset : offset + name_length]).rstrip(b"\x00").decode()
+        offset += name_length
+        dtype = np.dtype(byte_order + _PRECISIONS[precision])
+        matrices[name] = _Matrix(offset, rows, columns, dtype)
+        offset += rows * columns * dtype.itemsize * (2 if imaginary else 1)
+        if offset > size:
+            raise ValueError(f"The MAT v4 file is truncated in matrix '{name}'")
+    return matrices
+
+
+class MatResult(Mapping):
+    """Result trajectories read from a local result file in the Dymola MAT v4 format,
+    such as the files downloaded with
+    :obj:`~modelon.impact.client.entities.case.Case.download_result`.
+
+    The file is memory-mapped and only the table of variable names is read when it is
+    opened. Variables are returned as read-only NumPy views of the mapped file, so no
+    values are copied or read from disk until they are used, except for variables
+    stored negated in the file, which are returned as negated copies. Parameters and
+    other constant variables have two values, for the start and the end of the
+    simulation.
+
+    Can be used wherever a
+    :obj:`~modelon.impact.client.entities.result.Result` is, without requests to the
+    server. Requires the 'numpy' package to be installed.
+
+    Args:
+        path: Path to the result file.
+
+    Raises:
+        ValueError if the file is not a result file in the Dymola MAT v4 format.
+        MissingVariableError, a KeyError and ValueError, when getting a variable
+        that is not present in the file.
+        ImportError if 'numpy' is not installed.
+
+    Example::
+
+        from modelon.impact.client.entities.mat_result import MatResult
+
+        with MatResult(case.download_result()) as result:
+            height = result['h']
+            time = result['time']
+
+    """
+
+    def __init__(self, path: str):
+        np = _import_numpy()
+        self._path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"The file '{path}' is empty")
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self._data: Dict[int, Any] = {}
+        self._descriptions: Optional[List[str]] = None
+        try:
+            self._matrices = _read_matrices(self._mmap)
+            for required in ("Aclass", "name", "dataInfo"):
+                if required not in self._matrices:
+                    raise ValueError(f"The file '{path}' is not a Dymola result file")
+            aclass = self._text("Aclass", transposed=False)
+            self._transposed = len(aclass) > 3 and aclass[3] == _TRANSPOSED
+            names = self._text("name", self._transposed)
+            self._index = {name: i for i, name in enumerate(names)}
+            self._names = names
+            self._data_info = np.array(self._table("dataInfo"), dtype=np.int64)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> MatResult:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MatResult('{self._path}')"
+
+    def _matrix(self, name: str) -> Any:
+        """Returns the matrix as stored, a view of shape (columns, rows)."""
+        np = _import_numpy()
+        if self._mmap is None:
+            raise ValueError(f"The result file '{self._path}' is closed")
+        matrix = self._matrices[name]
+        values = np.frombuffer(
+            self._mmap,
+            dtype=matrix.dtype,
+            count=matrix.rows * matrix.columns,
+            offset=matrix.offset,
+        )
+        return values.reshape(matrix.columns, matrix.rows)
+
+    def _table(self, name: str) -> Any:
+        """Returns the matrix with one row per variable or per point in time."""
+        stored = self._matrix(name)
+        return stored if self._transposed else stored.T
+
+    def _text(self, name: str, transposed: bool) -> List[str]:
+        stored = self._matrix(name)
+        rows = stored if transposed else stored.T
+        return [
+            bytes(row.astype("u1")).rstrip(b"\x00 ").decode("utf-8", "replace")
+            for row in rows
+        ]
+
+    def _data_matrix(self, number: int) -> Any:
+        if number not in self._data:
+            name = f"data_{number}"
+            if name not in self._matrices:
+                raise ValueError(f"The result file '{self._path}' has no '{name}'")
+            self._data[number] = self._table(name)
+        return self._data[number]
+
+    def _location(self, variable: str) -> Tuple[int, int]:
+        try:
+            index = self._index[variable]
+        except KeyError:
+            raise MissingVariableError(
+                f"Variable(s) '{variable}' is not present in the result"
+            ) from None
+        number, column = (int(value) for value in self._data_info[index][:2])
+        # The abscissa, time, is stored first in the matrix of trajectories
+        return number or 2, column
+
+    def __getitem__(self, key: str) -> Any:
+        number, column = self._location(key)
+        values = self._data_matrix(number)[:, abs(column) - 1]
+        return -values if column < 0 else values
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def keys(self):  # type: ignore
+        return self._names
+
+    @property
+    def path(self) -> str:
+        """Path to the result file."""
+        return self._path
+
+    def description(self, variable: str) -> str:
+        """Returns the description of the variable, or an empty string if the file has
+        no descriptions."""
+        self._location(variable)
+        if "description" not in self._matrices:
+            return ""
+        if self._descriptions is None:
+            self._descriptions = self._text("description", self._transposed)
+        return self._descriptions[self._index[variable]]
+
+    def close(self) -> None:
+        """Closes the file.
+
+        The mapping is kept open until all arrays returned are garbage collected.
+
+        """
+        if self._mmap is None:
+            return
+        mapped, self._mmap = self._mmap, None
+        self._data.clear()
+        try:
+            mapped.close()
+        except BufferError:
+            # Arrays returned still refer to the mapping, it is closed when they are
+            # garbage collected
+            pass
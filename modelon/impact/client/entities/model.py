@@ -30,6 +30,7 @@ from modelon.impact.client.options import (
     SimulationOptions,
     SolverOptions,
 )
+from modelon.impact.client.tracing import traced
 
 if TYPE_CHECKING:
     from modelon.impact.client.entities.case import Case
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
     from modelon.impact.client.entities.external_result import ExternalResult
     from modelon.impact.client.operations.base import BaseOperation
     from modelon.impact.client.sal.modeling import ModelingService
+    from modelon.impact.client.sal.multipart import ProgressCallback
     from modelon.impact.client.sal.service import Service
 
     CaseOrExperimentOrExternalResult = Union[Case, Experiment, ExternalResult]
@@ -128,6 +130,7 @@ class Model(ModelInterface):
         """Model name."""
         return self._class_name
 
+    @traced
     def compile(
         self,
         compiler_options: CompilerOptionsOrDict,
@@ -234,13 +237,16 @@ class Model(ModelInterface):
             self._workspace_id, body, False
         )
 
-        return ModelExecutableOperation[ModelExecutable](
+        operation = ModelExecutableOperation[ModelExecutable](
             self._workspace_id,
             self._sal.model_executable.compile_model(self._workspace_id, fmu_id),
             self._sal,
             ModelExecutable.from_operation,
         )
+        operation._record_in_journal()
+        return operation
 
+    @traced
     @Experimental
     def get_experiment_definitions(
         self,
@@ -366,6 +372,7 @@ class Model(ModelInterface):
             initialize_from=initialize_from,
         )
 
+    @traced
     def import_fmu(
         self,
         fmu_path: str,
@@ -375,6 +382,7 @@ class Model(ModelInterface):
         exclude_patterns: Optional[Union[str, List[str]]] = None,
         top_level_inputs: Optional[Union[str, List[str]]] = None,
         step_size: float = 0.0,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> FMUImportOperation:
         """Uploads a FMU.
 
@@ -418,6 +426,10 @@ class Model(ModelInterface):
                 set_step_size, which must be invoked before importing the model.
                 Default value: 0.0 (which during simulation is set according to the
                 description above).
+            progress_callback:
+                Optional callable called with the number of bytes uploaded so far
+                and the total number of bytes to upload.
+                Default value: None.
 
         Example::
 
@@ -460,6 +472,7 @@ class Model(ModelInterface):
             exclude_patterns,
             top_level_inputs,
             step_size=step_size,
+            progress_callback=progress_callback,
         )
 
         return FMUImportOperation[Model](
@@ -481,6 +494,7 @@ class Model(ModelInterface):
             )
         return self._modeling_sal_getter
 
+    @traced
     @Experimental
     def get_parameters(self) -> List[ModelParameter]:
         """Returns the parameters for this model's class.
@@ -498,6 +512,7 @@ class Model(ModelInterface):
             for name in modeling_sal().get_model_parameters(self._class_name)
         ]
 
+    @traced
     @Experimental
     def get_source(self) -> str:
         """Returns the Modelica source code for this model's class.
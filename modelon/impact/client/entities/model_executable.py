@@ -21,6 +21,7 @@ from modelon.impact.client.operations.model_executable import (
     CachedModelExecutableOperation,
     ModelExecutableOperation,
 )
+from modelon.impact.client.tracing import traced
 
 if TYPE_CHECKING:
     from modelon.impact.client.entities.custom_function import CustomFunction
@@ -293,6 +294,7 @@ class ModelExecutable(ModelExecutableInterface):
         """
         return self.run_info.status == ModelExecutableStatus.SUCCESSFUL
 
+    @traced
     def get_log(self) -> Log:
         """Returns the compilation log object.
 
@@ -314,6 +316,7 @@ class ModelExecutable(ModelExecutableInterface):
             self._sal.model_executable.compile_log(self._workspace_id, self._fmu_id)
         )
 
+    @traced
     def get_model_description(self) -> ModelDescription:
         """Returns the model description object.
 
@@ -344,6 +347,7 @@ class ModelExecutable(ModelExecutableInterface):
             )
         )
 
+    @traced
     def delete(self) -> None:
         """Deletes an FMU.
 
@@ -354,6 +358,7 @@ class ModelExecutable(ModelExecutableInterface):
         """
         self._sal.model_executable.fmu_delete(self._workspace_id, self._fmu_id)
 
+    @traced
     def get_settable_parameters(self) -> List[str]:
         """Returns a list of settable parameters for the FMU.
 
@@ -414,9 +419,15 @@ class ModelExecutable(ModelExecutableInterface):
             simulation_log_level,
         )
 
+    @traced
     def download(self, path: Optional[str] = None) -> str:
         """Downloads an FMU binary that is compiled. Returns the local path to the
-        downloaded FMU archive.
+        downloaded FMU archive. The FMU is streamed to disk in chunks and is never held
+        in memory as a whole.
+
+        If the server supports range requests, the FMU is downloaded in parts
+        concurrently. An interrupted download is resumed when downloading the FMU
+        to the same path again.
 
         Args:
             path: The local path to store the downloaded FMU. Default: None.
@@ -438,13 +449,11 @@ class ModelExecutable(ModelExecutableInterface):
 
         """
         assert_successful_operation(self.is_successful(), "Compilation")
-        data = self._sal.workspace.fmu_download(self._workspace_id, self._fmu_id)
         if path is None:
             path = os.path.join(tempfile.gettempdir(), "impact-downloads")
         os.makedirs(path, exist_ok=True)
         fmu_path = os.path.join(path, self._fmu_id + ".fmu")
-        with open(fmu_path, "wb") as f:
-            f.write(data)
+        self._sal.workspace.fmu_download_to(self._workspace_id, self._fmu_id, fmu_path)
         return fmu_path
 
     @classmethod
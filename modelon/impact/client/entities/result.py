@@ -1,37 +1,94 @@
 from __future__ import annotations
 
+import contextvars
+import threading
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 from modelon.impact.client.entities.asserts import assert_variable_in_result
 from modelon.impact.client.operations.base import BaseOperation
 from modelon.impact.client.operations.case_result import CaseResultImportOperation
+from modelon.impact.client.sal.trajectory_cache import TrajectoryCache
 
 if TYPE_CHECKING:
-    from modelon.impact.client.sal.experiment import ExperimentService
     from modelon.impact.client.sal.service import Service
 
 
-def _create_result_dict(
-    variables: List[str],
+DEFAULT_BATCH_SIZE = 100
+"""Default number of variables fetched per request when iterating a result."""
+
+DEFAULT_MAX_WORKERS = 4
+"""Default number of requests sent concurrently when prefetching trajectories."""
+
+
+def _trajectory_cache(service: Service) -> Optional[TrajectoryCache]:
+    return service.experiment.trajectory_cache
+
+
+def _result_version(run_info: Dict[str, Any]) -> Optional[str]:
+    """Returns the version of the result of a case for the trajectory cache, the time
+    the case finished, or None if it has not finished."""
+    finished = run_info.get("datetime_finished")
+    return None if finished is None else str(finished)
+
+
+def _fetch_case_trajectories(
+    service: Service,
     workspace_id: str,
     exp_id: str,
     case_id: str,
-    exp_sal: ExperimentService,
-    last_point_only: bool,
-) -> Dict[str, Any]:
-    response = exp_sal.trajectories_get(
-        workspace_id, exp_id, variables, last_point_only
+    variables: List[str],
+    version: Optional[str],
+) -> List[Any]:
+    """Returns the trajectory of each variable for the case, from the trajectory cache
+    when one is configured and the version of the result is known."""
+    exp_sal = service.experiment
+    cache = _trajectory_cache(service)
+    if cache is None or version is None:
+        return exp_sal.case_trajectories_get(
+            workspace_id, exp_id, case_id, variables, False
+        )
+
+    def fetch(missing: List[str]) -> List[List[Any]]:
+        trajectories = exp_sal.case_trajectories_get(
+            workspace_id, exp_id, case_id, missing, False
+        )
+        return [[trajectory] for trajectory in trajectories]
+
+    cached = cache.get_or_fetch(
+        exp_sal.base_url,
+        workspace_id,
+        exp_id,
+        {case_id: version},
+        variables,
+        False,
+        fetch,
     )
-    case_index = int(case_id.split("_")[1])
-    data = {
-        variable: response[i][case_index - 1] for i, variable in enumerate(variables)
-    }
-    return data
+    return [trajectories[0] for trajectories in cached]
 
 
 class Result(Mapping):
-    """Result class containing base functionality."""
+    """Result class containing base functionality.
+
+    The trajectories of the case are fetched from the server the first time they are
+    accessed and then kept in memory. Iterating the result fetches the trajectories
+    of the variables in batches, with one request per batch. Use :obj:`prefetch` or
+    :obj:`get_many` to fetch the trajectories of many variables at once.
+
+    Args:
+        variables: The variables in the result.
+        case_id: The ID of the case.
+        workspace_id: The ID of the workspace.
+        exp_id: The ID of the experiment.
+        service: The service used to fetch the trajectories.
+        version: The version of the result for the trajectory cache, see
+            :obj:`~modelon.impact.client.sal.trajectory_cache.TrajectoryCache`.
+            Default: None, meaning the trajectories are not cached on disk.
+        batch_size: The number of variables fetched per request when iterating
+            or prefetching the result. Default: 100
+
+    """
 
     def __init__(
         self,
@@ -40,31 +97,149 @@ class Result(Mapping):
         workspace_id: str,
         exp_id: str,
         service: Service,
+        version: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1")
         self._case_id = case_id
         self._workspace_id = workspace_id
         self._exp_id = exp_id
         self._sal = service
         self._variables = variables
+        self._variable_set = frozenset(variables)
+        self._version = version
+        self._batch_size = batch_size
+        self._memo: Dict[str, Any] = {}
+        self._lock = threading.Lock()
 
-    def __getitem__(self, key: str) -> Any:
-        assert_variable_in_result([key], self._variables)
-        # TODO: Implement support for last point only
-        response = self._sal.experiment.case_trajectories_get(
-            self._workspace_id, self._exp_id, self._case_id, [key], False
-        )
-        return response[0]
-
-    def __iter__(self) -> Iterator[Any]:
-        data = _create_result_dict(
-            self._variables,
+    def _fetch(self, variables: List[str]) -> None:
+        """Fetches the trajectories of the variables not fetched before with one
+        request."""
+        with self._lock:
+            missing = [variable for variable in variables if variable not in self._memo]
+        if not missing:
+            return
+        trajectories = _fetch_case_trajectories(
+            self._sal,
             self._workspace_id,
             self._exp_id,
             self._case_id,
-            self._sal.experiment,
-            False,
+            missing,
+            self._version,
         )
-        return data.__iter__()
+        with self._lock:
+            self._memo.update(zip(missing, trajectories))
+
+    def prefetch(
+        self,
+        variables: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Fetches the trajectories of the variables, so that accessing them later does
+        not send requests.
+
+        The variables not fetched before are split into batches of 'batch_size'
+        variables, with one request per batch, and the batches are fetched
+        concurrently.
+
+        Args:
+            variables: The variables to fetch. Default: None, meaning all variables
+                in the result.
+            max_workers: The maximum number of requests sent at the same time.
+                Default: 4
+
+        Raises:
+            ValueError if a variable is not in the result or max_workers is less
+            than 1.
+
+        Example::
+
+            result = case.get_trajectories()
+            result.prefetch(['h', 'v', 'time'])
+            height = result['h']
+
+        """
+        if max_workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        if variables is None:
+            variables = self._variables
+        else:
+            assert_variable_in_result(variables, self._variables)
+        with self._lock:
+            missing = [
+                variable
+                for variable in dict.fromkeys(variables)
+                if variable not in self._memo
+            ]
+        batches = [
+            missing[start : start + self._batch_size]
+            for start in range(0, len(missing), self._batch_size)
+        ]
+        if len(batches) <= 1 or max_workers == 1:
+            for batch in batches:
+                self._fetch(batch)
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            # Each batch runs in a copy of the current context so that deadlines
+            # and tracing spans apply to its request
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._fetch, batch)
+                for batch in batches
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def get_many(
+        self, variables: List[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, Any]:
+        """Returns the trajectories of the variables, fetching the ones not fetched
+        before as with :obj:`prefetch`.
+
+        Args:
+            variables: The variables to get the trajectories for.
+            max_workers: The maximum number of requests sent at the same time.
+                Default: 4
+
+        Returns:
+            A dictionary with the trajectory of each variable.
+
+        Raises:
+            ValueError if a variable is not in the result.
+
+        Example::
+
+            trajectories = result.get_many(['h', 'v', 'time'])
+            height = trajectories['h']
+
+        """
+        self.prefetch(variables, max_workers=max_workers)
+        with self._lock:
+            return {variable: self._memo[variable] for variable in variables}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._variable_set:
+            assert_variable_in_result([key], self._variables)
+        # TODO: Implement support for last point only
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+        self._fetch([key])
+        return self._memo[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._variable_set
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, len(self._variables), self._batch_size):
+            batch = self._variables[start : start + self._batch_size]
+            self._fetch(batch)
+            yield from batch
 
     def __len__(self) -> int:
         return self._variables.__len__()
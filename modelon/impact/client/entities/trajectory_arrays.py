@@ -0,0 +1,150 @@
+"""Trajectories as NumPy arrays."""
+from __future__ import annotations
+
+import itertools
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+def _import_numpy() -> Any:
+    """Returns the 'numpy' module, raising an ImportError explaining how to install it
+    if it is missing."""
+    try:
+        import numpy
+    except ImportError as exce:
+        raise ImportError(
+            "Trajectory arrays require the 'numpy' package, install it with "
+            "'pip install modelon-impact-client[numpy]'"
+        ) from exce
+    return numpy
+
+
+def _to_array(
+    trajectories: Sequence[Optional[List[Any]]],
+) -> Tuple[Any, Optional[Any]]:
+    """Returns the trajectories of one variable for several cases as a float64 array and
+    the offsets of the cases in it, or None for offsets if all trajectories have the
+    same length and the array has one row per case."""
+    np = _import_numpy()
+    lengths = [len(trajectory or ()) for trajectory in trajectories]
+    if len(set(lengths)) <= 1:
+        if not lengths:
+            return np.empty((0, 0), dtype=np.float64), None
+        values = np.array(
+            [trajectory or () for trajectory in trajectories], dtype=np.float64
+        )
+        return values.reshape(len(lengths), lengths[0]), None
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.fromiter(
+        (
+            np.nan if value is None else value
+            for value in itertools.chain.from_iterable(
+                trajectory or () for trajectory in trajectories
+            )
+        ),
+        dtype=np.float64,
+        count=int(offsets[-1]),
+    )
+    return values, offsets
+
+
+class TrajectoryArrays(Mapping):
+    """Trajectories of several variables for one or more cases, stored as contiguous
+    float64 NumPy arrays with one array per variable.
+
+    If all cases have the same number of points for a variable, the array of the
+    variable has the shape (cases, points) and row 'i' holds the trajectory of case
+    'cases[i]'. Otherwise the array is ragged: it holds the trajectories of all cases
+    one after the other, and the trajectory of case 'cases[i]' is
+    'values[offsets[i]:offsets[i + 1]]'. Missing values are NaN.
+
+    Requires the 'numpy' package to be installed.
+
+    Example::
+
+        arrays = experiment.get_trajectory_arrays(['h', 'time'])
+        height = arrays['h']  # Shape (cases, points) unless ragged
+        height_case_2 = arrays.case('case_2', 'h')
+        row = arrays.case_index['case_2']
+
+    """
+
+    def __init__(
+        self,
+        cases: List[str],
+        values: Dict[str, Any],
+        offsets: Optional[Dict[str, Any]] = None,
+    ):
+        self._cases = cases
+        self._case_index = {case_id: i for i, case_id in enumerate(cases)}
+        self._values = values
+        self._offsets = offsets or {}
+
+    @classmethod
+    def from_trajectories(
+        cls, cases: List[str], variables: List[str], trajectories: List[Any]
+    ) -> TrajectoryArrays:
+        """Creates the arrays from trajectories in the format returned by the server,
+        with one list of trajectories per variable holding one trajectory per case.
+
+        The lists of trajectories are released as soon as they are converted, so that
+        the boxed Python floats of one variable at a time are kept in memory.
+
+        """
+        _import_numpy()
+        values = {}
+        offsets = {}
+        for i, variable in enumerate(variables):
+            values[variable], variable_offsets = _to_array(trajectories[i])
+            trajectories[i] = None
+            if variable_offsets is not None:
+                offsets[variable] = variable_offsets
+        return cls(cases, values, offsets)
+
+    def __repr__(self) -> str:
+        return f"TrajectoryArrays(cases={len(self._cases)}, variables={list(self)})"
+
+    def __getitem__(self, variable: str) -> Any:
+        return self._values[variable]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def cases(self) -> List[str]:
+        """The case IDs, in the order of the rows of the arrays."""
+        return self._cases
+
+    @property
+    def case_index(self) -> Dict[str, int]:
+        """Dictionary with the row of each case ID in the arrays."""
+        return self._case_index
+
+    def is_ragged(self, variable: str) -> bool:
+        """Returns True if the trajectories of the variable have different lengths for
+        different cases."""
+        return variable in self._offsets
+
+    def offsets(self, variable: str) -> Optional[Any]:
+        """Returns the offsets of the cases in the ragged array of the variable, with
+        one more element than there are cases, or None if the array is not ragged."""
+        return self._offsets.get(variable)
+
+    def case(self, case_id: str, variable: str) -> Any:
+        """Returns the trajectory of the variable for the case, as a view of the array
+        of the variable.
+
+        Raises:
+            KeyError if there are no trajectories for the case or variable.
+
+        """
+        index = self._case_index[case_id]
+        values = self._values[variable]
+        offsets = self._offsets.get(variable)
+        if offsets is None:
+            return values[index]
+        return values[offsets[index] : offsets[index + 1]]
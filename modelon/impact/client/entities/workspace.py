@@ -43,9 +43,11 @@ from modelon.impact.client.operations.workspace.exports import (
 from modelon.impact.client.operations.workspace.imports import WorkspaceImportOperation
 from modelon.impact.client.sal.exceptions import HTTPError
 from modelon.impact.client.sal.service import Service
+from modelon.impact.client.tracing import traced
 
 if TYPE_CHECKING:
     from modelon.impact.client.operations.base import BaseOperation
+    from modelon.impact.client.sal.multipart import ProgressCallback
 
 logger = logging.getLogger(__name__)
 
@@ -755,6 +757,7 @@ class Workspace(WorkspaceInterface):
             for cf in custom_functions["data"]["items"]
         ]
 
+    @traced
     def delete(self) -> None:
         """Deletes a workspace.
 
@@ -765,11 +768,13 @@ class Workspace(WorkspaceInterface):
         """
         self._sal.workspace.workspace_delete(self._workspace_id)
 
+    @traced
     def upload_result(
         self,
         path_to_result: str,
         label: Optional[str] = None,
         description: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> ExternalResultImportOperation:
         """Uploads a '.mat' result file to the workspace.
 
@@ -777,6 +782,9 @@ class Workspace(WorkspaceInterface):
             path_to_result: The path for the result file to be imported.
             label: The label of the result file. Default: None.
             description: The description of the result file. Default: None.
+            progress_callback: Optional callable called with the number of bytes
+                uploaded so far and the total number of bytes to upload.
+                Default: None.
 
         Example::
 
@@ -786,12 +794,17 @@ class Workspace(WorkspaceInterface):
 
         """
         resp = self._sal.external_result.result_upload(
-            self._workspace_id, path_to_result, label=label, description=description
+            self._workspace_id,
+            path_to_result,
+            label=label,
+            description=description,
+            progress_callback=progress_callback,
         )
         return ExternalResultImportOperation[ExternalResult](
             resp["data"]["location"], self._sal, ExternalResult.from_operation
         )
 
+    @traced
     def export(
         self,
         publish: bool = False,
@@ -842,10 +855,13 @@ class Workspace(WorkspaceInterface):
             class_path,
             access_settings,
         )
-        return WorkspaceExportOperation[Workspace](
+        operation = WorkspaceExportOperation[Workspace](
             resp["data"]["location"], self._sal, Export.from_operation
         )
+        operation._record_in_journal()
+        return operation
 
+    @traced
     def download(self, path: str) -> str:
         """Downloads the workspace as a binary compressed archive. Returns the local
         path to the downloaded workspace archive. Similar to
@@ -868,6 +884,7 @@ class Workspace(WorkspaceInterface):
         ops = self.export().wait()
         return ops.download_as(ws_path)
 
+    @traced
     def get_model(self, class_name: str, project: Optional[Project] = None) -> Model:
         """Returns a Model class object.
 
@@ -891,6 +908,7 @@ class Workspace(WorkspaceInterface):
             self._sal,
         )
 
+    @traced
     def get_fmus(self) -> List[ModelExecutable]:
         """Returns a list of ModelExecutable class objects.
 
@@ -908,6 +926,7 @@ class Workspace(WorkspaceInterface):
             for item in resp["data"]["items"]
         ]
 
+    @traced
     def get_fmu(self, fmu_id: str) -> ModelExecutable:
         """Returns a ModelExecutable class object.
 
@@ -922,6 +941,7 @@ class Workspace(WorkspaceInterface):
         resp = self._sal.workspace.fmu_get(self._workspace_id, fmu_id)
         return ModelExecutable(self._workspace_id, resp["id"], self._sal, resp)
 
+    @traced
     def get_experiments(self, class_path: Optional[str] = None) -> List[Experiment]:
         """Returns a list of Experiment class objects.
 
@@ -946,6 +966,7 @@ class Workspace(WorkspaceInterface):
             for item in resp["data"]["items"]
         ]
 
+    @traced
     def get_experiment(self, experiment_id: str) -> Experiment:
         """Returns an Experiment class object.
 
@@ -964,6 +985,7 @@ class Workspace(WorkspaceInterface):
         resp = self._sal.workspace.experiment_get(self._workspace_id, experiment_id)
         return Experiment(self._workspace_id, resp["id"], self._sal, resp)
 
+    @traced
     def create_experiment(
         self,
         definition: ExperimentDefinition,
@@ -1003,6 +1025,7 @@ class Workspace(WorkspaceInterface):
         )
         return Experiment(self._workspace_id, resp["experiment_id"], self._sal)
 
+    @traced
     def execute(
         self,
         definition: ExperimentDefinition,
@@ -1032,13 +1055,16 @@ class Workspace(WorkspaceInterface):
 
         """
         exp_id = self.create_experiment(definition, user_data).id
-        return ExperimentOperation[Experiment](
+        operation = ExperimentOperation[Experiment](
             self._workspace_id,
             self._sal.experiment.experiment_execute(self._workspace_id, exp_id),
             self._sal,
             Experiment.from_operation,
         )
+        operation._record_in_journal()
+        return operation
 
+    @traced
     def get_projects(
         self, vcs_info: bool = True, include_disabled: bool = False
     ) -> List[Project]:
@@ -1073,6 +1099,7 @@ class Workspace(WorkspaceInterface):
         ]
         return projects
 
+    @traced
     def get_dependencies(
         self, vcs_info: bool = True, include_disabled: bool = False
     ) -> List[Project]:
@@ -1150,6 +1177,7 @@ class Workspace(WorkspaceInterface):
         )
         self._sal.workspace.update_workspace(self.id, lock_preview)
 
+    @traced
     def create_project(self, name: str) -> Project:
         """Creates a new project in the workspace.
 
@@ -1220,12 +1248,20 @@ class Workspace(WorkspaceInterface):
             )["definition"]
         )
 
-    def import_project_from_zip(self, path_to_project: str) -> ProjectImportOperation:
+    @traced
+    def import_project_from_zip(
+        self,
+        path_to_project: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> ProjectImportOperation:
         """Imports a Project from a compressed(.zip) project file and adds it to the
         workspace. Returns the project class object.
 
         Args:
             path_to_project: The path for the compressed project(.zip) to be uploaded.
+            progress_callback: Optional callable called with the number of bytes
+                uploaded so far and the total number of bytes to upload.
+                Default: None.
 
         Returns:
             A ProjectImportOperation class object.
@@ -1236,12 +1272,13 @@ class Workspace(WorkspaceInterface):
 
         """
         resp = self._sal.workspace.import_project_from_zip(
-            self._workspace_id, path_to_project
+            self._workspace_id, path_to_project, progress_callback=progress_callback
         )
         return ProjectImportOperation[Project](
             resp["data"]["location"], self._sal, Project.from_operation
         )
 
+    @traced
     def import_dependency_from_zip(
         self, path_to_dependency: str
     ) -> ProjectImportOperation:
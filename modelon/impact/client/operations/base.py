@@ -4,9 +4,31 @@ import enum
 import logging
 import time
 from abc import abstractmethod
-from typing import Any, Generic, Optional, Protocol, TypeVar, Union
-
-from modelon.impact.client import exceptions
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Generic,
+    Iterator,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from modelon.impact.client import exceptions, tracing
+from modelon.impact.client.operations.journal import JournalEntry, OperationJournal
+from modelon.impact.client.operations.polling import (
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+from modelon.impact.client.sal import deadline, retry_after
+from modelon.impact.client.sal.exceptions import DeadlineExceededError
+from modelon.impact.client.sal.workspace_events import Subscription
+
+if TYPE_CHECKING:
+    from modelon.impact.client.sal.service import Service
 
 logger = logging.getLogger(__name__)
 Entity = TypeVar("Entity")
@@ -54,9 +76,37 @@ class AsyncOperationStatus(enum.Enum):
         return self in [AsyncOperationStatus.READY, AsyncOperationStatus.ERROR]
 
 
+def _start_wait_span(operation: BaseOperation) -> ContextManager[tracing.Span]:
+    if not tracing.is_enabled():
+        return tracing.NoOpSpan()
+    attributes = tracing.id_attributes(operation)
+    attributes["impact.operation.name"] = operation.name
+    return tracing.start_span(f"{type(operation).__name__}.wait", attributes)
+
+
+def _status_within(
+    operation: BaseOperation,
+    timeout: Optional[float],
+    start_t: float,
+    last_status_name: str,
+) -> Any:
+    """Returns the status of the operation, requesting it with a deadline at the end of
+    the timeout so that a stuck request doesn't outlive the wait."""
+    remaining = max(timeout - (time.time() - start_t), 0.0) if timeout else None
+    try:
+        with deadline.deadline(remaining):
+            return operation.status
+    except DeadlineExceededError as exce:
+        raise exceptions.OperationTimeOutError(
+            current_status_name=last_status_name, timeout=timeout
+        ) from exce
+
+
 class BaseOperation(Generic[Entity]):
     """Abstract base operation class."""
 
+    _sal: Service
+
     def __init__(self, create_entity: EntityFromOperation):
         self._create_entity = create_entity
 
@@ -87,11 +137,49 @@ class BaseOperation(Generic[Entity]):
         """Waits for the operation to finish."""
         pass
 
+    def _polling_strategy(self, polling: Optional[PollingStrategy]) -> PollingStrategy:
+        return resolve_polling_strategy(polling, self._sal)
+
+    def _execution_key(self) -> Optional[Tuple[str, str]]:
+        """Returns the kind and ID identifying the operation among the active executions
+        listed by the server, or None if it is not listed there."""
+        return None
+
+    def _journal_entry(self) -> Optional[JournalEntry]:
+        """Returns the entry recording the operation in an operation journal, or None if
+        the operation is not journaled."""
+        return None
+
+    def _journal(self) -> Optional[OperationJournal]:
+        return self._sal.journal
+
+    def _record_in_journal(self) -> None:
+        """Records the operation in the operation journal of the client, if any.
+
+        Called when the operation is submitted, not for operations created for
+        executions that are already running.
+
+        """
+        journal = self._journal()
+        entry = self._journal_entry()
+        if journal is not None and entry is not None:
+            journal.record(entry)
+
+    def _discard_from_journal(self) -> None:
+        journal = self._journal()
+        entry = self._journal_entry()
+        if journal is not None and entry is not None:
+            journal.discard(entry.kind, entry.id)
+
 
 class AsyncOperation(BaseOperation[Entity]):
     """File operation class containing base functionality."""
 
-    def wait(self, timeout: Optional[float] = None) -> Entity:
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Entity:
         """Waits until the operation completes. Returns the operation class instance if
         operation completes.
 
@@ -99,13 +187,18 @@ class AsyncOperation(BaseOperation[Entity]):
             timeout: Time to wait in seconds for achieving the status. By default
                 the timeout is set to 'None', which signifies an infinite time
                 to wait until the status is achieved.
+            polling: The strategy deciding how often the status is requested.
+                Default is None and then the polling strategy of the client is
+                used, see
+                :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
 
         Returns:
 
             Entity class instance if operation completes.
 
         Raises:
-            OperationTimeOutError if time exceeds set timeout.
+            OperationTimeOutError if time exceeds set timeout, or the deadline set
+            with :obj:`~modelon.impact.client.sal.deadline.deadline` passes.
 
         Example::
 
@@ -113,19 +206,31 @@ class AsyncOperation(BaseOperation[Entity]):
 
         """
         start_t = time.time()
-        while True:
-            logger.info(f"{self.name} in progress! Status : {self.status.name}")
-            if self.status.done():
-                logger.info(f"{self.name} completed! Status : {self.status.name}")
-                return self.data()
+        timeout = deadline.limit(timeout or None)
+        schedule = self._polling_strategy(polling).schedule()
+        with _start_wait_span(self) as span:
+            polls = 0
+            status_name = "unknown"
+            while True:
+                polls += 1
+                span.set_attribute("impact.operation.polls", polls)
+                status = _status_within(self, timeout, start_t, status_name)
+                status_name = status.name
+                server_hint = retry_after.pop_hint()
+                logger.info(f"{self.name} in progress! Status : {status.name}")
+                if status.done():
+                    logger.info(f"{self.name} completed! Status : {status.name}")
+                    self._discard_from_journal()
+                    return self.data()
 
-            current_t = time.time()
-            if timeout and current_t - start_t > timeout:
-                raise exceptions.OperationTimeOutError(
-                    current_status_name=self.status.name, timeout=timeout
-                )
+                elapsed = time.time() - start_t
+                if timeout and elapsed >= timeout:
+                    raise exceptions.OperationTimeOutError(
+                        current_status_name=status.name, timeout=timeout
+                    )
 
-            time.sleep(0.5)
+                remaining = timeout - elapsed if timeout else None
+                time.sleep(schedule.next_interval(server_hint, remaining))
 
     def cancel(self) -> None:
         raise NotImplementedError("Cancel is not supported for this operation")
@@ -153,6 +258,7 @@ class ExecutionOperation(BaseOperation[Entity]):
         self,
         timeout: Optional[float] = None,
         status: Union[Status, tuple[Status, ...]] = (Status.DONE, Status.CANCELLED),
+        polling: Optional[PollingStrategy] = None,
     ) -> Entity:
         """Waits until the operation achieves the set status. Returns the operation
         class instance if the set status is achieved.
@@ -166,12 +272,22 @@ class ExecutionOperation(BaseOperation[Entity]):
                 Operation status to be achieved.
                 Default: Status.DONE
 
+            polling:
+                The strategy deciding how often the status is requested.
+                Default is None and then the polling strategy of the client is
+                used, see
+                :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+                Not used while the client receives push notifications from the
+                server, see the 'push_completion' argument of
+                :obj:`~modelon.impact.client.Client`.
+
         Returns:
 
             Entity class instance if the set status is achieved.
 
         Raises:
-            OperationTimeOutError if time exceeds set timeout.
+            OperationTimeOutError if time exceeds set timeout, or the deadline set
+            with :obj:`~modelon.impact.client.sal.deadline.deadline` passes.
 
         Example::
 
@@ -180,27 +296,76 @@ class ExecutionOperation(BaseOperation[Entity]):
                 status = Status.CANCELLED
                 )
             workspace.execute(experiment_definition).wait(timeout = 120)
+            workspace.execute(experiment_definition).wait(
+                polling=PollingStrategy(max_interval=60)
+            )
 
         """
-        start_t = time.time()
         status_tuple = status if isinstance(status, tuple) else (status,)
+        for current in self._poll_status(timeout, polling):
+            if current in status_tuple:
+                logger.info(f"{self.name} completed! Status : {current.name}")
+                if current in (Status.DONE, Status.CANCELLED):
+                    self._discard_from_journal()
+                return self.data()
+        raise AssertionError("Polling the status stopped before completion")
 
-        try:
-            while True:
-                logger.info(f"{self.name} in progress! Status : {self.status.name}")
-                if self.status in status_tuple:
-                    logger.info(f"{self.name} completed! Status : {self.status.name}")
-                    return self.data()
+    def _poll_status(
+        self, timeout: Optional[float], polling: Optional[PollingStrategy]
+    ) -> Iterator[Status]:
+        """Yields the status of the operation once per poll, until the caller stops
+        iterating.
 
-                current_t = time.time()
-                if timeout and current_t - start_t > timeout:
-                    raise exceptions.OperationTimeOutError(
-                        timeout=timeout,
-                        current_status_name=self.status.name,
-                    )
+        Raises OperationTimeOutError if the caller has not stopped iterating before the
+        timeout.
 
-                time.sleep(0.5)
+        """
+        start_t = time.time()
+        timeout = deadline.limit(timeout or None)
+        schedule = self._polling_strategy(polling).schedule()
+        subscription = self._subscribe_to_completion()
+
+        try:
+            with _start_wait_span(self) as span:
+                polls = 0
+                status_name = "unknown"
+                while True:
+                    polls += 1
+                    span.set_attribute("impact.operation.polls", polls)
+                    current = _status_within(self, timeout, start_t, status_name)
+                    status_name = current.name
+                    server_hint = retry_after.pop_hint()
+                    logger.info(f"{self.name} in progress! Status : {current.name}")
+                    yield current
+
+                    elapsed = time.time() - start_t
+                    if timeout and elapsed >= timeout:
+                        raise exceptions.OperationTimeOutError(
+                            timeout=timeout,
+                            current_status_name=current.name,
+                        )
+
+                    remaining = timeout - elapsed if timeout else None
+                    if subscription is not None and subscription.connected:
+                        # Wait for the server to push a notification about the
+                        # operation, only polling in case one is missed
+                        interval = subscription.fallback_interval
+                        subscription.wait(
+                            interval if remaining is None else min(interval, remaining)
+                        )
+                    else:
+                        time.sleep(schedule.next_interval(server_hint, remaining))
         except KeyboardInterrupt:
             logger.info("Execution cancelled!")
             self.cancel()
             raise
+        finally:
+            if subscription is not None:
+                subscription.close()
+
+    def _subscribe_to_completion(self) -> Optional[Subscription]:
+        events = self._sal.workspace_events
+        key = self._execution_key()
+        if events is None or key is None:
+            return None
+        return events.subscribe(getattr(self, "_workspace_id"), [key[1]])
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from modelon.impact.client.operations.base import Entity, ExecutionOperation, Status
 
@@ -43,6 +43,9 @@ class CaseOperation(ExecutionOperation[Entity]):
         """Return the name of operation."""
         return "Execution"
 
+    def _execution_key(self) -> Optional[Tuple[str, str]]:
+        return ("EXPERIMENT", self._exp_id)
+
     def data(self) -> Entity:
         """Returns a new Case class instance.
 
@@ -33,6 +33,7 @@ class CaseResultImportOperation(AsyncOperation[Entity]):
         self._case_id = case_id
         self._sal = service
         self._create_entity = create_entity
+        self._cache_invalidated = False
 
     def __repr__(self) -> str:
         return f"Case result import operations for id '{self.id}'"
@@ -54,7 +55,29 @@ class CaseResultImportOperation(AsyncOperation[Entity]):
         return "Case result import"
 
     def _info(self) -> Dict[str, Any]:
-        return self._sal.imports.get_import_status(self._location)["data"]
+        info = self._sal.imports.get_import_status(self._location)["data"]
+        if info["status"] != AsyncOperationStatus.RUNNING.value:
+            self._invalidate_cached_trajectories()
+        return info
+
+    def _invalidate_cached_trajectories(self) -> None:
+        """Discards the trajectories of the case cached while the import was running.
+
+        The import replaces the result without changing the time the case finished,
+        which is the version the trajectories are cached for.
+
+        """
+        if self._cache_invalidated:
+            return
+        cache = self._sal.experiment.trajectory_cache
+        if cache is not None:
+            cache.invalidate_case(
+                self._sal.experiment.base_url,
+                self._workspace_id,
+                self._exp_id,
+                self._case_id,
+            )
+        self._cache_invalidated = True
 
     def data(self) -> Entity:
         """Returns a new Result class instance.
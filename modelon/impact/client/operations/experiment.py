@@ -1,14 +1,69 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
 from modelon.impact.client.operations.base import Entity, ExecutionOperation, Status
+from modelon.impact.client.operations.journal import JournalEntry, OperationKind
 
 if TYPE_CHECKING:
     from modelon.impact.client.operations.base import EntityFromOperation
+    from modelon.impact.client.operations.polling import PollingStrategy
     from modelon.impact.client.sal.service import Service
 
 
+@dataclass(frozen=True)
+class ExperimentProgress:
+    """Progress of an experiment execution, created from the execution status returned
+    by the server.
+
+    Args:
+        status: The execution status.
+        finished: Number of cases that have finished executing, successfully or
+            not.
+        total: Number of cases being executed.
+        elapsed: Time in seconds since the progress started being followed.
+
+    """
+
+    status: Status
+    finished: int
+    total: int
+    elapsed: float
+
+    @classmethod
+    def from_status(cls, status: Dict[str, Any], elapsed: float) -> ExperimentProgress:
+        return cls(
+            status=Status(status["status"]),
+            finished=status.get("finished_executions", 0),
+            total=status.get("total_executions", 0),
+            elapsed=elapsed,
+        )
+
+    @property
+    def not_finished(self) -> int:
+        """Number of cases that are running or not yet started."""
+        return self.total - self.finished
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the cases that have finished, between 0.0 and 1.0."""
+        return self.finished / self.total if self.total else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated time in seconds until all cases have finished, based on the rate
+        cases have finished at so far.
+
+        None until a case has finished.
+
+        """
+        if not self.finished:
+            return None
+        return self.elapsed / self.finished * self.not_finished
+
+
 class ExperimentOperation(ExecutionOperation[Entity]):
     """An operation class for the Experiment class."""
 
@@ -24,6 +79,7 @@ class ExperimentOperation(ExecutionOperation[Entity]):
         self._exp_id = exp_id
         self._sal = service
         self._create_entity = create_entity
+        self._last_status: Optional[Dict[str, Any]] = None
 
     def __repr__(self) -> str:
         return f"Experiment operation for id '{self._exp_id}'"
@@ -41,6 +97,12 @@ class ExperimentOperation(ExecutionOperation[Entity]):
         """Return the name of operation."""
         return "Execution"
 
+    def _execution_key(self) -> Optional[Tuple[str, str]]:
+        return ("EXPERIMENT", self._exp_id)
+
+    def _journal_entry(self) -> Optional[JournalEntry]:
+        return JournalEntry(OperationKind.EXPERIMENT, self._workspace_id, self._exp_id)
+
     def data(self) -> Entity:
         """Returns a new Experiment class instance.
 
@@ -66,11 +128,62 @@ class ExperimentOperation(ExecutionOperation[Entity]):
             workspace.execute(definition).status
 
         """
-        return Status(
-            self._sal.experiment.execute_status(self._workspace_id, self._exp_id)[
-                "status"
-            ]
+        self._last_status = self._sal.experiment.execute_status(
+            self._workspace_id, self._exp_id
         )
+        return Status(self._last_status["status"])
+
+    def progress(
+        self,
+        timeout: Optional[float] = None,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Iterator[ExperimentProgress]:
+        """Yields the progress of the execution whenever the number of finished cases or
+        the status changes, until the execution is done or cancelled.
+
+        The progress is read from the same execution status that is requested
+        when waiting for the operation, so following the progress requests nothing
+        more from the server than calling
+        :obj:`~modelon.impact.client.operations.base.ExecutionOperation.wait`.
+
+        Args:
+            timeout: Time to wait in seconds for the execution to finish. By
+                default the timeout is set to 'None', which signifies an infinite
+                time to wait.
+            polling: The strategy deciding how often the status is requested.
+                Default is None and then the polling strategy of the client is
+                used, see
+                :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+
+        Yields:
+            ExperimentProgress class objects. The last one has the status
+            Status.DONE or Status.CANCELLED.
+
+        Raises:
+            OperationTimeOutError if time exceeds set timeout.
+
+        Example::
+
+            operation = workspace.execute(definition)
+            for progress in operation.progress():
+                print(f"{progress.finished}/{progress.total}, ETA {progress.eta}")
+            experiment = operation.data()
+
+        """
+        start_t = time.time()
+        previous = None
+        for current in self._poll_status(timeout, polling):
+            assert self._last_status is not None
+            progress = ExperimentProgress.from_status(
+                self._last_status, time.time() - start_t
+            )
+            key = (progress.status, progress.finished, progress.total)
+            if key != previous:
+                previous = key
+                yield progress
+            if current in (Status.DONE, Status.CANCELLED):
+                self._discard_from_journal()
+                return
 
     def cancel(self) -> None:
         """Terminates the execution process.
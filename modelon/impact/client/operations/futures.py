@@ -0,0 +1,223 @@
+"""Adapting operations to :obj:`concurrent.futures.Future`.
+
+Operations turned into futures are all polled by a single background thread, instead
+of one blocked thread per operation calling wait. The futures work with
+:obj:`concurrent.futures.wait`, :obj:`concurrent.futures.as_completed` and done
+callbacks like the futures of an executor.
+
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set
+
+from modelon.impact.client.operations.base import BaseOperation
+from modelon.impact.client.operations.polling import (
+    PollingSchedule,
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+from modelon.impact.client.operations.waiter import _active_executions, _is_finished
+from modelon.impact.client.sal import retry_after
+
+logger = logging.getLogger(__name__)
+
+
+class OperationFuture(Future):
+    """A :obj:`concurrent.futures.Future` completed when an operation is done.
+
+    The result of the future is the entity of the operation, for example the
+    Experiment class instance of an experiment operation. The future stays pending
+    until the operation is done, so that cancelling it cancels the operation.
+
+    Created by :obj:`to_future` or :obj:`OperationPoller.submit`.
+
+    """
+
+    def __init__(self, operation: BaseOperation, poller: OperationPoller):
+        super().__init__()
+        self._operation = operation
+        self._poller = poller
+        self._completion_lock = threading.Lock()
+
+    @property
+    def operation(self) -> BaseOperation:
+        """The operation the future is completed by."""
+        return self._operation
+
+    def cancel(self) -> bool:
+        """Cancels the operation and the future.
+
+        Returns False if the operation is already done or does not support cancellation,
+        else True.
+
+        """
+        if self.done():
+            return False
+        try:
+            self._operation.cancel()
+        except NotImplementedError:
+            return False
+        with self._completion_lock:
+            if not super().cancel():
+                return False
+            # Notifies concurrent.futures.wait and as_completed of the cancellation
+            self.set_running_or_notify_cancel()
+        self._poller._remove(self)
+        return True
+
+    def _complete(
+        self, result: Any = None, exception: Optional[BaseException] = None
+    ) -> None:
+        with self._completion_lock:
+            if self.cancelled():
+                return
+            self.set_running_or_notify_cancel()
+            if exception is not None:
+                self.set_exception(exception)
+            else:
+                self.set_result(result)
+
+
+class OperationPoller:
+    """Polls the status of many operations on a single background thread, completing
+    their futures when they are done.
+
+    Experiments and compilations are checked through the bulk executions endpoint of
+    the server, as in :obj:`~modelon.impact.client.operations.waiter.as_completed`.
+    The thread is started when an operation is submitted and stops when no
+    operations remain.
+
+    Args:
+        polling: The strategy deciding how often the statuses are requested.
+            Default is None and then the polling strategy of the client is used,
+            see :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+
+    Example::
+
+        from concurrent.futures import as_completed
+        from modelon.impact.client.operations.futures import OperationPoller
+
+        poller = OperationPoller()
+        futures = [
+            poller.submit(workspace.execute(definition)) for definition in definitions
+        ]
+        for future in as_completed(futures):
+            experiment = future.result()
+
+    """
+
+    def __init__(self, polling: Optional[PollingStrategy] = None):
+        self._polling = polling
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._futures: List[OperationFuture] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, operation: BaseOperation) -> OperationFuture:
+        """Returns a future completed when the operation is done."""
+        future = OperationFuture(operation, self)
+        with self._lock:
+            self._futures.append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="impact-operation-poller", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+        return future
+
+    def _remove(self, future: OperationFuture) -> None:
+        with self._lock:
+            if future in self._futures:
+                self._futures.remove(future)
+
+    def _pending(self) -> List[OperationFuture]:
+        with self._lock:
+            if not self._futures:
+                self._thread = None
+            return list(self._futures)
+
+    def _run(self) -> None:
+        schedule: Optional[PollingSchedule] = None
+        while True:
+            futures = self._pending()
+            if not futures:
+                return
+            if self._wakeup.is_set():
+                # Restart the backoff, so that new operations are polled promptly
+                self._wakeup.clear()
+                schedule = None
+            if schedule is None:
+                service = futures[0].operation._sal
+                schedule = resolve_polling_strategy(self._polling, service).schedule()
+            server_hint = self._poll(futures)
+            if not self._pending():
+                return
+            self._wakeup.wait(schedule.next_interval(server_hint))
+
+    def _poll(self, futures: List[OperationFuture]) -> Optional[float]:
+        operations = [future.operation for future in futures]
+        try:
+            active: Dict[int, Set[Any]] = _active_executions(operations)
+        except Exception as exce:
+            logger.warning(f"Failed requesting the executions, polling each: {exce}")
+            active = {}
+        server_hint = retry_after.pop_hint()
+        for future in futures:
+            try:
+                if not _is_finished(future.operation, active):
+                    continue
+                result = future.operation.data()
+            except Exception as exce:
+                self._remove(future)
+                future._complete(exception=exce)
+            else:
+                logger.info(
+                    f"{future.operation.name} completed for {future.operation!r}"
+                )
+                self._remove(future)
+                future._complete(result=result)
+        return server_hint
+
+
+_default_poller: Optional[OperationPoller] = None
+_default_poller_lock = threading.Lock()
+
+
+def _get_default_poller() -> OperationPoller:
+    global _default_poller
+    with _default_poller_lock:
+        if _default_poller is None:
+            _default_poller = OperationPoller()
+        return _default_poller
+
+
+def to_future(
+    operation: BaseOperation, poller: Optional[OperationPoller] = None
+) -> OperationFuture:
+    """Returns a :obj:`concurrent.futures.Future` completed with the entity of the
+    operation when it is done.
+
+    Cancelling the future cancels the operation.
+
+    Args:
+        operation: The operation to adapt.
+        poller: The poller polling the status of the operation. Default is None
+            and then a poller shared by all futures is used.
+
+    Example::
+
+        import concurrent.futures
+        from modelon.impact.client import to_future
+
+        futures = [
+            to_future(workspace.execute(definition)) for definition in definitions
+        ]
+        futures[0].add_done_callback(lambda future: print(future.result().id))
+        done, not_done = concurrent.futures.wait(futures, timeout=3600)
+
+    """
+    return (poller or _get_default_poller()).submit(operation)
@@ -0,0 +1,175 @@
+"""Durable journal of the operations started by a client.
+
+The journal records every experiment execution, compilation and workspace export started
+through a client with a journal, and forgets them once they have been waited for until
+done. If the process dies while waiting, a new process can rebuild the pending
+operations from the journal and keep waiting on them, instead of starting the work again
+on the server.
+
+"""
+from __future__ import annotations
+
+import enum
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@enum.unique
+class OperationKind(enum.Enum):
+    """The kinds of operations recorded in a journal."""
+
+    EXPERIMENT = "EXPERIMENT"
+    COMPILATION = "COMPILATION"
+    WORKSPACE_EXPORT = "WORKSPACE_EXPORT"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """An operation recorded in a journal.
+
+    Args:
+        kind: The kind of the operation.
+        workspace_id: The ID of the workspace the operation belongs to. None for
+            workspace exports, which are located by 'location' alone.
+        id: The ID of the experiment, model executable or export.
+        location: The location of the status of the operation on the server, for
+            operations that have one.
+        recorded: The time the operation was recorded, in seconds since the epoch.
+
+    """
+
+    kind: OperationKind
+    workspace_id: Optional[str]
+    id: str
+    location: Optional[str] = None
+    recorded: float = 0.0
+
+    @property
+    def key(self) -> Tuple[OperationKind, str]:
+        return self.kind, self.id
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["kind"] = self.kind.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> JournalEntry:
+        return cls(
+            kind=OperationKind(data["kind"]),
+            workspace_id=data.get("workspace_id"),
+            id=data["id"],
+            location=data.get("location"),
+            recorded=data.get("recorded", 0.0),
+        )
+
+
+class OperationJournal:
+    """Journal of pending operations, stored as JSON lines in a file.
+
+    Every change is appended to the file and flushed to disk before returning, so
+    that the journal survives the process being killed. Finished operations are
+    removed from the file the next time a journal is opened on it.
+
+    Args:
+        path: The path of the journal file. Created if it does not exist.
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.operations.journal import OperationJournal
+
+        client = Client(url=impact_url, journal=OperationJournal('operations.jsonl'))
+        workspace.execute(definition).wait()
+
+        # After a restart
+        client = Client(url=impact_url, journal=OperationJournal('operations.jsonl'))
+        for operation in client.resume_operations():
+            operation.wait()
+
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[OperationKind, str], JournalEntry] = {}
+        self._load()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _load(self) -> None:
+        if not os.path.exists(self._path):
+            return
+        lines = 0
+        with open(self._path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                if not line.strip():
+                    continue
+                lines += 1
+                try:
+                    record = json.loads(line)
+                    entry = JournalEntry.from_dict(record["entry"])
+                except (ValueError, KeyError, TypeError):
+                    # A line may be truncated if the process died while writing it
+                    logger.warning(f"Skipping invalid line in journal {self._path}")
+                    continue
+                if record.get("action") == "remove":
+                    self._entries.pop(entry.key, None)
+                else:
+                    self._entries[entry.key] = entry
+        if lines > len(self._entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as journal_file:
+            for entry in self._entries.values():
+                journal_file.write(self._line("add", entry))
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(tmp_path, self._path)
+
+    @staticmethod
+    def _line(action: str, entry: JournalEntry) -> str:
+        return json.dumps({"action": action, "entry": entry.to_dict()}) + "\n"
+
+    def _append(self, action: str, entry: JournalEntry) -> None:
+        with open(self._path, "a", encoding="utf-8") as journal_file:
+            journal_file.write(self._line(action, entry))
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def record(self, entry: JournalEntry) -> None:
+        """Records a pending operation.
+
+        Recording an operation already in the journal does nothing.
+
+        """
+        with self._lock:
+            if entry.key in self._entries:
+                return
+            if not entry.recorded:
+                entry = replace(entry, recorded=time.time())
+            self._append("add", entry)
+            self._entries[entry.key] = entry
+
+    def discard(self, kind: OperationKind, id: str) -> None:
+        """Removes an operation from the journal, if present."""
+        with self._lock:
+            entry = self._entries.pop((kind, id), None)
+            if entry is not None:
+                self._append("remove", entry)
+
+    def entries(self) -> List[JournalEntry]:
+        """Returns the pending operations, in the order they were recorded."""
+        with self._lock:
+            return list(self._entries.values())
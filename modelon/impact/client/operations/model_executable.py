@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from modelon.impact.client import exceptions
 from modelon.impact.client.operations.base import Entity, ExecutionOperation, Status
+from modelon.impact.client.operations.journal import JournalEntry, OperationKind
 
 if TYPE_CHECKING:
     from modelon.impact.client.operations.base import EntityFromOperation
+    from modelon.impact.client.operations.polling import PollingStrategy
     from modelon.impact.client.sal.service import Service
 
 logger = logging.getLogger(__name__)
@@ -92,6 +94,7 @@ class CachedModelExecutableOperation(ExecutionOperation[Entity]):
         self,
         timeout: Optional[float] = None,
         status: Union[Status, tuple[Status, ...]] = (Status.DONE, Status.CANCELLED),
+        polling: Optional[PollingStrategy] = None,
     ) -> Entity:
         """Waits until the operation achieves the set status. Returns the operation
         class instance if the set status is achieved.
@@ -106,6 +109,10 @@ class CachedModelExecutableOperation(ExecutionOperation[Entity]):
                 CachedModelExecutableOperation class is Status.DONE as cached FMU
                 is only available for a successfully compiled model.
 
+            polling:
+                Not used for the CachedModelExecutableOperation class as the
+                status is never requested from the server.
+
         Returns:
 
             Entity class instance if the set status is achieved.
@@ -163,6 +170,12 @@ class ModelExecutableOperation(ExecutionOperation[Entity]):
         """Return the name of operation."""
         return "Compilation"
 
+    def _execution_key(self) -> Optional[Tuple[str, str]]:
+        return ("COMPILATION", self._fmu_id)
+
+    def _journal_entry(self) -> Optional[JournalEntry]:
+        return JournalEntry(OperationKind.COMPILATION, self._workspace_id, self._fmu_id)
+
     def data(self) -> Entity:
         """Returns a new ModelExecutable class instance.
 
@@ -6,6 +6,11 @@ from typing import Any, Dict, List, Optional
 
 from modelon.impact.client import exceptions
 from modelon.impact.client.operations.base import AsyncOperationStatus
+from modelon.impact.client.operations.polling import (
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+from modelon.impact.client.sal import retry_after
 from modelon.impact.client.sal.service import Service
 
 logger = logging.getLogger(__name__)
@@ -72,7 +77,11 @@ class OrphanPublishedWorkspaceOperation:
         """
         return AsyncOperationStatus(self._info()["status"])
 
-    def wait(self, timeout: Optional[float] = None) -> List[str]:
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[str]:
         """Waits until the operation completes. Returns the operation class instance if
         operation completes.
 
@@ -80,6 +89,10 @@ class OrphanPublishedWorkspaceOperation:
             timeout: Time to wait in seconds for achieving the status. By default
                 the timeout is set to 'None', which signifies an infinite time
                 to wait until the status is achieved.
+            polling: The strategy deciding how often the status is requested.
+                Default is None and then the polling strategy of the client is
+                used, see
+                :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
 
         Raises:
             OperationTimeOutError if time exceeds set timeout.
@@ -91,17 +104,21 @@ class OrphanPublishedWorkspaceOperation:
 
         """
         start_t = time.time()
+        schedule = resolve_polling_strategy(polling, self._sal).schedule()
         while True:
-            logger.info(f"{self.name} in progress! Status : {self.status.name}")
-            if self.status.done():
-                logger.info(f"{self.name} completed! Status : {self.status.name}")
+            status = self.status
+            server_hint = retry_after.pop_hint()
+            logger.info(f"{self.name} in progress! Status : {status.name}")
+            if status.done():
+                logger.info(f"{self.name} completed! Status : {status.name}")
                 return self.data()
 
-            current_t = time.time()
-            if timeout and current_t - start_t > timeout:
+            elapsed = time.time() - start_t
+            if timeout and elapsed >= timeout:
                 raise exceptions.OperationTimeOutError(
                     f"Time exceeded the set timeout - {timeout}s! "
-                    f"Present status of operation is {self.status.name}!"
+                    f"Present status of operation is {status.name}!"
                 )
 
-            time.sleep(0.5)
+            remaining = timeout - elapsed if timeout else None
+            time.sleep(schedule.next_interval(server_hint, remaining))
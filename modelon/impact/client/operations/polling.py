@@ -0,0 +1,145 @@
+"""Polling strategies used when waiting for operations."""
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from modelon.impact.client.sal.service import Service
+
+
+class PollingSchedule:
+    """The intervals between the status requests of a single wait, created by
+    :obj:`PollingStrategy.schedule`."""
+
+    def __init__(self, strategy: PollingStrategy, rng: random.Random):
+        self._strategy = strategy
+        self._rng = rng
+        self._interval = strategy.initial_interval
+
+    def next_interval(
+        self, server_hint: Optional[float] = None, remaining: Optional[float] = None
+    ) -> float:
+        """Returns the time in seconds to sleep before the next status request.
+
+        Args:
+            server_hint: Minimum delay in seconds requested by the server, for
+                example through a 'Retry-After' header. Ignored if the strategy
+                does not use server hints.
+            remaining: Time in seconds left until the wait times out. The
+                interval never exceeds it, so that the status is checked a last
+                time when the timeout is reached.
+
+        """
+        strategy = self._strategy
+        interval = self._interval
+        self._interval = min(interval * strategy.multiplier, strategy.max_interval)
+        if strategy.jitter:
+            spread = interval * strategy.jitter
+            interval = self._rng.uniform(interval - spread, interval + spread)
+            interval = min(max(interval, 0.0), strategy.max_interval)
+        if strategy.use_server_hints and server_hint is not None:
+            interval = max(interval, server_hint)
+        if remaining is not None:
+            interval = min(interval, max(remaining, 0.0))
+        return interval
+
+
+class PollingStrategy:
+    """Strategy deciding how often the status of an operation is requested while waiting
+    for it.
+
+    The interval between status requests starts at 'initial_interval' and is
+    multiplied by 'multiplier' after every request, up to 'max_interval'. Short
+    operations are thereby detected as done quickly while long running operations,
+    such as experiments running for hours, only cause a few status requests per
+    minute.
+
+    Args:
+        initial_interval: Time in seconds to sleep after the first status request.
+            Default: 0.5
+        max_interval: Maximum time in seconds to sleep between status requests.
+            Default: 10.0
+        multiplier: Factor the interval grows by after every status request. Use
+            1.0 for a fixed interval. Default: 1.5
+        jitter: Fraction of the interval to randomly add or subtract, so that many
+            clients waiting for operations don't poll in lockstep. Default: 0.1
+        use_server_hints: If True, a 'Retry-After' header in a status response is
+            used as the minimum time to sleep before the next request.
+            Default: True
+        seed: Seed for the random jitter. Default is None, meaning random jitter.
+
+    Example::
+
+        from modelon.impact.client.operations.polling import PollingStrategy
+
+        # Per call
+        workspace.execute(definition).wait(polling=PollingStrategy(max_interval=30))
+
+        # Per client
+        client = Client(url=impact_url, polling=PollingStrategy(max_interval=30))
+
+        # Fixed interval, as in earlier versions
+        operation.wait(polling=PollingStrategy.fixed(0.5))
+
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+        use_server_hints: bool = True,
+        seed: Optional[int] = None,
+    ):
+        if initial_interval < 0 or max_interval < initial_interval:
+            raise ValueError(
+                "Polling intervals must satisfy 0 <= initial_interval <= max_interval"
+            )
+        if multiplier < 1.0:
+            raise ValueError("The polling interval multiplier must be at least 1.0")
+        if not 0.0 <= jitter < 1.0:
+            raise ValueError("The polling jitter must be in the range [0, 1)")
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.use_server_hints = use_server_hints
+        self._seed = seed
+
+    def __repr__(self) -> str:
+        return (
+            f"PollingStrategy(initial_interval={self.initial_interval}, "
+            f"max_interval={self.max_interval}, multiplier={self.multiplier}, "
+            f"jitter={self.jitter}, use_server_hints={self.use_server_hints})"
+        )
+
+    @classmethod
+    def fixed(cls, interval: float) -> PollingStrategy:
+        """Returns a strategy polling at a fixed interval without jitter."""
+        return cls(
+            initial_interval=interval,
+            max_interval=interval,
+            multiplier=1.0,
+            jitter=0.0,
+        )
+
+    def schedule(self) -> PollingSchedule:
+        """Returns a new schedule of intervals for a single wait."""
+        return PollingSchedule(self, random.Random(self._seed))
+
+
+DEFAULT_POLLING = PollingStrategy()
+
+
+def resolve_polling_strategy(
+    polling: Optional[PollingStrategy], service: Service
+) -> PollingStrategy:
+    """Returns the given polling strategy, or else the polling strategy configured for
+    the client owning the service, or else the default polling strategy."""
+    if polling is not None:
+        return polling
+    if service.polling is not None:
+        return service.polling
+    return DEFAULT_POLLING
@@ -0,0 +1,388 @@
+"""Scheduling the submission of many experiments and compilations.
+
+Submitting hundreds of experiments at once floods the queue of the server. A
+:obj:`SubmissionScheduler` instead holds the experiments and compilations back on the
+client and submits them as earlier ones complete, keeping a bounded number of them in
+flight at any time.
+
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections import Counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from modelon.impact.client import exceptions
+from modelon.impact.client.operations.base import BaseOperation
+from modelon.impact.client.operations.polling import (
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+from modelon.impact.client.operations.waiter import _execution_key, _is_finished
+from modelon.impact.client.sal import retry_after
+
+if TYPE_CHECKING:
+    from modelon.impact.client.entities.model import Model
+    from modelon.impact.client.entities.workspace import ExperimentDefinition, Workspace
+
+logger = logging.getLogger(__name__)
+
+_RUNNING = "running"
+
+
+class ScheduledJob:
+    """An experiment execution or compilation scheduled for submission by a
+    :obj:`SubmissionScheduler`.
+
+    The times are in seconds since the epoch, and None until they have happened. The
+    start of a job is observed through the executions listed by the server, so it stays
+    None for jobs completing before the server listed them as running.
+
+    """
+
+    def __init__(
+        self,
+        workspace_id: str,
+        submit: Callable[[], BaseOperation],
+        service: Any,
+        priority: int,
+    ):
+        self.workspace_id = workspace_id
+        self.priority = priority
+        self.operation: Optional[BaseOperation] = None
+        self.error: Optional[Exception] = None
+        self.scheduled_at = time.time()
+        self.submitted_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._submit = submit
+        self._service = service
+
+    def __repr__(self) -> str:
+        return (
+            f"ScheduledJob(workspace_id='{self.workspace_id}', "
+            f"priority={self.priority}, operation={self.operation!r})"
+        )
+
+    def done(self) -> bool:
+        """Returns True if the job has completed or failed to be submitted."""
+        return self.finished_at is not None
+
+    def result(self) -> Any:
+        """Returns the entity of the completed operation, for example an Experiment
+        class instance. Raises the error if the job failed to be submitted.
+
+        Raises:
+            OperationNotCompleteError if the job has not completed.
+
+        """
+        if self.error is not None:
+            raise self.error
+        if self.operation is None or not self.done():
+            raise exceptions.OperationNotCompleteError(
+                f"The job {self!r} has not completed"
+            )
+        return self.operation.data()
+
+    @property
+    def queue_time(self) -> Optional[float]:
+        """Time in seconds from the job being scheduled until it started running on the
+        server, including the time held back by the scheduler."""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.scheduled_at
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Time in seconds the job was running on the server."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class SubmissionScheduler:
+    """Submits experiments and compilations while keeping a bounded number of them in
+    flight.
+
+    Scheduled jobs are submitted in order of priority when the scheduler is run,
+    then polled in a single loop through the bulk executions endpoint of the server,
+    as in :obj:`~modelon.impact.client.operations.waiter.as_completed`. A new job is
+    only submitted when it fits within all of the limits.
+
+    Args:
+        max_in_flight: Maximum number of submitted jobs that have not completed.
+            Default: 10
+        max_in_flight_per_workspace: Maximum number of submitted jobs that have
+            not completed in a single workspace. Default is None, meaning only
+            'max_in_flight' applies.
+        max_queued: Maximum number of executions waiting in the queue of the
+            server, including executions not submitted by the scheduler. No jobs
+            are submitted while the queue of the server is longer. Default is None,
+            meaning the queue of the server is not considered.
+        polling: The strategy deciding how often the executions are requested.
+            Default is None and then the polling strategy of the client is used,
+            see :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+
+    Example::
+
+        from modelon.impact.client import SubmissionScheduler
+
+        scheduler = SubmissionScheduler(max_in_flight=20, max_queued=5)
+        for definition in definitions:
+            scheduler.execute(workspace, definition)
+        scheduler.compile(model, compiler_options, priority=1)
+
+        for job in scheduler.as_completed():
+            print(job.operation, job.queue_time, job.run_time)
+
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 10,
+        max_in_flight_per_workspace: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        polling: Optional[PollingStrategy] = None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("The scheduler must allow at least one job in flight")
+        if max_in_flight_per_workspace is not None and max_in_flight_per_workspace < 1:
+            raise ValueError(
+                "The scheduler must allow at least one job in flight per workspace"
+            )
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_workspace = max_in_flight_per_workspace
+        self.max_queued = max_queued
+        self._polling = polling
+        self._counter = itertools.count()
+        self._scheduled: List[Tuple[int, int, ScheduledJob]] = []
+        self._in_flight: List[ScheduledJob] = []
+
+    def _schedule(
+        self,
+        workspace_id: str,
+        submit: Callable[[], BaseOperation],
+        service: Any,
+        priority: int,
+    ) -> ScheduledJob:
+        job = ScheduledJob(workspace_id, submit, service, priority)
+        self._scheduled.append((-priority, next(self._counter), job))
+        self._scheduled.sort(key=lambda entry: entry[:2])
+        return job
+
+    def execute(
+        self,
+        workspace: Workspace,
+        definition: ExperimentDefinition,
+        user_data: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+    ) -> ScheduledJob:
+        """Schedules executing an experiment, see
+        :obj:`~modelon.impact.client.entities.workspace.Workspace.execute`.
+
+        Args:
+            workspace: The workspace to execute the experiment in.
+            definition: The experiment definition.
+            user_data: Optional dictionary object with custom data to attach to the
+                experiment.
+            priority: Jobs with a higher priority are submitted first. Jobs with
+                the same priority are submitted in the order they were scheduled.
+                Default: 0
+
+        Returns:
+            The scheduled job.
+
+        """
+        return self._schedule(
+            workspace.id,
+            lambda: workspace.execute(definition, user_data),
+            getattr(workspace, "_sal", None),
+            priority,
+        )
+
+    def compile(
+        self, model: Model, *args: Any, priority: int = 0, **kwargs: Any
+    ) -> ScheduledJob:
+        """Schedules compiling a model, see
+        :obj:`~modelon.impact.client.entities.model.Model.compile`. Takes the same
+        arguments as 'compile' and a priority.
+
+        Args:
+            model: The model to compile.
+            priority: Jobs with a higher priority are submitted first. Jobs with
+                the same priority are submitted in the order they were scheduled.
+                Default: 0
+
+        Returns:
+            The scheduled job.
+
+        """
+        return self._schedule(
+            getattr(model, "_workspace_id"),
+            lambda: model.compile(*args, **kwargs),
+            getattr(model, "_sal", None),
+            priority,
+        )
+
+    def _poll_executions(self) -> Tuple[Dict[int, Set[Any]], int]:
+        """Returns the keys of the running executions per service and the number of
+        executions queued on the servers, requesting the executions once per service."""
+        services = {id(job._service): job._service for job in self._in_flight}
+        if self.max_queued is not None:
+            services.update(
+                (id(job._service), job._service) for _, _, job in self._scheduled
+            )
+        active: Dict[int, Set[Any]] = {}
+        queued = 0
+        now = time.time()
+        for service_id, service in services.items():
+            items = service.get_executions()["data"]["items"]
+            active[service_id] = {_execution_key(item) for item in items}
+            running = {
+                _execution_key(item) for item in items if item["status"] == _RUNNING
+            }
+            queued += len(items) - len(running)
+            for job in self._in_flight:
+                if (
+                    job.started_at is None
+                    and id(job._service) == service_id
+                    and job.operation is not None
+                    and job.operation._execution_key() in running
+                ):
+                    job.started_at = now
+        return active, queued
+
+    def _complete_finished(self, active: Dict[int, Set[Any]]) -> List[ScheduledJob]:
+        finished = []
+        for job in self._in_flight:
+            assert job.operation is not None
+            if _is_finished(job.operation, active):
+                job.finished_at = time.time()
+                logger.info(
+                    f"{job.operation.name} completed for {job.operation!r}, "
+                    f"queue time: {job.queue_time}, run time: {job.run_time}"
+                )
+                finished.append(job)
+        self._in_flight = [job for job in self._in_flight if not job.done()]
+        return finished
+
+    def _submit_scheduled(self, queued: int) -> List[ScheduledJob]:
+        """Submits the scheduled jobs fitting within the limits, returning the jobs that
+        failed to be submitted."""
+        failed = []
+        per_workspace = Counter(job.workspace_id for job in self._in_flight)
+        still_scheduled = []
+        for entry in self._scheduled:
+            job = entry[2]
+            if (
+                len(self._in_flight) >= self.max_in_flight
+                or (self.max_queued is not None and queued >= self.max_queued)
+                or (
+                    self.max_in_flight_per_workspace is not None
+                    and per_workspace[job.workspace_id]
+                    >= self.max_in_flight_per_workspace
+                )
+            ):
+                still_scheduled.append(entry)
+                continue
+            job.submitted_at = time.time()
+            try:
+                job.operation = job._submit()
+            except Exception as exce:
+                logger.warning(f"Failed submitting {job!r}: {exce}")
+                job.error = exce
+                job.finished_at = time.time()
+                failed.append(job)
+                continue
+            self._in_flight.append(job)
+            per_workspace[job.workspace_id] += 1
+            queued += 1
+        self._scheduled = still_scheduled
+        return failed
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[ScheduledJob]:
+        """Submits the scheduled jobs within the limits and yields them as they
+        complete, until all jobs have completed.
+
+        Jobs failing to be submitted are yielded with the error set, see
+        :obj:`ScheduledJob.result`. Jobs can be scheduled while iterating.
+
+        Args:
+            timeout: Time to wait in seconds for all jobs to complete. By default
+                the timeout is set to 'None', which signifies an infinite time to
+                wait.
+
+        Yields:
+            The jobs, as they complete.
+
+        Raises:
+            OperationTimeOutError if the jobs have not all completed before the
+            timeout.
+
+        """
+        start_t = time.time()
+        schedule = None
+        while self._scheduled or self._in_flight:
+            if schedule is None:
+                jobs = self._in_flight + [entry[2] for entry in self._scheduled]
+                strategy = resolve_polling_strategy(self._polling, jobs[0]._service)
+                schedule = strategy.schedule()
+            if self._in_flight or self.max_queued is not None:
+                active, queued = self._poll_executions()
+            else:
+                active, queued = {}, 0
+            server_hint = retry_after.pop_hint()
+            yield from self._complete_finished(active)
+            yield from self._submit_scheduled(queued)
+            if not self._scheduled and not self._in_flight:
+                return
+            logger.info(
+                f"{len(self._in_flight)} jobs in flight, "
+                f"{len(self._scheduled)} jobs scheduled"
+            )
+
+            elapsed = time.time() - start_t
+            if timeout and elapsed >= timeout:
+                raise exceptions.OperationTimeOutError(
+                    current_status_name=(
+                        f"{len(self._in_flight) + len(self._scheduled)} jobs "
+                        "not completed"
+                    ),
+                    timeout=timeout,
+                )
+
+            remaining = timeout - elapsed if timeout else None
+            time.sleep(schedule.next_interval(server_hint, remaining))
+
+    def run(self, timeout: Optional[float] = None) -> List[ScheduledJob]:
+        """Submits the scheduled jobs within the limits and waits until all have
+        completed. Returns the jobs in order of completion.
+
+        Args:
+            timeout: Time to wait in seconds for all jobs to complete. By default
+                the timeout is set to 'None', which signifies an infinite time to
+                wait.
+
+        Raises:
+            OperationTimeOutError if the jobs have not all completed before the
+            timeout.
+
+        Example::
+
+            jobs = scheduler.run(timeout=3600)
+            experiments = [job.result() for job in jobs]
+
+        """
+        return list(self.as_completed(timeout=timeout))
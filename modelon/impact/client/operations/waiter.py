@@ -0,0 +1,171 @@
+"""Waiting for many operations at once.
+
+Waiting for each operation in turn makes every operation poll its own status endpoint.
+The functions in this module instead poll all operations in a single loop, checking the
+executions and compilations through the bulk executions endpoint of the server. Only
+operations that are no longer listed as active have their own status requested, once, to
+confirm that they are done.
+
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from modelon.impact.client import exceptions
+from modelon.impact.client.operations.base import (
+    AsyncOperationStatus,
+    BaseOperation,
+    Status,
+)
+from modelon.impact.client.operations.polling import (
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+from modelon.impact.client.sal import retry_after
+
+logger = logging.getLogger(__name__)
+
+_FINAL_STATUSES = (Status.DONE, Status.CANCELLED)
+
+
+def _execution_key(execution: Dict[str, Any]) -> Tuple[str, str]:
+    kind = execution["kind"]
+    entity = execution["fmu"] if kind == "COMPILATION" else execution["experiment"]
+    return kind, entity["id"]
+
+
+def _active_executions(operations: List[BaseOperation]) -> Dict[int, Set[Any]]:
+    """Returns the keys of the active executions for each service used by the
+    operations, requesting the executions once per service."""
+    active: Dict[int, Set[Any]] = {}
+    for operation in operations:
+        if operation._execution_key() is None:
+            continue
+        service = getattr(operation, "_sal")
+        if id(service) not in active:
+            items = service.get_executions()["data"]["items"]
+            active[id(service)] = {_execution_key(item) for item in items}
+    return active
+
+
+def _is_finished(operation: BaseOperation, active: Dict[int, Set[Any]]) -> bool:
+    key = operation._execution_key()
+    if key is not None and key in active.get(id(getattr(operation, "_sal")), ()):
+        return False
+    status = operation.status
+    if isinstance(status, AsyncOperationStatus):
+        finished = status.done()
+    else:
+        finished = status in _FINAL_STATUSES
+    if finished:
+        operation._discard_from_journal()
+    return finished
+
+
+def as_completed(
+    operations: Iterable[BaseOperation],
+    timeout: Optional[float] = None,
+    polling: Optional[PollingStrategy] = None,
+) -> Iterator[BaseOperation]:
+    """Yields the operations as they complete, in order of completion.
+
+    Experiments and compilations are considered completed when they are done or
+    cancelled, other operations when their status is done.
+
+    Args:
+        operations: The operations to wait for.
+        timeout: Time to wait in seconds for all operations to complete. By
+            default the timeout is set to 'None', which signifies an infinite time
+            to wait.
+        polling: The strategy deciding how often the statuses are requested.
+            Default is None and then the polling strategy of the client is used,
+            see :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+
+    Yields:
+        The operations, as they complete.
+
+    Raises:
+        OperationTimeOutError if the operations have not all completed before the
+        timeout.
+
+    Example::
+
+        from modelon.impact.client import as_completed
+
+        operations = [workspace.execute(definition) for definition in definitions]
+        for operation in as_completed(operations, timeout=3600):
+            experiment = operation.data()
+            print(experiment.id, experiment.is_successful())
+
+    """
+    pending = list(operations)
+    if not pending:
+        return
+    start_t = time.time()
+    service = pending[0]._sal
+    schedule = resolve_polling_strategy(polling, service).schedule()
+    while True:
+        active = _active_executions(pending)
+        server_hint = retry_after.pop_hint()
+        still_pending = []
+        for operation in pending:
+            if _is_finished(operation, active):
+                logger.info(f"{operation.name} completed for {operation!r}")
+                yield operation
+            else:
+                still_pending.append(operation)
+        pending = still_pending
+        if not pending:
+            return
+        logger.info(f"Waiting for {len(pending)} operations to complete")
+
+        elapsed = time.time() - start_t
+        if timeout and elapsed >= timeout:
+            raise exceptions.OperationTimeOutError(
+                current_status_name=f"{len(pending)} operations not completed",
+                timeout=timeout,
+            )
+
+        remaining = timeout - elapsed if timeout else None
+        time.sleep(schedule.next_interval(server_hint, remaining))
+
+
+def wait_all(
+    operations: Iterable[BaseOperation],
+    timeout: Optional[float] = None,
+    polling: Optional[PollingStrategy] = None,
+) -> List[Any]:
+    """Waits until all operations complete. Returns the entities of the operations, in
+    the order the operations were given.
+
+    Args:
+        operations: The operations to wait for.
+        timeout: Time to wait in seconds for all operations to complete. By
+            default the timeout is set to 'None', which signifies an infinite time
+            to wait.
+        polling: The strategy deciding how often the statuses are requested.
+            Default is None and then the polling strategy of the client is used,
+            see :obj:`~modelon.impact.client.operations.polling.PollingStrategy`.
+
+    Returns:
+        A list with the entity of each operation, for example the Experiment class
+        instance of an experiment operation.
+
+    Raises:
+        OperationTimeOutError if the operations have not all completed before the
+        timeout.
+
+    Example::
+
+        from modelon.impact.client import wait_all
+
+        operations = [workspace.execute(definition) for definition in definitions]
+        experiments = wait_all(operations, timeout=3600)
+
+    """
+    operations = list(operations)
+    for _ in as_completed(operations, timeout=timeout, polling=polling):
+        pass
+    return [operation.data() for operation in operations]
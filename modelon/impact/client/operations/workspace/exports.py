@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from modelon.impact.client import exceptions
 from modelon.impact.client.operations.base import (
@@ -10,6 +10,7 @@ from modelon.impact.client.operations.base import (
     BaseOperation,
     Entity,
 )
+from modelon.impact.client.operations.journal import JournalEntry, OperationKind
 
 if TYPE_CHECKING:
     from modelon.impact.client.operations.base import EntityFromOperation
@@ -29,6 +30,8 @@ class Export:
 
     def download_as(self, path_to_download: str) -> str:
         """Writes the binary archive to a file. Returns the path to downloaded archive.
+        The archive is streamed to disk in chunks and is never held in memory as a
+        whole.
 
         Args:
             path_to_download: The path to store the downloaded workspace.
@@ -42,10 +45,8 @@ class Export:
             path = workspace.export().wait().download_as('workspace.zip')
 
         """
-        data = self._export_sal.export_download(self._download_uri)
         os.makedirs(os.path.dirname(path_to_download), exist_ok=True)
-        with open(path_to_download, "wb") as f:
-            f.write(data)
+        self._export_sal.export_download_to(self._download_uri, path_to_download)
         return path_to_download
 
     @classmethod
@@ -83,6 +84,11 @@ class WorkspaceExportOperation(AsyncOperation[Entity]):
         """Return the name of operation."""
         return "Workspace export"
 
+    def _journal_entry(self) -> Optional[JournalEntry]:
+        return JournalEntry(
+            OperationKind.WORKSPACE_EXPORT, None, self.id, location=self._location
+        )
+
     def _info(self) -> Dict[str, Any]:
         return self._sal.exports.get_export_status(self._location)["data"]
 
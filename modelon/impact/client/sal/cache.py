@@ -0,0 +1,224 @@
+"""Conditional GET response cache class."""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from modelon.impact.client.sal.codec import JSONCodec
+from modelon.impact.client.sal.response import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+DEFAULT_MAX_ENTRIES = 256
+"""Default maximum number of responses kept by a response cache."""
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    body: bytes
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, codec: Optional[JSONCodec] = None) -> JSONResponse:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = self.url
+        resp.headers = CaseInsensitiveDict(self.headers)
+        resp._content = self.body
+        return JSONResponse(resp, codec)
+
+
+class ResponseCache:
+    """Caches JSON GET responses together with their ETag and Last-Modified validators.
+
+    When a response for the same URL, query parameters and Accept header is in
+    the cache, the request is sent as a conditional request. If the server
+    answers '304 Not Modified' the cached body is used instead of downloading
+    the full payload again. Only responses with a validator are cached.
+
+    The cache holds at most max_entries responses and evicts the least
+    recently used response when full. If a directory is given, responses are
+    also persisted there and loaded again when a new cache is created for the
+    same directory.
+
+    Args:
+        max_entries: The maximum number of responses kept in the cache.
+        directory: Optional directory to persist the cached responses in.
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.sal.cache import ResponseCache
+        from modelon.impact.client.sal.context import Context
+
+        cache = ResponseCache(max_entries=512, directory='~/.impact/cache')
+        client = Client(url=impact_url, context=Context(response_cache=cache))
+        ...
+        print(cache.hits, cache.misses)
+
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, directory: Optional[str] = None
+    ):
+        self._max_entries = max_entries
+        self._directory = os.path.expanduser(directory) if directory else None
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if self._directory:
+            os.makedirs(self._directory, exist_ok=True)
+            self._load()
+
+    @property
+    def hits(self) -> int:
+        """Number of requests answered with '304 Not Modified' and served from the
+        cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of requests where the full response was downloaded."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of hits, misses and cached responses."""
+        return {"hits": self._hits, "misses": self._misses, "size": len(self)}
+
+    def clear(self) -> None:
+        """Removes all cached responses and resets the counters."""
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+        for key in keys:
+            self._remove_file(key)
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> CacheKey:
+        accept = (headers or {}).get("Accept", "application/json")
+        query = json.dumps(sorted((params or {}).items()), default=str)
+        return url, query, accept
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def store(self, key: CacheKey, resp: JSONResponse) -> None:
+        """Counts a miss and caches the response if it has a validator."""
+        with self._lock:
+            self._misses += 1
+        headers = resp.headers
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not resp.ok or not (etag or last_modified):
+            return
+        entry = CacheEntry(
+            url=key[0],
+            etag=etag,
+            last_modified=last_modified,
+            headers={"content-type": headers.get("content-type", "application/json")},
+            body=resp._resp_obj.content,
+        )
+        self._put(key, entry)
+        self._write_file(key, entry)
+
+    def _put(self, key: CacheKey, entry: CacheEntry) -> None:
+        evicted = []
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+        for evicted_key in evicted:
+            self._remove_file(evicted_key)
+
+    def _file_path(self, key: CacheKey) -> Optional[str]:
+        if not self._directory:
+            return None
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self._directory, f"{digest}.json")
+
+    def _write_file(self, key: CacheKey, entry: CacheEntry) -> None:
+        path = self._file_path(key)
+        if path is None:
+            return
+        data = {
+            "key": list(key),
+            "etag": entry.etag,
+            "lastModified": entry.last_modified,
+            "headers": entry.headers,
+            "body": entry.body.decode("utf-8"),
+        }
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning(f"Could not persist cached response to {path}")
+
+    def _remove_file(self, key: CacheKey) -> None:
+        path = self._file_path(key)
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def _cache_files(self) -> Iterable[str]:
+        assert self._directory is not None
+        paths = [
+            os.path.join(self._directory, name)
+            for name in os.listdir(self._directory)
+            if name.endswith(".json")
+        ]
+        return sorted(paths, key=os.path.getmtime)
+
+    def _load(self) -> None:
+        for path in self._cache_files():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                key: CacheKey = tuple(data["key"])  # type: ignore
+                entry = CacheEntry(
+                    url=key[0],
+                    etag=data["etag"],
+                    last_modified=data["lastModified"],
+                    headers=data["headers"],
+                    body=data["body"].encode("utf-8"),
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning(f"Ignoring invalid cached response {path}")
+                continue
+            self._put(key, entry)
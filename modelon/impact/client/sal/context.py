@@ -1,7 +1,124 @@
 """Context class."""
+from typing import Optional
+
 from requests import Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+
+from modelon.impact.client.sal.cache import ResponseCache
+from modelon.impact.client.sal.codec import JSONCodec
+from modelon.impact.client.sal.metrics import MetricsRegistry
+from modelon.impact.client.sal.rate_limit import RateLimiter
+from modelon.impact.client.sal.retry import RetryPolicy
+from modelon.impact.client.sal.single_flight import SingleFlight
+from modelon.impact.client.sal.trajectory_cache import TrajectoryCache
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 300.0
 
 
 class Context:
-    def __init__(self) -> None:
+    """Holds the HTTP session shared by all requests sent to the Modelon Impact server.
+
+    All requests done using the same context reuse the connections kept in the
+    connection pool of the session instead of opening a new TCP/TLS connection
+    for every request.
+
+    Args:
+        pool_connections: The number of per host connection pools to cache.
+            Default: 10.
+        pool_maxsize: The maximum number of connections to keep alive per host.
+            Should be at least the number of threads sending requests
+            concurrently to the server. Default: 10.
+        pool_block: If True, a request waits for a free connection when all
+            connections to a host are in use. If False, an extra connection is
+            opened and discarded after use. Default: False.
+        keep_alive: If False, the server is asked to close the connection after
+            each response and no connection is reused. Default: True.
+        response_cache: Optional cache for JSON GET responses. If given, requests
+            for cached responses are sent as conditional requests and the
+            cached body is used when the server answers '304 Not Modified'.
+            Default: None.
+        coalesce_requests: If True, identical JSON GET requests sent concurrently
+            from several threads share one request to the server. The number of
+            requests saved is available as 'context.single_flight.saved'.
+            Default: False.
+        json_codec: The codec used to encode JSON request bodies and decode JSON
+            responses. Use
+            :obj:`~modelon.impact.client.sal.codec.fastest_available_codec` to
+            use 'orjson' when it is installed. Default: None, meaning the
+            'json' module from the standard library is used.
+        metrics: Optional registry recording per endpoint metrics, such as latency
+            and transferred bytes, for every request. Default: None, meaning no
+            metrics are recorded.
+        rate_limiter: Optional rate limiter for all requests sent using the
+            context, from any thread or client, see
+            :obj:`~modelon.impact.client.sal.rate_limit.RateLimiter`. The
+            limiter backs off when the server answers '429 Too Many Requests' or
+            '503 Service Unavailable'. Default: None, meaning requests are not
+            rate limited.
+        retry_policy: Optional policy for retrying requests failing because of
+            connection errors or '502', '503' and '504' responses, see
+            :obj:`~modelon.impact.client.sal.retry.RetryPolicy`. Default: None,
+            meaning failed requests are not retried.
+        connect_timeout: Time in seconds to wait for a connection to the server
+            to be established. None waits forever. Default: 10.0.
+        read_timeout: Time in seconds to wait for the server to send data, both
+            before the first byte of a response and between the bytes of a
+            streamed response. None waits forever. Default: 300.0. Both
+            timeouts are capped to the time remaining until the deadline set
+            with :obj:`~modelon.impact.client.sal.deadline.deadline`.
+        trajectory_cache: Optional persistent cache for the trajectories of
+            finished cases, see
+            :obj:`~modelon.impact.client.sal.trajectory_cache.TrajectoryCache`.
+            Default: None, meaning trajectories are fetched from the server
+            every time.
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.sal.context import Context
+
+        context = Context(pool_maxsize=32, pool_block=True)
+        client = Client(url=impact_url, context=context)
+
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        trajectory_cache: Optional[TrajectoryCache] = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.response_cache = response_cache
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.json_codec = json_codec if json_codec else JSONCodec()
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.trajectory_cache = trajectory_cache
         self.session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
@@ -0,0 +1,93 @@
+"""Deadlines bounding the time spent on requests to the server.
+
+A deadline is set for a block of code with :obj:`deadline` and applies to every request
+sent from within it, including requests sent from threads started by the client, as
+the deadline is kept in a context variable. The timeout of each request is capped to
+the time remaining until the deadline, so that a call stuck on a half-open connection
+fails when the deadline has passed instead of hanging.
+
+"""
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+from modelon.impact.client.sal.exceptions import DeadlineExceededError
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "impact_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Sets a deadline 'seconds' from now for all requests sent from within the block.
+
+    Nested deadlines never extend an outer deadline, the earliest deadline applies.
+    Requests sent after the deadline has passed raise
+    :obj:`~modelon.impact.client.sal.exceptions.DeadlineExceededError`.
+
+    Args:
+        seconds: Time in seconds until the deadline. None sets no deadline, keeping
+            any outer deadline.
+
+    Example::
+
+        from modelon.impact.client.sal.deadline import deadline
+
+        with deadline(30):
+            trajectories = experiment.get_trajectories(['h', 'time'])
+
+    """
+    if seconds is None:
+        yield
+        return
+    at = time.monotonic() + max(seconds, 0.0)
+    outer = _deadline.get()
+    token = _deadline.set(at if outer is None else min(at, outer))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Returns the time in seconds until the current deadline, never negative, or None
+    if no deadline is set."""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return max(at - time.monotonic(), 0.0)
+
+
+def expired() -> bool:
+    """Returns True if a deadline is set and has passed."""
+    return remaining() == 0.0
+
+
+def check() -> None:
+    """Raises DeadlineExceededError if the current deadline has passed."""
+    if expired():
+        raise DeadlineExceededError("The deadline for the request has passed")
+
+
+def limit(timeout: Optional[float]) -> Optional[float]:
+    """Returns the timeout capped to the time remaining until the current deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    return left if timeout is None else min(timeout, left)
+
+
+def request_timeout(
+    connect_timeout: Optional[float], read_timeout: Optional[float]
+) -> Optional[Tuple[Optional[float], Optional[float]]]:
+    """Returns the '(connect, read)' timeout to pass to 'requests', with both capped to
+    the time remaining until the current deadline, or None if there is no timeout at
+    all."""
+    connect, read = limit(connect_timeout), limit(read_timeout)
+    if connect is None and read is None:
+        return None
+    return connect, read
@@ -0,0 +1,255 @@
+"""Parallel ranged download class."""
+import contextvars
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.response import FileResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+"""Default number of bytes fetched by each range request."""
+
+DEFAULT_MAX_WORKERS = 4
+"""Default number of range requests sent concurrently."""
+
+RangeFetcher = Callable[[Optional[str]], FileResponse]
+"""Callable sending a streamed GET request with the given 'Range' header value, or
+without a 'Range' header if given None."""
+
+_RANGE_NOT_SATISFIABLE = 416
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+)")
+
+
+def _parse_content_range(resp: FileResponse) -> Optional[Tuple[int, int, int]]:
+    if resp.status_code != 206:
+        return None
+    match = _CONTENT_RANGE_PATTERN.match(resp.headers.get("content-range", ""))
+    if match is None:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), int(total)
+
+
+def _validator(resp: FileResponse) -> Optional[str]:
+    return resp.headers.get("etag") or resp.headers.get("last-modified")
+
+
+class RangedDownload:
+    """Downloads a file to disk using concurrent HTTP range requests.
+
+    The first missing part is fetched with a single range request. If the server
+    does not answer with partial content the whole body of that response is
+    streamed to disk instead. Otherwise the remaining parts are fetched
+    concurrently on a thread pool and written at their offsets in the file.
+
+    The whole file is downloaded with a request without a range if the server
+    answers the first range request with another range than the one requested,
+    or answers that the range is not satisfiable, as for an empty file or a file
+    that shrank since an interrupted download.
+
+    Data is written to '<path>.part' and progress is recorded in a
+    '<path>.part.progress' sidecar file. If a download is interrupted, running it
+    again for the same path only fetches the parts that are missing, as long as
+    the size and validator (ETag or Last-Modified) of the file on the server are
+    unchanged. The part file is renamed to path once all parts are written.
+
+    Args:
+        fetch: Callable sending a streamed GET request for the file with the given
+            'Range' header value, or without a 'Range' header if given None.
+        path: The local path to download the file to.
+        part_size: Number of bytes fetched by each range request.
+        max_workers: Number of range requests sent concurrently.
+
+    """
+
+    def __init__(
+        self,
+        fetch: RangeFetcher,
+        path: "os.PathLike[str] | str",
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self._fetch = fetch
+        self._path = os.fspath(path)
+        self._part_path = self._path + ".part"
+        self._progress_path = self._part_path + ".progress"
+        self._part_size = part_size
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+
+    @property
+    def progress_path(self) -> str:
+        return self._progress_path
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self._progress_path) or not os.path.exists(
+            self._part_path
+        ):
+            return None
+        try:
+            with open(self._progress_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("partSize") != self._part_size:
+            return None
+        return state
+
+    def _save_state(self) -> None:
+        tmp_path = self._progress_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self._progress_path)
+
+    def _missing_parts(self) -> List[int]:
+        n_parts = -(-self._state["size"] // self._part_size)
+        completed = set(self._state["completed"])
+        return [i for i in range(n_parts) if i not in completed]
+
+    def _range(self, index: int, size: int) -> Tuple[int, int]:
+        start = index * self._part_size
+        return start, min(start + self._part_size, size) - 1
+
+    def _write_part(self, resp: FileResponse, index: int, start: int, end: int) -> None:
+        written = 0
+        try:
+            with open(self._part_path, "r+b") as f:
+                f.seek(start)
+                for chunk in resp.iter_content():
+                    f.write(chunk)
+                    written += len(chunk)
+        finally:
+            resp.close()
+        if written != end - start + 1:
+            raise exceptions.CommunicationError(
+                f"Incomplete range response, expected {end - start + 1} bytes "
+                f"starting at {start} but got {written}"
+            )
+        with self._lock:
+            self._state["completed"].append(index)
+            self._save_state()
+
+    def _fetch_part(self, index: int) -> None:
+        start, end = self._range(index, self._state["size"])
+        resp = self._fetch(f"bytes={start}-{end}")
+        content_range = _parse_content_range(resp)
+        if content_range is None or content_range[:2] != (start, end):
+            raise exceptions.CommunicationError(
+                f"Expected partial content for bytes {start}-{end}, "
+                f"got status {resp.status_code}"
+            )
+        self._write_part(resp, index, start, end)
+
+    def _reset(self, size: int, validator: Optional[str]) -> None:
+        self._state = {
+            "size": size,
+            "partSize": self._part_size,
+            "validator": validator,
+            "completed": [],
+        }
+        with open(self._part_path, "wb") as f:
+            f.truncate(size)
+        self._save_state()
+
+    def _finish(self) -> None:
+        os.replace(self._part_path, self._path)
+        if os.path.exists(self._progress_path):
+            os.remove(self._progress_path)
+
+    def _discard_part(self) -> None:
+        for path in (self._progress_path, self._part_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _download_whole(self, resp: FileResponse) -> FileResponse:
+        """Streams the whole body of the response to the file, discarding any progress
+        of an earlier download."""
+        if os.path.exists(self._progress_path):
+            os.remove(self._progress_path)
+        resp.write_to(self._part_path)
+        os.replace(self._part_path, self._path)
+        return resp
+
+    def run(self) -> FileResponse:
+        """Downloads the file.
+
+        Returns the response of the first request, which can be used to read the headers
+        of the file.
+
+        """
+        state = self._load_state()
+        first_index = 0
+        if state is not None:
+            self._state = state
+            missing = self._missing_parts()
+            first_index = missing[0] if missing else 0
+
+        start = first_index * self._part_size
+        try:
+            probe = self._fetch(f"bytes={start}-{start + self._part_size - 1}")
+        except exceptions.HTTPError as exce:
+            if exce.status_code != _RANGE_NOT_SATISFIABLE:
+                raise
+            # The file is empty or smaller than the download being resumed
+            logger.info("Range not satisfiable, downloading the whole file")
+            self._discard_part()
+            return self._download_whole(self._fetch(None))
+        content_range = _parse_content_range(probe)
+        if content_range is None:
+            logger.debug("Server does not support range requests, streaming file")
+            return self._download_whole(probe)
+
+        _, end, size = content_range
+        if start < size and content_range[:2] != self._range(first_index, size):
+            logger.warning(
+                f"Expected partial content for bytes {start}-"
+                f"{self._range(first_index, size)[1]}, got bytes "
+                f"{content_range[0]}-{end}, downloading the whole file"
+            )
+            probe.close()
+            return self._download_whole(self._fetch(None))
+        validator = _validator(probe)
+        if (
+            state is None
+            or state["size"] != size
+            or state.get("validator") != validator
+        ):
+            if state is not None:
+                logger.info("File changed on the server, restarting download")
+            self._reset(size, validator)
+        elif state is not None:
+            logger.info(f"Resuming download of {self._path}")
+
+        if start < size:
+            self._write_part(probe, first_index, start, end)
+        else:
+            probe.close()
+
+        missing = self._missing_parts()
+        if missing:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                # Each part runs in a copy of the current context so that deadlines
+                # and tracing spans apply to its request
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._fetch_part, i)
+                    for i in missing
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        self._finish()
+        return probe
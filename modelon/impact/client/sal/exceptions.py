@@ -37,3 +37,11 @@ class ErrorJSONInvalidFormatError(ServiceAccessError):
 
 class NoResponseFetchVersionError(ServiceAccessError):
     pass
+
+
+class RequestTimeoutError(CommunicationError):
+    pass
+
+
+class DeadlineExceededError(RequestTimeoutError):
+    pass
@@ -3,9 +3,18 @@ from __future__ import annotations
 
 import enum
 import json
+import os
 from typing import Any, Dict, List, Optional, Text, Tuple, Union
 
+from modelon.impact.client.sal.download import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PART_SIZE,
+    RangedDownload,
+)
 from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.multipart import ProgressCallback
+from modelon.impact.client.sal.response import FileResponse, Sink
+from modelon.impact.client.sal.trajectory_cache import TrajectoryCache
 from modelon.impact.client.sal.uri import URI
 
 
@@ -32,6 +41,14 @@ class ExperimentService:
         self._http_client = http_client
         self._case_schema = "application/vnd.impact.cases.v2+json"
 
+    @property
+    def base_url(self) -> str:
+        return self._base_uri.content
+
+    @property
+    def trajectory_cache(self) -> Optional[TrajectoryCache]:
+        return self._http_client.context.trajectory_cache
+
     def experiment_execute(
         self, workspace_id: str, exp_id: str, case_ids: Optional[List[str]] = None
     ) -> str:
@@ -105,7 +122,9 @@ class ExperimentService:
             self._base_uri
             / f"api/workspaces/{workspace_id}/experiments/{experiment_id}/trajectories"
         ).resolve()
-        return self._http_client.post_json(url, body=body, headers=headers)
+        return self._http_client.post_json(
+            url, body=body, headers=headers, retry_safe=True
+        )
 
     def cases_get(self, workspace_id: str, experiment_id: str) -> Dict[str, Any]:
         url = (
@@ -157,18 +176,66 @@ class ExperimentService:
         case_id: str,
         result_format: ResultFormat = ResultFormat.MAT,
     ) -> Tuple[Union[Text, bytes], str]:
+        resp = self._case_result_response(
+            workspace_id, experiment_id, case_id, result_format
+        )
+        return resp.stream, resp.file_name
+
+    def case_result_download_to(
+        self,
+        workspace_id: str,
+        experiment_id: str,
+        case_id: str,
+        sink: Sink,
+        result_format: ResultFormat = ResultFormat.MAT,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> str:
+        if isinstance(sink, (str, os.PathLike)):
+            download = RangedDownload(
+                lambda byte_range: self._case_result_response(
+                    workspace_id,
+                    experiment_id,
+                    case_id,
+                    result_format,
+                    stream=True,
+                    byte_range=byte_range,
+                ),
+                sink,
+                part_size=part_size,
+                max_workers=max_workers,
+            )
+            return download.run().file_name
+
+        resp = self._case_result_response(
+            workspace_id, experiment_id, case_id, result_format, stream=True
+        )
+        resp.write_to(sink)
+        return resp.file_name
+
+    def _case_result_response(
+        self,
+        workspace_id: str,
+        experiment_id: str,
+        case_id: str,
+        result_format: ResultFormat,
+        stream: bool = False,
+        byte_range: Optional[str] = None,
+    ) -> FileResponse:
         url = (
             self._base_uri
             / f"api/workspaces/{workspace_id}/experiments/{experiment_id}/cases/"
             f"{case_id}/result"
         ).resolve()
+        range_header = {"Range": byte_range} if byte_range else {}
         if result_format == ResultFormat.CSV:
-            headers = {"Accept": "text/csv"}
-            csv_resp = self._http_client.get_csv(url, headers=headers)
-            return csv_resp.stream, csv_resp.file_name
-        headers = {"Accept": "application/vnd.impact.mat.v1+octet-stream"}
-        mat_resp = self._http_client.get_mat(url, headers=headers)
-        return mat_resp.stream, mat_resp.file_name
+            headers = {"Accept": "text/csv", **range_header}
+            return self._http_client.get_csv(url, headers=headers, stream=stream)
+        headers = {
+            "Accept": "application/vnd.impact.mat.v1+octet-stream",
+            **range_header,
+        }
+        return self._http_client.get_mat(url, headers=headers, stream=stream)
 
     def case_trajectories_get(
         self,
@@ -187,7 +254,7 @@ class ExperimentService:
             / f"api/workspaces/{workspace_id}/experiments/{experiment_id}/cases/"
             f"{case_id}/trajectories"
         ).resolve()
-        return self._http_client.post_json(url, body=body)
+        return self._http_client.post_json(url, body=body, retry_safe=True)
 
     def case_artifact_get(
         self, workspace_id: str, experiment_id: str, case_id: str, artifact_id: str
@@ -200,6 +267,23 @@ class ExperimentService:
         resp = self._http_client.get_file_response(url)
         return resp.stream, resp.file_name
 
+    def case_artifact_download_to(
+        self,
+        workspace_id: str,
+        experiment_id: str,
+        case_id: str,
+        artifact_id: str,
+        sink: Sink,
+    ) -> str:
+        url = (
+            self._base_uri
+            / f"api/workspaces/{workspace_id}/experiments/{experiment_id}/cases/"
+            f"{case_id}/custom-artifacts/{artifact_id}"
+        ).resolve()
+        resp = self._http_client.get_file_response(url, stream=True)
+        resp.write_to(sink)
+        return resp.file_name
+
     def case_artifacts_meta_get(
         self, workspace_id: str, experiment_id: str, case_id: str
     ) -> Dict[str, Any]:
@@ -218,6 +302,7 @@ class ExperimentService:
         case_id: str,
         artifact_id: Optional[str] = None,
         overwrite: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (
             self._base_uri
@@ -232,7 +317,9 @@ class ExperimentService:
                 "file": f,
                 "options": json.dumps(options),
             }
-            return self._http_client.post_json(url, files=multipart_form_data)
+            return self._http_client.post_json(
+                url, files=multipart_form_data, progress_callback=progress_callback
+            )
 
     def case_result_upload(
         self,
@@ -241,6 +328,7 @@ class ExperimentService:
         experiment_id: str,
         case_id: str,
         overwrite: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (
             self._base_uri
@@ -253,4 +341,6 @@ class ExperimentService:
                 "file": f,
                 "options": json.dumps(options),
             }
-            return self._http_client.post_json(url, files=multipart_form_data)
+            return self._http_client.post_json(
+                url, files=multipart_form_data, progress_callback=progress_callback
+            )
@@ -2,6 +2,7 @@
 from typing import Any, Dict
 
 from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.response import Sink
 from modelon.impact.client.sal.uri import URI
 
 
@@ -14,6 +15,10 @@ class ExportService:
         url = (self._base_uri / location).resolve()
         return self._http_client.get_zip(url)
 
+    def export_download_to(self, location: str, sink: Sink) -> None:
+        url = (self._base_uri / location).resolve()
+        self._http_client.get_zip_response(url, stream=True).write_to(sink)
+
     def get_export_status(self, location: str) -> Dict[str, Any]:
         url = (self._base_uri / location).resolve()
         return self._http_client.get_json(url)
@@ -3,6 +3,7 @@ import json
 from typing import Any, Dict, Optional
 
 from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.multipart import ProgressCallback
 from modelon.impact.client.sal.uri import URI
 
 
@@ -17,6 +18,7 @@ class ExternalResultService:
         path_to_result: str,
         label: Optional[str] = None,
         description: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (self._base_uri / "api/uploads/results").resolve()
         options: Dict[str, Any] = {
@@ -31,7 +33,9 @@ class ExternalResultService:
                 "file": f,
                 "options": json.dumps(options),
             }
-            return self._http_client.post_json(url, files=multipart_form_data)
+            return self._http_client.post_json(
+                url, files=multipart_form_data, progress_callback=progress_callback
+            )
 
     def get_uploaded_result(self, result_id: str) -> Dict[str, Any]:
         url = (self._base_uri / f"api/external-result/{result_id}").resolve()
@@ -2,6 +2,7 @@
 from typing import Any, Dict, Optional
 
 from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.multipart import ProgressCallback
 from modelon.impact.client.sal.request import (
     RequestCSV,
     RequestFileStream,
@@ -18,6 +19,7 @@ from modelon.impact.client.sal.response import (
     JSONResponse,
     MatStreamResponse,
     OctetStreamResponse,
+    ZIPResponse,
 )
 
 
@@ -29,6 +31,10 @@ class HTTPClient:
         if api_key:
             self._context.session.headers["impact-api-key"] = api_key
 
+    @property
+    def context(self) -> Context:
+        return self._context
+
     def get_json(
         self,
         url: str,
@@ -43,17 +49,50 @@ class HTTPClient:
         headers: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
     ) -> JSONResponse:
-        request = RequestJSON(self._context, "GET", url, headers=headers, params=params)
-        return request.execute()
+        single_flight = self._context.single_flight
+        if single_flight is None:
+            return self._get_json_response(url, headers, params)
+        key = single_flight.key("GET", url, params, headers)
+        return single_flight.do(
+            key, lambda: self._get_json_response(url, headers, params)
+        )
+
+    def _get_json_response(
+        self,
+        url: str,
+        headers: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> JSONResponse:
+        cache = self._context.response_cache
+        if cache is None:
+            request = RequestJSON(
+                self._context, "GET", url, headers=headers, params=params
+            )
+            return request.execute()
+
+        key = cache.key(url, params, headers)
+        entry = cache.get(key)
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.conditional_headers())
+        request = RequestJSON(
+            self._context, "GET", url, headers=request_headers, params=params
+        )
+        resp = request.execute()
+        if entry is not None and resp.status_code == 304:
+            cache.record_hit()
+            return entry.to_response(self._context.json_codec)
+        cache.store(key, resp)
+        return resp
 
     def get_text(self, url: str) -> str:
         request = RequestText(self._context, "GET", url)
         return request.execute().data
 
     def get_csv(
-        self, url: str, headers: Optional[Dict[str, Any]] = None
+        self, url: str, headers: Optional[Dict[str, Any]] = None, stream: bool = False
     ) -> CSVResponse:
-        request = RequestCSV(self._context, "GET", url, headers=headers)
+        request = RequestCSV(self._context, "GET", url, headers=headers, stream=stream)
         return request.execute()
 
     def get_xml(self, url: str, headers: Optional[Dict[str, Any]] = None) -> str:
@@ -61,22 +100,29 @@ class HTTPClient:
         return request.execute().data
 
     def get_mat(
-        self, url: str, headers: Optional[Dict[str, Any]] = None
+        self, url: str, headers: Optional[Dict[str, Any]] = None, stream: bool = False
     ) -> MatStreamResponse:
-        request = RequestMatStream(self._context, "GET", url, headers=headers)
+        request = RequestMatStream(
+            self._context, "GET", url, headers=headers, stream=stream
+        )
         return request.execute()
 
-    def get_octet_response(self, url: str) -> OctetStreamResponse:
-        request = RequestOctetStream(self._context, "GET", url)
+    def get_octet_response(self, url: str, stream: bool = False) -> OctetStreamResponse:
+        request = RequestOctetStream(self._context, "GET", url, stream=stream)
         return request.execute()
 
-    def get_file_response(self, url: str) -> FileResponse:
-        request = RequestFileStream(self._context, "GET", url)
+    def get_file_response(self, url: str, stream: bool = False) -> FileResponse:
+        request = RequestFileStream(self._context, "GET", url, stream=stream)
         return request.execute()
 
     def get_zip(self, url: str) -> bytes:
-        request = RequestZip(self._context, "GET", url)
-        return request.execute().data
+        return self.get_zip_response(url).data
+
+    def get_zip_response(
+        self, url: str, headers: Optional[Dict[str, Any]] = None, stream: bool = False
+    ) -> ZIPResponse:
+        request = RequestZip(self._context, "GET", url, headers=headers, stream=stream)
+        return request.execute()
 
     def post_json(
         self,
@@ -84,8 +130,19 @@ class HTTPClient:
         body: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        retry_safe: bool = False,
     ) -> Any:
-        request = RequestJSON(self._context, "POST", url, body, files, headers=headers)
+        request = RequestJSON(
+            self._context,
+            "POST",
+            url,
+            body,
+            files,
+            headers=headers,
+            progress_callback=progress_callback,
+            retry_safe=retry_safe,
+        )
         return request.execute().data
 
     def post_json_no_response_body(
@@ -0,0 +1,253 @@
+"""Request metrics classes."""
+import collections
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_SAMPLE_SIZE = 1024
+"""Default number of latest latencies per endpoint used to compute percentiles."""
+
+_ID_COLLECTIONS = frozenset(
+    [
+        "workspaces",
+        "experiments",
+        "cases",
+        "model-executables",
+        "models",
+        "projects",
+        "content",
+        "custom-functions",
+        "custom-artifacts",
+        "external-result",
+        "published-workspaces",
+        "results",
+        "workspace-imports",
+        "workspace-exports",
+        "workspace-conversions",
+        "project-imports",
+        "dependency-imports",
+        "fmu-imports",
+    ]
+)
+_NON_ID_SEGMENTS = frozenset(["orphans"])
+
+
+def endpoint_template(url: str) -> str:
+    """Returns the path of the URL starting at 'api/' with all IDs replaced by '{id}'.
+
+    Example::
+
+        >>> endpoint_template(
+        ...     "https://impact.modelon.cloud/api/workspaces/ws/experiments/exp"
+        ... )
+        'api/workspaces/{id}/experiments/{id}'
+
+    """
+    segments = urlsplit(url).path.strip("/").split("/")
+    if "api" in segments:
+        index = segments.index("api")
+        # Keep the JupyterHub API prefix but drop the user server prefix
+        if index == 0 or segments[index - 1] != "hub":
+            segments = segments[index:]
+    template = []
+    previous = ""
+    for segment in segments:
+        if previous in _ID_COLLECTIONS and segment not in _NON_ID_SEGMENTS:
+            template.append("{id}")
+        else:
+            template.append(segment)
+        previous = segment
+    return "/".join(template)
+
+
+@dataclass(frozen=True)
+class RequestRecord:
+    """Metrics recorded for a single request sent to the server."""
+
+    method: str
+    endpoint: str
+    """The URL path with IDs replaced by '{id}', see :obj:`endpoint_template`."""
+    status_code: Optional[int]
+    """The status code of the response or None if no response was received."""
+    latency: float
+    """Seconds from sending the request until the response headers were received."""
+    request_bytes: int
+    response_bytes: int
+    retries: int
+
+
+MetricsCallback = Callable[[RequestRecord], None]
+"""Callable called with the metrics of every request sent to the server."""
+
+
+def _body_length(body: Any) -> int:
+    if body is None:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+def _response_length(resp_obj: Any) -> int:
+    content_length = resp_obj.headers.get("content-length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+    if resp_obj.raw is None or getattr(resp_obj, "_content_consumed", False):
+        return len(resp_obj.content or b"")
+    return 0
+
+
+class EndpointStats:
+    """Aggregated metrics for all requests sent to one endpoint."""
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.status_codes: Dict[Optional[int], int] = collections.Counter()
+        self._latencies: Deque[float] = collections.deque(maxlen=sample_size)
+
+    def add(self, record: RequestRecord) -> None:
+        self.count += 1
+        if record.status_code is None or record.status_code >= 400:
+            self.errors += 1
+        self.retries += record.retries
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        self.total_latency += record.latency
+        self.max_latency = max(self.max_latency, record.latency)
+        self.status_codes[record.status_code] += 1
+        self._latencies.append(record.latency)
+
+    def percentile(self, percent: float) -> float:
+        """Returns the latency percentile, in seconds, of the latest requests."""
+        if not self._latencies:
+            return 0.0
+        latencies = sorted(self._latencies)
+        rank = max(0, math.ceil(percent / 100 * len(latencies)) - 1)
+        return latencies[rank]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statusCodes": dict(self.status_codes),
+            "requestBytes": self.request_bytes,
+            "responseBytes": self.response_bytes,
+            "latency": {
+                "mean": self.total_latency / self.count if self.count else 0.0,
+                "max": self.max_latency,
+                "p50": self.percentile(50),
+                "p90": self.percentile(90),
+                "p99": self.percentile(99),
+            },
+        }
+
+
+class MetricsRegistry:
+    """Records metrics for every request sent to the server, aggregated per method and
+    endpoint.
+
+    Latency percentiles are computed over the latest sample_size requests to
+    each endpoint. Callbacks are called with a
+    :obj:`~modelon.impact.client.sal.metrics.RequestRecord` for every request,
+    for example to feed Prometheus or StatsD exporters.
+
+    Args:
+        sample_size: Number of latest latencies per endpoint used to compute
+            percentiles.
+        callbacks: Callables called with the metrics of every request.
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.sal.context import Context
+        from modelon.impact.client.sal.metrics import MetricsRegistry
+
+        client = Client(url=impact_url, context=Context(metrics=MetricsRegistry()))
+        ...
+        for endpoint, stats in client.metrics.snapshot().items():
+            print(endpoint, stats['count'], stats['latency']['p90'])
+        client.metrics.reset()
+
+    """
+
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        callbacks: Optional[List[MetricsCallback]] = None,
+    ):
+        self._sample_size = sample_size
+        self._callbacks = list(callbacks or [])
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def add_callback(self, callback: MetricsCallback) -> None:
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: MetricsCallback) -> None:
+        self._callbacks.remove(callback)
+
+    def record(self, record: RequestRecord) -> None:
+        with self._lock:
+            key = (record.method, record.endpoint)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(self._sample_size)
+            stats.add(record)
+        for callback in self._callbacks:
+            callback(record)
+
+    def record_request(
+        self,
+        method: str,
+        url: str,
+        resp_obj: Any,
+        latency: float,
+        retries: int = 0,
+    ) -> None:
+        """Records a request given the 'requests' response object, or None if no
+        response was received."""
+        status_code = None
+        request_bytes = response_bytes = 0
+        if resp_obj is not None:
+            status_code = resp_obj.status_code
+            request = getattr(resp_obj, "request", None)
+            request_bytes = _body_length(getattr(request, "body", None))
+            response_bytes = _response_length(resp_obj)
+        self.record(
+            RequestRecord(
+                method=method,
+                endpoint=endpoint_template(url),
+                status_code=status_code,
+                latency=latency,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                retries=retries,
+            )
+        )
+
+    def get(self, method: str, endpoint: str) -> Optional[EndpointStats]:
+        with self._lock:
+            return self._stats.get((method, endpoint))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the aggregated metrics keyed by '<method> <endpoint>'."""
+        with self._lock:
+            return {
+                f"{method} {endpoint}": stats.to_dict()
+                for (method, endpoint), stats in sorted(self._stats.items())
+            }
+
+    def reset(self) -> None:
+        """Removes all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,142 @@
+"""Streaming multipart/form-data encoder."""
+import io
+import os
+import uuid
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from modelon.impact.client.sal.response import DEFAULT_CHUNK_SIZE
+
+ProgressCallback = Callable[[int, int], None]
+"""Callable called with the number of bytes sent so far and the total number of bytes to
+send."""
+
+FieldValue = Union[str, bytes, IO[bytes], Tuple[str, Any], Tuple[str, Any, str]]
+
+_HEADER_PARAM_ESCAPES = {
+    '"': "%22",
+    "\\": "\\\\",
+    "\r": "%0D",
+    "\n": "%0A",
+}
+
+
+def _quote(value: str) -> str:
+    return "".join(_HEADER_PARAM_ESCAPES.get(char, char) for char in value)
+
+
+def _guess_filename(value: Any) -> Optional[str]:
+    name = getattr(value, "name", None)
+    if isinstance(name, str) and name and name[0] != "<" and name[-1] != ">":
+        return os.path.basename(name)
+    return None
+
+
+def _remaining_length(fileobj: IO[bytes]) -> int:
+    try:
+        total = os.fstat(fileobj.fileno()).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        current = fileobj.tell()
+        total = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(current)
+        return total - current
+    return total - fileobj.tell()
+
+
+class MultipartEncoder:
+    """Encodes fields into a multipart/form-data body that is produced lazily, one chunk
+    at a time, while it is being sent.
+
+    Fields are given the same way as the 'files' argument to 'requests', but file
+    objects are never read into memory as a whole. The encoder is a file-like
+    object with a known length, making 'requests' send it in bounded chunks with
+    a 'Content-Length' header.
+
+    Args:
+        fields: Mapping from field name to either a string, bytes, a binary file
+            object or a tuple (filename, value) or (filename, value, content_type).
+        chunk_size: Number of bytes produced per chunk when iterating.
+        progress_callback: Optional callable called with the number of bytes sent
+            so far and the total number of bytes after each chunk.
+
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, FieldValue],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+        self._readers: List[IO[bytes]] = []
+        self._len = 0
+        self._bytes_read = 0
+        for name, value in fields.items():
+            self._add_field(name, value)
+        self._add_bytes(f"--{self.boundary}--\r\n".encode())
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def bytes_read(self) -> int:
+        return self._bytes_read
+
+    def _add_bytes(self, data: bytes) -> None:
+        self._readers.append(io.BytesIO(data))
+        self._len += len(data)
+
+    def _add_field(self, name: str, value: FieldValue) -> None:
+        content_type = None
+        if isinstance(value, tuple):
+            filename, data = value[0], value[1]
+            if len(value) > 2:
+                content_type = value[2]
+        else:
+            filename, data = _guess_filename(value) or name, value
+
+        headers = f'Content-Disposition: form-data; name="{_quote(name)}"'
+        if filename is not None:
+            headers += f'; filename="{_quote(filename)}"'
+        headers += "\r\n"
+        if content_type:
+            headers += f"Content-Type: {content_type}\r\n"
+        self._add_bytes(f"--{self.boundary}\r\n{headers}\r\n".encode())
+
+        if isinstance(data, str):
+            self._add_bytes(data.encode())
+        elif isinstance(data, (bytes, bytearray)):
+            self._add_bytes(bytes(data))
+        else:
+            self._readers.append(data)
+            self._len += _remaining_length(data)
+        self._add_bytes(b"\r\n")
+
+    def __len__(self) -> int:
+        return self._len
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads at most size bytes of the encoded body, or all remaining bytes if size
+        is negative."""
+        out = bytearray()
+        while self._readers and (size < 0 or len(out) < size):
+            chunk = self._readers[0].read(-1 if size < 0 else size - len(out))
+            if not chunk:
+                self._readers.pop(0)
+                continue
+            out += chunk
+
+        if out:
+            self._bytes_read += len(out)
+            if self._progress_callback is not None:
+                self._progress_callback(self._bytes_read, self._len)
+        return bytes(out)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self._chunk_size)
+            if not chunk:
+                return
+            yield chunk
@@ -5,6 +5,7 @@ import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.multipart import ProgressCallback
 from modelon.impact.client.sal.uri import URI
 
 if TYPE_CHECKING:
@@ -72,7 +73,11 @@ class ProjectService:
         self._http_client.delete_json(url)
 
     def project_content_upload(
-        self, path_to_result: str, project_id: str, content_type: str
+        self,
+        path_to_result: str,
+        project_id: str,
+        content_type: str,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (self._base_uri / f"/api/projects/{project_id}/content-imports").resolve()
         with open(path_to_result, "rb") as f:
@@ -80,7 +85,9 @@ class ProjectService:
                 "file": f,
                 "options": json.dumps({"contentType": content_type}),
             }
-            return self._http_client.post_json(url, files=multipart_form_data)
+            return self._http_client.post_json(
+                url, files=multipart_form_data, progress_callback=progress_callback
+            )
 
     def project_content_get(self, project_id: str, content_id: str) -> Dict[str, Any]:
         url = (
@@ -99,6 +106,7 @@ class ProjectService:
         exclude_patterns: Optional[Union[str, List[str]]] = None,
         top_level_inputs: Optional[Union[str, List[str]]] = None,
         step_size: float = 0.0,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (
             self._base_uri
@@ -122,9 +130,17 @@ class ProjectService:
                 "file": f,
                 "options": json.dumps(options),
             }
-            return self._http_client.post_json(url, files=multipart_form_data)
+            return self._http_client.post_json(
+                url, files=multipart_form_data, progress_callback=progress_callback
+            )
 
-    def import_from_zip(self, path_to_project: str) -> Dict[str, Any]:
+    def import_from_zip(
+        self,
+        path_to_project: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
         url = (self._base_uri / "api/project-imports").resolve()
         with open(path_to_project, "rb") as f:
-            return self._http_client.post_json(url, files={"file": f})
+            return self._http_client.post_json(
+                url, files={"file": f}, progress_callback=progress_callback
+            )
@@ -0,0 +1,241 @@
+"""Rate limiting of the requests sent to the server."""
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from modelon.impact.client.sal import deadline
+from modelon.impact.client.sal.exceptions import DeadlineExceededError
+from modelon.impact.client.sal.metrics import endpoint_template
+
+_STATUS_COLLECTIONS = frozenset(
+    [
+        "workspace-imports",
+        "workspace-exports",
+        "workspace-conversions",
+        "project-imports",
+        "dependency-imports",
+        "fmu-imports",
+        "results",
+    ]
+)
+_STATUS_SUFFIXES = ("/execution", "/compilation")
+_RESULT_SUFFIXES = ("/trajectories", "/result", "/variables")
+
+BACKOFF_STATUS_CODES = frozenset([429, 503])
+"""Status codes of responses making the rate limiter back off."""
+
+
+@enum.unique
+class EndpointClass(enum.Enum):
+    """Classes of endpoints that can be rate limited separately."""
+
+    STATUS = "STATUS"
+    """Polling the status of executions, compilations, imports and exports."""
+    RESULTS = "RESULTS"
+    """Fetching trajectories, variables and result files."""
+    UPLOAD = "UPLOAD"
+    """Uploading files."""
+    OTHER = "OTHER"
+
+
+def classify_endpoint(
+    method: str, url: str, files: Optional[Dict[str, Any]] = None
+) -> EndpointClass:
+    """Returns the class of the endpoint a request is sent to.
+
+    Example::
+
+        >>> classify_endpoint(
+        ...     "GET", "https://impact.modelon.cloud/api/workspaces/ws/experiments/"
+        ...     "exp/execution"
+        ... )
+        <EndpointClass.STATUS: 'STATUS'>
+
+    """
+    if files:
+        return EndpointClass.UPLOAD
+    template = endpoint_template(url).rstrip("/")
+    if method == "GET":
+        segments = template.split("/")
+        if (
+            template == "api/executions"
+            or template.endswith(_STATUS_SUFFIXES)
+            or (
+                len(segments) >= 2
+                and segments[-1] == "{id}"
+                and segments[-2] in _STATUS_COLLECTIONS
+            )
+        ):
+            return EndpointClass.STATUS
+        if template.endswith(_RESULT_SUFFIXES):
+            return EndpointClass.RESULTS
+    elif method == "POST" and template.endswith("/trajectories"):
+        return EndpointClass.RESULTS
+    return EndpointClass.OTHER
+
+
+class TokenBucket:
+    """Token bucket allowing 'rate' requests per second on average and bursts of up to
+    'burst' requests.
+
+    Thread safe. Threads waiting for a token are served in the order they asked for
+    one.
+
+    Args:
+        rate: The number of tokens added per second.
+        burst: The maximum number of tokens in the bucket. Default: 1
+        clock: Function returning the current time in seconds.
+            Default: time.monotonic
+
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("The rate of a token bucket must be positive")
+        if burst < 1:
+            raise ValueError("The burst of a token bucket must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Time at which the bucket would be full if no tokens were taken after it,
+        # tokens are reserved by moving it forward
+        self._full_at = 0.0
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, burst={self.burst})"
+
+    def reserve(self) -> float:
+        """Takes a token and returns the time in seconds to wait before using it."""
+        interval = 1.0 / self.rate
+        with self._lock:
+            now = self._clock()
+            full_at = max(self._full_at, now)
+            self._full_at = full_at + interval
+            return max(self._full_at - self.burst * interval - now, 0.0)
+
+    def delay(self) -> float:
+        """Returns the time in seconds a token taken now would have to wait, without
+        taking it."""
+        interval = 1.0 / self.rate
+        with self._lock:
+            now = self._clock()
+            full_at = max(self._full_at, now)
+            return max(full_at + interval - self.burst * interval - now, 0.0)
+
+
+class RateLimiter:
+    """Limits the rate of requests sent using a
+    :obj:`~modelon.impact.client.sal.context.Context`.
+
+    The rate limiter is shared by all threads and clients using the context. Every
+    request takes a token from the default bucket and, if one is configured for the
+    class of the endpoint, from the bucket of the endpoint class. When the server
+    answers '429 Too Many Requests' or '503 Service Unavailable', no request is
+    sent until the time given by the 'Retry-After' header of the response has
+    passed, or 'default_backoff' seconds if it has none.
+
+    Args:
+        default: The bucket taken from by all requests. Default is None, meaning
+            only the endpoint class buckets limit the rate.
+        endpoints: Buckets per class of endpoint, see
+            :obj:`~modelon.impact.client.sal.rate_limit.EndpointClass`.
+        default_backoff: Time in seconds to back off after a 429 or 503
+            response without a 'Retry-After' header. Default: 1.0
+        max_backoff: Maximum time in seconds to back off. Default: 60.0
+        clock: Function returning the current time in seconds.
+            Default: time.monotonic
+        sleep: Function sleeping for a number of seconds. Default: time.sleep
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.sal.context import Context
+        from modelon.impact.client.sal.rate_limit import (
+            EndpointClass,
+            RateLimiter,
+            TokenBucket,
+        )
+
+        limiter = RateLimiter(
+            default=TokenBucket(rate=20, burst=40),
+            endpoints={EndpointClass.STATUS: TokenBucket(rate=2)},
+        )
+        client = Client(url=impact_url, context=Context(rate_limiter=limiter))
+
+    """
+
+    def __init__(
+        self,
+        default: Optional[TokenBucket] = None,
+        endpoints: Optional[Dict[EndpointClass, TokenBucket]] = None,
+        default_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.default = default
+        self.endpoints = dict(endpoints or {})
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.waited = 0.0
+        """Total time in seconds requests have waited for the rate limiter."""
+
+    def acquire(self, endpoint_class: EndpointClass = EndpointClass.OTHER) -> float:
+        """Waits until a request to an endpoint of the given class may be sent.
+
+        Returns the time waited in seconds.
+
+        Raises:
+            DeadlineExceededError if the wait would pass the current deadline, see
+            :obj:`~modelon.impact.client.sal.deadline.deadline`. No token is taken
+            and no time is waited in that case.
+
+        """
+        buckets = [
+            bucket
+            for bucket in (self.endpoints.get(endpoint_class), self.default)
+            if bucket is not None
+        ]
+        with self._lock:
+            pause = max(self._paused_until - self._clock(), 0.0)
+        remaining = deadline.remaining()
+        if remaining is not None:
+            # Tokens are refilled during the pause, so the whole wait is the longest
+            # of the pause and the wait for a token
+            expected = max([pause] + [bucket.delay() for bucket in buckets])
+            if expected > remaining:
+                raise DeadlineExceededError(
+                    f"Waiting {expected:.2f} seconds for the rate limiter would pass "
+                    "the deadline for the request"
+                )
+        if pause:
+            self._sleep(pause)
+        wait = 0.0
+        for bucket in buckets:
+            wait = max(wait, bucket.reserve())
+        if wait:
+            self._sleep(wait)
+        with self._lock:
+            self.waited += pause + wait
+        return pause + wait
+
+    def backoff(self, delay: Optional[float] = None) -> None:
+        """Stops requests from being sent for 'delay' seconds, or 'default_backoff'
+        seconds if None."""
+        delay = self.default_backoff if delay is None else delay
+        delay = min(delay, self.max_backoff)
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + delay)
@@ -1,10 +1,15 @@
 """Request class."""
 import logging
-from typing import Any, Callable, Dict, Optional
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
 
-from modelon.impact.client.sal import exceptions
+from modelon.impact.client import tracing
+from modelon.impact.client.sal import deadline, exceptions, retry_after
+from modelon.impact.client.sal.metrics import endpoint_template
+from modelon.impact.client.sal.multipart import MultipartEncoder, ProgressCallback
+from modelon.impact.client.sal.rate_limit import BACKOFF_STATUS_CODES, classify_endpoint
 from modelon.impact.client.sal.response import (
     CSVResponse,
     FileResponse,
@@ -30,6 +35,9 @@ class Request:
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
+        retry_safe: bool = False,
     ):
         self.context = context
         self.method = method
@@ -40,40 +48,168 @@ class Request:
         self.headers = headers or {}
         self.headers.update({"User-Agent": "impact-python-client"})
         self.params = params
+        self.stream = stream
+        self.progress_callback = progress_callback
+        self.retry_safe = retry_safe
+        self.retries = 0
+
+    def _json_body(self, headers: Dict[str, Any]) -> Dict[str, Any]:
+        if self.body is None:
+            return {"headers": headers}
+        return {
+            "data": self.context.json_codec.encode(self.body),
+            "headers": {**headers, "Content-Type": "application/json"},
+        }
+
+    def _create_response(self, resp_obj: Any) -> Any:
+        return self.request_type(resp_obj)
+
+    def _timeout(self) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        return deadline.request_timeout(
+            self.context.connect_timeout, self.context.read_timeout
+        )
 
     def execute(self, check_return: bool = True) -> Any:
+        if not tracing.is_enabled():
+            return self._execute(check_return)
+
+        attributes = {
+            "http.request.method": self.method,
+            "url.full": self.url,
+            "impact.endpoint": endpoint_template(self.url),
+        }
+        with tracing.start_span(f"HTTP {self.method}", attributes) as span:
+            try:
+                resp = self._execute(check_return)
+            except exceptions.HTTPError as exce:
+                span.set_attribute("http.response.status_code", exce.status_code)
+                raise
+            span.set_attribute("http.response.status_code", resp.status_code)
+            return resp
+
+    def _execute(self, check_return: bool) -> Any:
+        metrics = self.context.metrics
+        if metrics is None:
+            resp = self._create_response(self._send_with_retries())
+        else:
+            start = time.perf_counter()
+            resp_obj = None
+            try:
+                resp_obj = self._send_with_retries()
+            finally:
+                self._record_metrics(metrics, resp_obj, time.perf_counter() - start)
+            resp = self._create_response(resp_obj)
+
+        if check_return and not resp.ok:
+            raise exceptions.HTTPError(resp.error.message, resp.status_code)
+
+        return resp
+
+    def _record_metrics(self, metrics: Any, resp_obj: Any, latency: float) -> None:
+        """Records the request in the metrics, logging instead of raising any error so
+        that recording never changes the outcome of the request."""
+        try:
+            metrics.record_request(
+                self.method, self.url, resp_obj, latency, self.retries
+            )
+        except Exception:
+            logger.exception(f"Failed to record metrics for {self.method} {self.url}")
+
+    def _send_with_retries(self) -> requests.Response:
+        policy = self.context.retry_policy
+        if policy is None or not policy.allows(self.method, self.retry_safe):
+            return self._send()
+
+        while True:
+            try:
+                resp = self._send()
+            except (exceptions.SSLError, exceptions.DeadlineExceededError):
+                raise
+            except exceptions.CommunicationError as exce:
+                delay = policy.delay(self.retries)
+                if self.retries >= policy.max_retries or self._past_deadline(delay):
+                    raise
+                reason = str(exce.__cause__ or exce)
+            else:
+                if (
+                    resp.status_code not in policy.status_codes
+                    or self.retries >= policy.max_retries
+                ):
+                    if self.retries and resp.status_code not in policy.status_codes:
+                        policy.record_recovery()
+                    return resp
+                hint = retry_after.parse_retry_after(resp.headers.get("Retry-After"))
+                delay = policy.delay(self.retries, hint)
+                if self._past_deadline(delay):
+                    return resp
+                reason = f"status code {resp.status_code}"
+                resp.close()
+            self.retries += 1
+            policy.record_retry()
+            logger.warning(
+                f"{self.method} {self.url} failed with {reason}, retry "
+                f"{self.retries}/{policy.max_retries} in {delay:.2f} seconds"
+            )
+            policy.sleep(delay)
+
+    @staticmethod
+    def _past_deadline(delay: float) -> bool:
+        """Returns True if a retry after 'delay' seconds would be sent after the current
+        deadline."""
+        remaining = deadline.remaining()
+        return remaining is not None and delay >= remaining
+
+    def _send(self) -> requests.Response:
+        deadline.check()
+        rate_limiter = self.context.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(classify_endpoint(self.method, self.url, self.files))
+            deadline.check()
+        timeout = self._timeout()
         try:
             extra_headers = self.headers
             headers = {**self.context.session.headers, **extra_headers}
-            if self.method == "POST":
+            if self.method == "POST" and self.files:
+                encoder = MultipartEncoder(
+                    self.files, progress_callback=self.progress_callback
+                )
+                logger.debug(
+                    "POST with streamed multipart body of {} bytes".format(len(encoder))
+                )
+                resp = self.context.session.post(
+                    self.url,
+                    data=encoder,
+                    headers={**headers, "Content-Type": encoder.content_type},
+                    stream=self.stream,
+                    timeout=timeout,
+                )
+            elif self.method == "POST":
                 logger.debug("POST with JSON body: {}".format(self.body))
                 resp = self.context.session.post(
                     self.url,
-                    json=self.body,
-                    files=self.files,
-                    headers=headers,
+                    **self._json_body(headers),
+                    stream=self.stream,
+                    timeout=timeout,
                 )
             elif self.method == "GET":
                 resp = self.context.session.get(
                     self.url,
                     headers=headers,
                     params=self.params,
+                    stream=self.stream,
+                    timeout=timeout,
                 )
             elif self.method == "PUT":
                 resp = self.context.session.put(
-                    self.url,
-                    json=self.body,
-                    headers=headers,
+                    self.url, **self._json_body(headers), timeout=timeout
                 )
             elif self.method == "PATCH":
                 resp = self.context.session.patch(
-                    self.url,
-                    json=self.body,
-                    headers=headers,
+                    self.url, **self._json_body(headers), timeout=timeout
                 )
             elif self.method == "DELETE":
                 resp = self.context.session.delete(
-                    self.url, json=self.body, headers=headers
+                    self.url, **self._json_body(headers), timeout=timeout
                 )
             else:
                 raise NotImplementedError()
@@ -82,15 +218,27 @@ class Request:
                 "SSL error, could not verify connection. Please check that "
                 "certificates are setup correctly for the Modelon Impact server"
             ) from exce
+        except requests.exceptions.Timeout as exce:
+            if deadline.expired():
+                raise exceptions.DeadlineExceededError(
+                    f"The deadline passed while waiting for {self.method} {self.url}"
+                ) from exce
+            raise exceptions.RequestTimeoutError(
+                f"{self.method} {self.url} timed out"
+            ) from exce
         except requests.exceptions.RequestException as exce:
             raise exceptions.CommunicationError(
                 "Communication when doing a request failed"
             ) from exce
 
-        resp = self.request_type(resp)
-        if check_return and not resp.ok:
-            raise exceptions.HTTPError(resp.error.message, resp.status_code)
-
+        retry_after.record(resp.headers)
+        if rate_limiter is not None and resp.status_code in BACKOFF_STATUS_CODES:
+            delay = retry_after.parse_retry_after(resp.headers.get("Retry-After"))
+            logger.warning(
+                f"Server answered {resp.status_code}, backing off requests for "
+                f"{rate_limiter.default_backoff if delay is None else delay} seconds"
+            )
+            rate_limiter.backoff(delay)
         return resp
 
 
@@ -104,14 +252,28 @@ class RequestJSON(Request):
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        retry_safe: bool = False,
     ):
         headers_ = headers if headers is not None else {}
         if "Accept" not in headers_:
             headers_["Accept"] = "application/json"
         super().__init__(
-            context, method, url, JSONResponse, body, files, headers_, params
+            context,
+            method,
+            url,
+            JSONResponse,
+            body,
+            files,
+            headers_,
+            params,
+            progress_callback=progress_callback,
+            retry_safe=retry_safe,
         )
 
+    def _create_response(self, resp_obj: Any) -> JSONResponse:
+        return JSONResponse(resp_obj, self.context.json_codec)
+
 
 class RequestZip(Request):
     def __init__(
@@ -122,8 +284,18 @@ class RequestZip(Request):
         body: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
-        super().__init__(context, method, url, ZIPResponse, body, files, headers)
+        super().__init__(
+            context,
+            method,
+            url,
+            ZIPResponse,
+            body,
+            files,
+            headers,
+            stream=stream,
+        )
 
 
 class RequestText(Request):
@@ -161,8 +333,18 @@ class RequestCSV(Request):
         body: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
-        super().__init__(context, method, url, CSVResponse, body, files, headers)
+        super().__init__(
+            context,
+            method,
+            url,
+            CSVResponse,
+            body,
+            files,
+            headers,
+            stream=stream,
+        )
 
 
 class RequestOctetStream(Request):
@@ -174,9 +356,17 @@ class RequestOctetStream(Request):
         body: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
         super().__init__(
-            context, method, url, OctetStreamResponse, body, files, headers
+            context,
+            method,
+            url,
+            OctetStreamResponse,
+            body,
+            files,
+            headers,
+            stream=stream,
         )
 
 
@@ -189,8 +379,18 @@ class RequestMatStream(Request):
         body: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
-        super().__init__(context, method, url, MatStreamResponse, body, files, headers)
+        super().__init__(
+            context,
+            method,
+            url,
+            MatStreamResponse,
+            body,
+            files,
+            headers,
+            stream=stream,
+        )
 
 
 class RequestFileStream(Request):
@@ -202,5 +402,15 @@ class RequestFileStream(Request):
         body: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
-        super().__init__(context, method, url, FileResponse, body, files, headers)
+        super().__init__(
+            context,
+            method,
+            url,
+            FileResponse,
+            body,
+            files,
+            headers,
+            stream=stream,
+        )
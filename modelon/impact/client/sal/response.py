@@ -1,8 +1,15 @@
 """Response class."""
+import os
 import re
-from typing import Any, Dict, Optional, Text
+from typing import IO, Any, Dict, Iterator, Optional, Text, Union
 
 from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.codec import JSONCodec
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""Default number of bytes read into memory at a time when streaming a response."""
+
+Sink = Union[str, "os.PathLike[str]", IO[bytes]]
 
 
 class ResponseError:
@@ -47,8 +54,9 @@ class Response:
 
 
 class JSONResponse(Response):
-    def __init__(self, resp_obj: Any):
+    def __init__(self, resp_obj: Any, codec: Optional[JSONCodec] = None):
         super().__init__(resp_obj)
+        self._codec = codec if codec else JSONCodec()
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -60,7 +68,7 @@ class JSONResponse(Response):
                 "Incorrect content type on response, expected JSON"
             )
 
-        return self._resp_obj.json()
+        return self._codec.decode(self._resp_obj.content)
 
     @property
     def headers(self) -> Dict[str, Any]:
@@ -107,27 +115,6 @@ class XMLResponse(Response):
         return self._resp_obj.text
 
 
-class ZIPResponse(Response):
-    def __init__(self, resp_obj: Any):
-        super().__init__(resp_obj)
-
-    def _is_zip(self) -> bool:
-        return "application/zip" in self._resp_obj.headers.get("content-type")
-
-    @property
-    def data(self) -> bytes:
-        if not self._resp_obj.ok:
-            raise exceptions.HTTPError(self.error.message, self._resp_obj.status_code)
-
-        if not self._is_zip():
-            raise exceptions.InvalidContentTypeError(
-                "Incorrect content type on response, expected a Binary "
-                "compressed archive"
-            )
-
-        return self._resp_obj.content
-
-
 class FileResponse(Response):
     def __init__(self, resp_obj: Any, content_type: Optional[str] = None):
         super().__init__(resp_obj)
@@ -173,6 +160,74 @@ class FileResponse(Response):
             return found_file[0].strip('"')
         return ""
 
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields the response body in chunks of at most chunk_size bytes.
+
+        Only one chunk is held in memory at a time if the request was sent with
+        streaming enabled.
+
+        """
+        if not self._resp_obj.ok:
+            raise exceptions.HTTPError(self.error.message, self._resp_obj.status_code)
+
+        self._assert_expected_content_type()
+        return self._resp_obj.iter_content(chunk_size=chunk_size)
+
+    def write_to(self, sink: Sink, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Writes the response body chunk by chunk to a file path or a binary file-like
+        object. Returns the number of bytes written.
+
+        If the transfer fails when writing to a file path, the partially written file is
+        removed.
+
+        """
+        if isinstance(sink, (str, os.PathLike)):
+            try:
+                with open(sink, "wb") as f:
+                    return self.write_to(f, chunk_size)
+            except BaseException:
+                if os.path.exists(sink):
+                    os.remove(sink)
+                raise
+
+        written = 0
+        try:
+            for chunk in self.iter_content(chunk_size):
+                sink.write(chunk)
+                written += len(chunk)
+        finally:
+            self.close()
+        return written
+
+    def close(self) -> None:
+        """Releases the connection of the response.
+
+        The rest of the body of a streamed response is not read.
+
+        """
+        self._resp_obj.close()
+
+
+class ZIPResponse(FileResponse):
+    def __init__(self, resp_obj: Any):
+        super().__init__(resp_obj, "application/zip")
+
+    def _is_zip(self) -> bool:
+        return "application/zip" in self._resp_obj.headers.get("content-type")
+
+    @property
+    def data(self) -> bytes:
+        if not self._resp_obj.ok:
+            raise exceptions.HTTPError(self.error.message, self._resp_obj.status_code)
+
+        if not self._is_zip():
+            raise exceptions.InvalidContentTypeError(
+                "Incorrect content type on response, expected a Binary "
+                "compressed archive"
+            )
+
+        return self._resp_obj.content
+
 
 class CSVResponse(FileResponse):
     def __init__(self, resp_obj: Any):
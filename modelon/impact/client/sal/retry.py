@@ -0,0 +1,122 @@
+"""Retrying requests that failed because of transient errors."""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+"""Methods that are safe to send again, as sending them twice has the same effect as
+sending them once."""
+
+DEFAULT_STATUS_CODES = frozenset([502, 503, 504])
+"""Status codes of responses retried by default."""
+
+
+class RetryPolicy:
+    """Policy for retrying requests that failed because of transient errors, such as a
+    connection reset or a '503 Service Unavailable' response.
+
+    Only requests that are safe to send again are retried: GET, PUT and DELETE
+    requests, and POST requests marked as safe by the client, such as fetching
+    trajectories. The time to wait before retry number 'n' is
+    'backoff_factor * 2 ** n' seconds, up to 'max_backoff' seconds, or the time
+    given by the 'Retry-After' header of the response if longer.
+
+    Args:
+        max_retries: Maximum number of times a request is retried. Default: 3
+        backoff_factor: Time in seconds to wait before the first retry.
+            Default: 0.5
+        max_backoff: Maximum time in seconds to wait before a retry.
+            Default: 30.0
+        status_codes: Status codes of responses that are retried.
+            Default: 502, 503 and 504
+        jitter: Fraction of the wait to randomly add or subtract, so that many
+            clients don't retry in lockstep. Default: 0.1
+        seed: Seed for the random jitter. Default is None, meaning random jitter.
+        sleep: Function sleeping for a number of seconds. Default: time.sleep
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.sal.context import Context
+        from modelon.impact.client.sal.retry import RetryPolicy
+
+        retry_policy = RetryPolicy(max_retries=5)
+        client = Client(url=impact_url, context=Context(retry_policy=retry_policy))
+        ...
+        print(f"Requests were retried {retry_policy.retries} times")
+
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        status_codes: Iterable[int] = DEFAULT_STATUS_CODES,
+        jitter: float = 0.1,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if max_retries < 0:
+            raise ValueError("The maximum number of retries must not be negative")
+        if not 0.0 <= jitter < 1.0:
+            raise ValueError("The retry jitter must be in the range [0, 1)")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes = frozenset(status_codes)
+        self.jitter = jitter
+        self.sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._recovered = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"backoff_factor={self.backoff_factor}, max_backoff={self.max_backoff})"
+        )
+
+    @property
+    def retries(self) -> int:
+        """Total number of retries done using the policy."""
+        return self._retries
+
+    @property
+    def recovered(self) -> int:
+        """Number of requests that succeeded after being retried."""
+        return self._recovered
+
+    def allows(self, method: str, retry_safe: bool = False) -> bool:
+        """Returns True if requests with the given method may be retried."""
+        return method in IDEMPOTENT_METHODS or retry_safe
+
+    def delay(self, retry: int, server_hint: Optional[float] = None) -> float:
+        """Returns the time in seconds to wait before the given retry, counting from
+        0."""
+        delay = min(self.backoff_factor * 2**retry, self.max_backoff)
+        if self.jitter:
+            spread = delay * self.jitter
+            with self._lock:
+                delay = self._rng.uniform(delay - spread, delay + spread)
+        if server_hint is not None:
+            delay = max(delay, min(server_hint, self.max_backoff))
+        return max(delay, 0.0)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def record_recovery(self) -> None:
+        with self._lock:
+            self._recovered += 1
+
+    def reset(self) -> None:
+        """Resets the counters."""
+        with self._lock:
+            self._retries = 0
+            self._recovered = 0
@@ -0,0 +1,50 @@
+"""Handling of 'Retry-After' hints sent by the server."""
+from __future__ import annotations
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+_local = threading.local()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the number of seconds to wait given the value of a 'Retry-After' header,
+    or None if the value is missing or invalid.
+
+    Both the delay in seconds and the HTTP date forms of the header are supported.
+
+    Example::
+
+        parse_retry_after('5')  # 5.0
+        parse_retry_after('Wed, 21 Oct 2026 07:28:00 GMT')
+
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+def record(headers: Mapping[str, Any]) -> None:
+    """Records the 'Retry-After' hint of a response received by the calling thread."""
+    _local.hint = parse_retry_after(headers.get("Retry-After"))
+
+
+def pop_hint() -> Optional[float]:
+    """Returns and clears the 'Retry-After' hint of the latest response received by the
+    calling thread."""
+    hint = getattr(_local, "hint", None)
+    _local.hint = None
+    return hint
@@ -1,6 +1,6 @@
 """Service class."""
 import logging
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from modelon.impact.client.exceptions import FailedToStartModelingServer
 from modelon.impact.client.sal import exceptions
@@ -17,8 +17,17 @@ from modelon.impact.client.sal.project import ProjectService
 from modelon.impact.client.sal.uri import URI
 from modelon.impact.client.sal.users import UsersService
 from modelon.impact.client.sal.workspace import WorkspaceService
+from modelon.impact.client.sal.workspace_events import (
+    DEFAULT_FALLBACK_INTERVAL,
+    NotificationHandler,
+    WorkspaceEvents,
+)
 from modelon.impact.client.sal.ws import SyncWebSocketClient
 
+if TYPE_CHECKING:
+    from modelon.impact.client.operations.journal import OperationJournal
+    from modelon.impact.client.operations.polling import PollingStrategy
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +63,7 @@ def is_jupyterhub_url(uri: URI, context: Optional[Context] = None) -> bool:
 
 class Service:
     def __init__(self, uri: URI, api_key: str, context: Optional[Context] = None):
+        context = context if context else Context()
         self._http_client = HTTPClient(api_key, context)
         self._base_uri = (
             _get_impact_base_uri(uri, self._http_client)
@@ -74,6 +84,9 @@ class Service:
         self.users = UsersService(self._base_uri, self._http_client)
         self.exports = ExportService(self._base_uri, self._http_client)
         self.imports = ImportService(self._base_uri, self._http_client)
+        self.polling: Optional["PollingStrategy"] = None
+        self.workspace_events: Optional[WorkspaceEvents] = None
+        self.journal: Optional["OperationJournal"] = None
 
     def api_get_metadata(self) -> Dict[str, Any]:
         url = (self._base_uri / "api/").resolve()
@@ -86,6 +99,22 @@ class Service:
         resp = self._http_client.get_json_response(url)
         return resp.data
 
+    def enable_workspace_events(
+        self, fallback_interval: float = DEFAULT_FALLBACK_INTERVAL
+    ) -> WorkspaceEvents:
+        """Makes operations learn that they are done from notifications pushed by the
+        server, instead of polling the status."""
+
+        def connect(on_notification: NotificationHandler) -> SyncWebSocketClient:
+            return SyncWebSocketClient(
+                self._base_ws_uri, self._api_key, on_notification=on_notification
+            )
+
+        if self.workspace_events is not None:
+            self.workspace_events.close()
+        self.workspace_events = WorkspaceEvents(connect, fallback_interval)
+        return self.workspace_events
+
     def start_modeling_session(self, workspace_id: str) -> ModelingService:
         ws_client = SyncWebSocketClient(self._base_ws_uri, self._api_key)
         response = ws_client.get_json_response(
@@ -0,0 +1,94 @@
+"""Single-flight request de-duplication class."""
+import json
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from modelon.impact.client.sal import deadline
+from modelon.impact.client.sal.exceptions import (
+    DeadlineExceededError,
+    RequestTimeoutError,
+)
+
+T = TypeVar("T")
+
+FlightKey = Tuple[str, str, str, str]
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Shares one in-flight request between threads sending identical requests.
+
+    The first thread sending a request with a given key sends it. Threads sending an
+    identical request while the first one is in flight wait for it and receive the same
+    response, or the same exception, instead of sending a request of their own.
+
+    Waiting threads respect their own deadline, see
+    :obj:`~modelon.impact.client.sal.deadline.deadline`, and send a request of their
+    own if the shared request timed out, as the time left for the first thread says
+    nothing about the time left for them.
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[FlightKey, _Call] = {}
+        self._saved = 0
+
+    @property
+    def saved(self) -> int:
+        """Number of requests that were not sent because an identical request was
+        already in flight."""
+        return self._saved
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> FlightKey:
+        accept = (headers or {}).get("Accept", "")
+        query = json.dumps(sorted((params or {}).items()), default=str)
+        return method, url, query, accept
+
+    def do(self, key: FlightKey, fn: Callable[[], T]) -> T:
+        """Calls fn unless a call with the same key is in flight, in which case the
+        result of that call is returned once it is done."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self._saved += 1
+
+        if not leader:
+            if not call.done.wait(deadline.remaining()):
+                raise DeadlineExceededError(
+                    "The deadline passed while waiting for an identical request"
+                )
+            if isinstance(call.error, RequestTimeoutError):
+                with self._lock:
+                    self._saved -= 1
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exce:
+            call.error = exce
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,338 @@
+"""Persistent cache of the trajectories of finished cases."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024**3
+"""Default maximum size in bytes of the files kept by a trajectory cache."""
+
+_MAGIC = b"IMPTRJ1\n"
+_SUFFIX = ".trj"
+_FLOATS = b"d"
+_JSON = b"j"
+
+CaseVersions = Dict[str, Optional[str]]
+"""The version of the result of each case, in case order.
+
+Cases without a version are never cached.
+
+"""
+
+
+class TrajectoryKey(NamedTuple):
+    server: str
+    workspace_id: str
+    experiment_id: str
+    case_id: str
+    variable: str
+    last_point_only: bool
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:32]
+
+
+def _encode(value: Any) -> bytes:
+    """Encodes a trajectory, as packed little-endian doubles if all values are floats,
+    otherwise as JSON."""
+    if isinstance(value, list) and all(type(item) is float for item in value):
+        floats = array("d", value)
+        if sys.byteorder == "big":
+            floats.byteswap()
+        return _FLOATS + floats.tobytes()
+    return _JSON + json.dumps(value).encode()
+
+
+def _decode(payload: bytes) -> Any:
+    kind, data = payload[:1], payload[1:]
+    if kind == _FLOATS:
+        floats = array("d")
+        floats.frombytes(data)
+        if sys.byteorder == "big":
+            floats.byteswap()
+        return floats.tolist()
+    if kind == _JSON:
+        return json.loads(data)
+    raise ValueError(f"Unknown trajectory encoding {kind!r}")
+
+
+class TrajectoryCache:
+    """Caches the trajectories of finished cases on disk, so that fetching them again
+    does not send requests to the server, also in later sessions.
+
+    Each trajectory is stored in its own file, keyed by the server, workspace,
+    experiment, case, variable and whether only the last point was fetched. Each entry
+    records the time the case finished. An entry is discarded when the case has
+    finished at another time since it was cached, that is when the case has been
+    executed again, and when a result is imported for the case with
+    :obj:`~modelon.impact.client.entities.case.Case.import_result`.
+    Trajectories of floats are stored as packed doubles.
+
+    The cache holds at most max_bytes bytes and evicts the least recently used
+    trajectories when full. Several processes may share the directory.
+
+    Args:
+        directory: The directory to store the cached trajectories in.
+        max_bytes: The maximum total size in bytes of the cached trajectories.
+            Default: 1 GiB.
+
+    Example::
+
+        from modelon.impact.client import Client
+        from modelon.impact.client.sal.context import Context
+        from modelon.impact.client.sal.trajectory_cache import TrajectoryCache
+
+        cache = TrajectoryCache('~/.impact/trajectories', max_bytes=2 * 1024**3)
+        client = Client(url=impact_url, context=Context(trajectory_cache=cache))
+        ...
+        print(cache.stats())
+
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError(
+                "The maximum size of the trajectory cache must be positive"
+            )
+        self._directory = os.path.expanduser(directory)
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        os.makedirs(self._directory, exist_ok=True)
+        self._load()
+
+    def __repr__(self) -> str:
+        return f"TrajectoryCache('{self._directory}', max_bytes={self._max_bytes})"
+
+    @property
+    def hits(self) -> int:
+        """Number of trajectories served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of trajectories not found in the cache."""
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached trajectories."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of hits, misses, cached trajectories and their size in
+        bytes."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self),
+            "bytes": self._size,
+        }
+
+    def clear(self) -> None:
+        """Removes all cached trajectories and resets the counters."""
+        with self._lock:
+            paths = list(self._entries)
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+        for path in paths:
+            self._remove_file(path)
+
+    def _case_directory(
+        self, server: str, workspace_id: str, experiment_id: str, case_id: str
+    ) -> str:
+        return os.path.join(
+            self._directory, _digest(server, workspace_id, experiment_id, case_id)
+        )
+
+    def _path(self, key: TrajectoryKey) -> str:
+        return os.path.join(
+            self._case_directory(*key[:4]),
+            _digest(key.variable, key.last_point_only) + _SUFFIX,
+        )
+
+    def get(self, key: TrajectoryKey, version: str) -> Tuple[bool, Any]:
+        """Returns True and the cached trajectory if it is cached for the version of the
+        case result, otherwise False and None."""
+        path = self._path(key)
+        with self._lock:
+            cached = path in self._entries
+        value = None
+        if cached:
+            try:
+                with open(path, "rb") as f:
+                    content = f.read()
+                if not content.startswith(_MAGIC):
+                    raise ValueError("Invalid trajectory cache file")
+                header, payload = content[len(_MAGIC) :].split(b"\n", 1)
+                meta = json.loads(header)
+                cached = meta["key"] == list(key) and meta["version"] == version
+                if cached:
+                    value = _decode(payload)
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning(f"Ignoring invalid cached trajectory {path}")
+                cached = False
+            if not cached:
+                self._discard(path)
+        with self._lock:
+            if cached:
+                self._hits += 1
+                if path in self._entries:
+                    self._entries.move_to_end(path)
+            else:
+                self._misses += 1
+        if cached:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return cached, value
+
+    def put(self, key: TrajectoryKey, version: str, value: Any) -> None:
+        """Caches the trajectory for the version of the case result."""
+        path = self._path(key)
+        header = json.dumps({"key": list(key), "version": version}).encode()
+        content = _MAGIC + header + b"\n" + _encode(value)
+        if len(content) > self._max_bytes:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning(f"Could not persist cached trajectory to {path}")
+            return
+        self._add(path, len(content))
+
+    def invalidate_case(
+        self, server: str, workspace_id: str, experiment_id: str, case_id: str
+    ) -> None:
+        """Removes all cached trajectories of a case."""
+        directory = self._case_directory(server, workspace_id, experiment_id, case_id)
+        prefix = directory + os.sep
+        with self._lock:
+            paths = [path for path in self._entries if path.startswith(prefix)]
+        for path in paths:
+            self._discard(path)
+
+    def get_or_fetch(
+        self,
+        server: str,
+        workspace_id: str,
+        experiment_id: str,
+        versions: CaseVersions,
+        variables: List[str],
+        last_point_only: bool,
+        fetch: Callable[[List[str]], List[List[Any]]],
+    ) -> List[List[Any]]:
+        """Returns the trajectories of the variables for the cases, with one list per
+        variable holding one trajectory per case.
+
+        Variables not cached for all cases are fetched with a single call to 'fetch',
+        given the variables to fetch and returning their trajectories in the same
+        layout, and cached for the cases with a version.
+
+        """
+        found: Dict[str, List[Any]] = {}
+        missing = []
+        for variable in variables:
+            if variable in found or variable in missing:
+                continue
+            trajectories = []
+            for case_id, version in versions.items():
+                if version is None:
+                    break
+                key = TrajectoryKey(
+                    server,
+                    workspace_id,
+                    experiment_id,
+                    case_id,
+                    variable,
+                    last_point_only,
+                )
+                hit, value = self.get(key, version)
+                if not hit:
+                    break
+                trajectories.append(value)
+            else:
+                found[variable] = trajectories
+                continue
+            missing.append(variable)
+
+        if missing:
+            fetched = fetch(missing)
+            for variable, trajectories in zip(missing, fetched):
+                found[variable] = trajectories
+                for (case_id, version), value in zip(versions.items(), trajectories):
+                    if version is not None:
+                        key = TrajectoryKey(
+                            server,
+                            workspace_id,
+                            experiment_id,
+                            case_id,
+                            variable,
+                            last_point_only,
+                        )
+                        self.put(key, version, value)
+        return [found[variable] for variable in variables]
+
+    def _add(self, path: str, size: int) -> None:
+        evicted = []
+        with self._lock:
+            self._size += size - self._entries.get(path, 0)
+            self._entries[path] = size
+            self._entries.move_to_end(path)
+            while self._size > self._max_bytes and len(self._entries) > 1:
+                evicted_path, evicted_size = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                evicted.append(evicted_path)
+        for evicted_path in evicted:
+            self._remove_file(evicted_path)
+
+    def _discard(self, path: str) -> None:
+        with self._lock:
+            self._size -= self._entries.pop(path, 0)
+        self._remove_file(path)
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _load(self) -> None:
+        files = []
+        for root, _, names in os.walk(self._directory):
+            for name in names:
+                path = os.path.join(root, name)
+                if name.endswith(".tmp"):
+                    self._remove_file(path)
+                elif name.endswith(_SUFFIX):
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._add(path, size)
@@ -1,9 +1,17 @@
 """Workspace service module."""
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from modelon.impact.client.sal.download import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PART_SIZE,
+    RangedDownload,
+)
 from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.multipart import ProgressCallback
+from modelon.impact.client.sal.response import Sink
 from modelon.impact.client.sal.uri import URI
 
 if TYPE_CHECKING:
@@ -105,6 +113,32 @@ class WorkspaceService:
         ).resolve()
         return self._http_client.get_zip(url)
 
+    def fmu_download_to(
+        self,
+        workspace_id: str,
+        fmu_id: str,
+        sink: Sink,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        url = (
+            self._base_uri
+            / f"api/workspaces/{workspace_id}/model-executables/{fmu_id}/binary"
+        ).resolve()
+        if isinstance(sink, (str, os.PathLike)):
+            RangedDownload(
+                lambda byte_range: self._http_client.get_zip_response(
+                    url,
+                    headers={"Range": byte_range} if byte_range else None,
+                    stream=True,
+                ),
+                sink,
+                part_size=part_size,
+                max_workers=max_workers,
+            ).run()
+            return
+        self._http_client.get_zip_response(url, stream=True).write_to(sink)
+
     def experiments_get(
         self,
         workspace_id: str,
@@ -153,10 +187,16 @@ class WorkspaceService:
         ).resolve()
         return self._http_client.get_json(url, params=query)
 
-    def import_from_zip(self, path_to_workspace: str) -> Dict[str, Any]:
+    def import_from_zip(
+        self,
+        path_to_workspace: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
         url = (self._base_uri / "api/workspace-imports").resolve()
         with open(path_to_workspace, "rb") as f:
-            return self._http_client.post_json(url, files={"file": f})
+            return self._http_client.post_json(
+                url, files={"file": f}, progress_callback=progress_callback
+            )
 
     def cleanup_orphans(
         self,
@@ -208,22 +248,32 @@ class WorkspaceService:
         return self._http_client.post_json(url, body=shared_definition)
 
     def import_project_from_zip(
-        self, workspace_id: str, path_to_project: str
+        self,
+        workspace_id: str,
+        path_to_project: str,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (
             self._base_uri / f"api/workspaces/{workspace_id}/project-imports"
         ).resolve()
         with open(path_to_project, "rb") as f:
-            return self._http_client.post_json(url, files={"file": f})
+            return self._http_client.post_json(
+                url, files={"file": f}, progress_callback=progress_callback
+            )
 
     def import_dependency_from_zip(
-        self, workspace_id: str, path_to_project: str
+        self,
+        workspace_id: str,
+        path_to_project: str,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         url = (
             self._base_uri / f"api/workspaces/{workspace_id}/dependency-imports"
         ).resolve()
         with open(path_to_project, "rb") as f:
-            return self._http_client.post_json(url, files={"file": f})
+            return self._http_client.post_json(
+                url, files={"file": f}, progress_callback=progress_callback
+            )
 
     def get_published_workspaces(
         self,
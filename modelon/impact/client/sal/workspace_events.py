@@ -0,0 +1,227 @@
+"""Server push notifications for workspaces."""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from websockets.exceptions import WebSocketException
+
+from modelon.impact.client.sal.ws import NotificationHandler, SyncWebSocketClient
+
+logger = logging.getLogger(__name__)
+
+ConnectWebSocket = Callable[[NotificationHandler], SyncWebSocketClient]
+
+DEFAULT_FALLBACK_INTERVAL = 30.0
+"""Default time in seconds between status requests while subscribed."""
+
+_RECEIVE_TIMEOUT = 1.0
+_RECONNECT_DELAY = 5.0
+
+
+def _string_values(obj: Any) -> Set[str]:
+    """Returns all strings in a notification, so that entity IDs are found wherever the
+    server puts them."""
+    if isinstance(obj, str):
+        return {obj}
+    if isinstance(obj, dict):
+        return set().union(*(_string_values(v) for v in obj.values()), set(obj))
+    if isinstance(obj, (list, tuple)):
+        return set().union(*(_string_values(v) for v in obj))
+    return set()
+
+
+class Subscription:
+    """Subscription to notifications mentioning some entities, such as an experiment or
+    a model executable, in a workspace.
+
+    Created by
+    :obj:`WorkspaceEvents.subscribe`.
+
+    """
+
+    def __init__(
+        self,
+        listener: _WorkspaceListener,
+        entity_ids: Set[str],
+        fallback_interval: float,
+    ):
+        self._listener = listener
+        self._entity_ids = entity_ids
+        self._event = threading.Event()
+        self.fallback_interval = fallback_interval
+
+    @property
+    def connected(self) -> bool:
+        """True if notifications are currently received from the server."""
+        return self._listener.connected
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Waits until a notification mentioning any of the entities is received, or the
+        timeout expires. Returns True if notified.
+
+        Notifications received since the last wait also count, so that none are missed
+        while the status is requested.
+
+        """
+        notified = self._event.wait(timeout)
+        self._event.clear()
+        return notified
+
+    def close(self) -> None:
+        self._listener.remove(self)
+
+    def __enter__(self) -> Subscription:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _WorkspaceListener:
+    """Receives the notifications of one workspace on a background thread, and
+    reconnects if the connection is lost."""
+
+    def __init__(self, workspace_id: str, connect: ConnectWebSocket):
+        self._workspace_id = workspace_id
+        self._connect = connect
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, List[Subscription]] = defaultdict(list)
+        self._closed = threading.Event()
+        self._connected = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def add(self, subscription: Subscription) -> None:
+        with self._lock:
+            for entity_id in subscription._entity_ids:
+                self._subscriptions[entity_id].append(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"impact-workspace-events-{self._workspace_id}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def remove(self, subscription: Subscription) -> None:
+        with self._lock:
+            for entity_id in subscription._entity_ids:
+                subscriptions = self._subscriptions.get(entity_id, [])
+                if subscription in subscriptions:
+                    subscriptions.remove(subscription)
+                if not subscriptions:
+                    self._subscriptions.pop(entity_id, None)
+
+    def wait_connected(self, timeout: float) -> bool:
+        return self._connected.wait(timeout)
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def _dispatch(self, params: Dict[str, Any]) -> None:
+        mentioned = _string_values(params)
+        with self._lock:
+            notified = [
+                subscription
+                for entity_id in mentioned & set(self._subscriptions)
+                for subscription in self._subscriptions[entity_id]
+            ]
+        for subscription in notified:
+            subscription.notify()
+
+    def _notify_all(self) -> None:
+        with self._lock:
+            subscriptions = [s for subs in self._subscriptions.values() for s in subs]
+        for subscription in subscriptions:
+            subscription.notify()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            try:
+                self._listen()
+            except (OSError, WebSocketException, TimeoutError) as exce:
+                logger.warning(
+                    f"Lost notifications for workspace '{self._workspace_id}', "
+                    f"falling back to polling: {exce}"
+                )
+            except Exception:
+                logger.exception(
+                    f"Failed receiving notifications for workspace "
+                    f"'{self._workspace_id}', falling back to polling"
+                )
+            finally:
+                self._connected.clear()
+                # Waiters may have missed notifications, make them poll the status
+                self._notify_all()
+            self._closed.wait(_RECONNECT_DELAY)
+
+    def _listen(self) -> None:
+        client = self._connect(self._dispatch)
+        try:
+            client.get_json_response("impact/subscribeToWorkspace", self._workspace_id)
+            self._connected.set()
+            logger.info(f"Subscribed to notifications for '{self._workspace_id}'")
+            while not self._closed.is_set():
+                try:
+                    client.receive_notification(timeout=_RECEIVE_TIMEOUT)
+                except TimeoutError:
+                    continue
+        finally:
+            client.close()
+
+
+class WorkspaceEvents:
+    """Subscribes to notifications pushed by the server on the workspace WebSocket, used
+    by operations to learn that they are done without polling the status.
+
+    One connection is opened per workspace, the first time an operation in it is
+    waited for. A notification mentioning the ID of an operation makes it request
+    its status once. While no connection is available, operations poll the status
+    as usual.
+
+    Args:
+        connect: Callable opening a WebSocket connection given a notification
+            handler.
+        fallback_interval: Time in seconds between status requests while
+            connected, in case a notification is missed. Default: 30.0
+
+    """
+
+    def __init__(
+        self,
+        connect: ConnectWebSocket,
+        fallback_interval: float = DEFAULT_FALLBACK_INTERVAL,
+    ):
+        self._connect = connect
+        self._fallback_interval = fallback_interval
+        self._lock = threading.Lock()
+        self._listeners: Dict[str, _WorkspaceListener] = {}
+
+    def subscribe(self, workspace_id: str, entity_ids: Iterable[str]) -> Subscription:
+        """Returns a subscription notified when a notification mentioning any of the
+        given entity IDs is received for the workspace."""
+        with self._lock:
+            listener = self._listeners.get(workspace_id)
+            if listener is None:
+                listener = _WorkspaceListener(workspace_id, self._connect)
+                self._listeners[workspace_id] = listener
+        subscription = Subscription(listener, set(entity_ids), self._fallback_interval)
+        listener.add(subscription)
+        return subscription
+
+    def close(self) -> None:
+        """Closes all connections."""
+        with self._lock:
+            listeners = list(self._listeners.values())
+            self._listeners.clear()
+        for listener in listeners:
+            listener.close()
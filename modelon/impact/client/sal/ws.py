@@ -2,7 +2,7 @@
 import itertools
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 
 from websockets.sync.client import connect as ws_connect
 
@@ -11,9 +11,17 @@ from modelon.impact.client.sal.ws_response import JsonRpcResponse
 
 logger = logging.getLogger(__name__)
 
+NotificationHandler = Callable[[Dict[str, Any]], None]
+
 
 class SyncWebSocketClient:
-    def __init__(self, uri: URI, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        uri: URI,
+        api_key: Optional[str] = None,
+        on_notification: Optional[NotificationHandler] = None,
+    ):
+        self._on_notification = on_notification
         url = (uri / "/api/modeling/rpc").resolve()
         headers = {"User-Agent": "impact-python-client"}
         if api_key:
@@ -46,12 +54,34 @@ class SyncWebSocketClient:
                 message = self._conn.recv(timeout=timeout)
             except TimeoutError:
                 raise TimeoutError(f"Timeout waiting for response to msg_id {msg_id}")
-            msg_str = message.decode() if isinstance(message, bytes) else message
-            logger.debug(f"Received message: {msg_str}")
-            resp = json.loads(message)
-            if resp.get("method") == "impact/workspace":
-                logger.info(resp.get("params", {}).get("message"))
+            resp = self._decode(message)
+            if self._is_notification(resp):
                 continue
             response = JsonRpcResponse(resp)
             if response.id == msg_id:
                 return response.result
+
+    def receive_notification(self, timeout: float) -> None:
+        """Waits for the next message and passes it to the notification handler if it is
+        an 'impact/workspace' notification.
+
+        Raises:
+            TimeoutError if no message is received within the timeout.
+
+        """
+        self._is_notification(self._decode(self._conn.recv(timeout=timeout)))
+
+    @staticmethod
+    def _decode(message: Any) -> Dict[str, Any]:
+        msg_str = message.decode() if isinstance(message, bytes) else message
+        logger.debug(f"Received message: {msg_str}")
+        return json.loads(msg_str)
+
+    def _is_notification(self, resp: Dict[str, Any]) -> bool:
+        if resp.get("method") != "impact/workspace":
+            return False
+        params = resp.get("params") or {}
+        logger.info(params.get("message") if isinstance(params, dict) else params)
+        if self._on_notification is not None:
+            self._on_notification(params)
+        return True
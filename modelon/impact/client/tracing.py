@@ -0,0 +1,141 @@
+"""This module provides optional span based tracing of client calls.
+
+By default no spans are recorded. Setting a tracer makes entity methods,
+operation wait loops and every HTTP request open nested spans, with
+attributes such as the workspace, experiment and case IDs. The interface
+matches OpenTelemetry, so an OpenTelemetry tracer can be used directly.
+
+Example::
+
+    from opentelemetry import trace
+    from modelon.impact.client import tracing
+
+    tracing.set_tracer(trace.get_tracer("modelon.impact.client"))
+    workspace.execute(experiment_definition).wait()
+
+"""
+from __future__ import annotations
+
+import functools
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Optional,
+    Protocol,
+    TypeVar,
+    cast,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ID_ATTRIBUTES = {
+    "_workspace_id": "impact.workspace.id",
+    "_exp_id": "impact.experiment.id",
+    "_experiment_id": "impact.experiment.id",
+    "_case_id": "impact.case.id",
+    "_fmu_id": "impact.model_executable.id",
+    "_project_id": "impact.project.id",
+    "_artifact_id": "impact.artifact.id",
+    "_result_id": "impact.external_result.id",
+}
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> None:
+        ...
+
+    def is_recording(self) -> bool:
+        ...
+
+
+class Tracer(Protocol):
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Span]:
+        ...
+
+
+class NoOpSpan:
+    """Span that records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+    def __enter__(self) -> NoOpSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+class NoOpTracer:
+    """Tracer that records nothing, used when no tracer is set."""
+
+    _span = NoOpSpan()
+
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> NoOpSpan:
+        return self._span
+
+
+_tracer: Tracer = NoOpTracer()
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Sets the tracer used for all clients. Give None to disable tracing.
+
+    Args:
+        tracer: A tracer with the OpenTelemetry 'start_as_current_span' interface,
+            for example the tracer returned by 'opentelemetry.trace.get_tracer'.
+
+    """
+    global _tracer
+    _tracer = tracer if tracer is not None else NoOpTracer()
+
+
+def get_tracer() -> Tracer:
+    """Returns the tracer used for all clients."""
+    return _tracer
+
+
+def is_enabled() -> bool:
+    """Returns True if a tracer recording spans is set."""
+    return not isinstance(_tracer, NoOpTracer)
+
+
+def start_span(
+    name: str, attributes: Optional[Dict[str, Any]] = None
+) -> ContextManager[Span]:
+    """Starts a span nested in the current span."""
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def id_attributes(obj: Any) -> Dict[str, Any]:
+    """Returns span attributes for the IDs of an entity or operation."""
+    attributes = {}
+    for attr, key in _ID_ATTRIBUTES.items():
+        value = getattr(obj, attr, None)
+        if isinstance(value, str):
+            attributes[key] = value
+    return attributes
+
+
+def traced(func: F) -> F:
+    """Decorator for entity methods opening a span named '<class>.<method>' with the IDs
+    of the entity as attributes."""
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not is_enabled():
+            return func(self, *args, **kwargs)
+        name = f"{type(self).__name__}.{func.__name__}"
+        with start_span(name, attributes=id_attributes(self)):
+            return func(self, *args, **kwargs)
+
+    return cast(F, wrapper)
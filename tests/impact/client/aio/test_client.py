@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from modelon.impact.client.aio import AsyncClient
+from modelon.impact.client.aio.entities import AsyncWorkspace
+from tests.impact.client.helpers import IDs
+
+
+def test_get_workspace(single_workspace):
+    cred_manager = MagicMock()
+    cred_manager.get_key.return_value = "test_async_client_key"
+
+    async def run():
+        async with await AsyncClient.connect(
+            url=single_workspace.url,
+            context=single_workspace.context,
+            credential_manager=cred_manager,
+        ) as client:
+            return await client.get_workspace(IDs.WORKSPACE_ID_PRIMARY)
+
+    workspace = asyncio.run(run())
+    assert isinstance(workspace, AsyncWorkspace)
+    assert workspace.id == IDs.WORKSPACE_ID_PRIMARY
+
+
+def test_service_methods_are_coroutines(single_workspace):
+    cred_manager = MagicMock()
+    cred_manager.get_key.return_value = "test_async_client_key"
+
+    async def run():
+        async with await AsyncClient.connect(
+            url=single_workspace.url,
+            context=single_workspace.context,
+            credential_manager=cred_manager,
+        ) as client:
+            return await client.service.workspace.workspace_get(
+                IDs.WORKSPACE_ID_PRIMARY, size_info=False
+            )
+
+    assert asyncio.run(run())["id"] == IDs.WORKSPACE_ID_PRIMARY
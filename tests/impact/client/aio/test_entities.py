@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from modelon.impact.client import exceptions
+from modelon.impact.client.aio.entities import (
+    AsyncExperiment,
+    AsyncModel,
+    AsyncModelExecutable,
+    AsyncWorkspace,
+    wrap,
+)
+from modelon.impact.client.aio.operations import AwaitableOperation
+from modelon.impact.client.aio.transport import AsyncTransport
+from modelon.impact.client.operations.base import Status
+from modelon.impact.client.operations.polling import PollingStrategy
+from tests.impact.client.helpers import IDs
+
+
+@pytest.fixture
+def transport():
+    transport = AsyncTransport(max_workers=4)
+    yield transport
+    transport.close()
+
+
+def test_transport_runs_calls_in_thread_pool(transport):
+    async def run():
+        return await transport.run(threading.current_thread)
+
+    thread = asyncio.run(run())
+    assert thread is not threading.current_thread()
+    assert thread.name.startswith("impact-client")
+
+
+def test_transport_runs_calls_concurrently(transport):
+    async def run():
+        start = time.time()
+        await asyncio.gather(*[transport.run(time.sleep, 0.2) for _ in range(4)])
+        return time.time() - start
+
+    assert asyncio.run(run()) < 0.6
+
+
+def test_workspace_execute_wait(workspace, transport):
+    async def run():
+        async_workspace = AsyncWorkspace(workspace.entity, transport)
+        return await async_workspace.execute({}).wait()
+
+    experiment = asyncio.run(run())
+    assert isinstance(experiment, AsyncExperiment)
+    assert experiment.id == IDs.EXPERIMENT_ID_PRIMARY
+    assert experiment.sync.id == IDs.EXPERIMENT_ID_PRIMARY
+
+
+def test_workspace_execute_not_submitted_until_awaited(workspace, transport):
+    async def run():
+        operation = AsyncWorkspace(workspace.entity, transport).execute({})
+        assert operation.sync is None
+        await operation
+        return operation
+
+    operation = asyncio.run(run())
+    assert operation.id == IDs.EXPERIMENT_ID_PRIMARY
+    assert operation.name == "Execution"
+    workspace.service.experiment.experiment_execute.assert_called_once()
+
+
+def test_workspace_execute_submitted_once_when_awaited_concurrently(
+    workspace, transport
+):
+    async def run():
+        operation = AsyncWorkspace(workspace.entity, transport).execute({})
+        return await asyncio.gather(operation.wait(), operation.status(), operation)
+
+    experiment, status, _ = asyncio.run(run())
+    assert experiment.id == IDs.EXPERIMENT_ID_PRIMARY
+    workspace.service.experiment.experiment_execute.assert_called_once()
+
+
+def test_cancel_not_submitted_operation(workspace, transport):
+    async def run():
+        operation = AsyncWorkspace(workspace.entity, transport).execute({})
+        await operation.cancel()
+        return operation
+
+    operation = asyncio.run(run())
+    assert operation.sync is None
+    workspace.service.experiment.experiment_execute.assert_not_called()
+    workspace.service.experiment.execute_cancel.assert_not_called()
+
+
+def test_execute_wait_timeout(workspace_execute_running, transport):
+    async def run():
+        async_workspace = AsyncWorkspace(workspace_execute_running, transport)
+        await async_workspace.execute({}).wait(
+            timeout=1e-10, polling=PollingStrategy.fixed(0)
+        )
+
+    with pytest.raises(exceptions.OperationTimeOutError):
+        asyncio.run(run())
+
+
+def test_execute_wait_for_status(workspace_execute_cancelled, transport):
+    async def run():
+        operation = AsyncWorkspace(workspace_execute_cancelled, transport).execute({})
+        return await operation.wait(status=Status.CANCELLED), await operation.status()
+
+    experiment, status = asyncio.run(run())
+    assert experiment.id == IDs.EXPERIMENT_ID_PRIMARY
+    assert status == Status.CANCELLED
+
+
+def test_concurrent_executions(workspace, transport):
+    async def run():
+        async_workspace = AsyncWorkspace(workspace.entity, transport)
+        return await asyncio.gather(
+            *[async_workspace.execute({}).wait() for _ in range(10)]
+        )
+
+    experiments = asyncio.run(run())
+    assert len(experiments) == 10
+    assert workspace.service.experiment.experiment_execute.call_count == 10
+
+
+def test_workspace_get_entities(workspace, transport):
+    async def run():
+        async_workspace = AsyncWorkspace(workspace.entity, transport)
+        return (
+            await async_workspace.get_experiments(),
+            await async_workspace.get_fmus(),
+        )
+
+    experiments, fmus = asyncio.run(run())
+    assert [exp.id for exp in experiments] == [
+        IDs.EXPERIMENT_ID_PRIMARY,
+        IDs.EXPERIMENT_ID_SECONDARY,
+    ]
+    assert all(isinstance(fmu, AsyncModelExecutable) for fmu in fmus)
+    assert [fmu.id for fmu in fmus] == [IDs.FMU_ID_PRIMARY, IDs.FMU_ID_SECONDARY]
+
+
+def test_model_compile_wait(model_compiled, compiler_options, transport):
+    async def run():
+        model = AsyncModel(model_compiled, transport)
+        return await model.compile(compiler_options, force_compilation=True).wait()
+
+    fmu = asyncio.run(run())
+    assert isinstance(fmu, AsyncModelExecutable)
+    assert fmu.id == IDs.FMU_ID_PRIMARY
+
+
+def test_wrap_unknown_entity_unchanged(transport):
+    entity = object()
+    assert wrap(entity, transport) is entity
+
+
+def test_awaitable_operation_of_sync_operation(workspace, transport):
+    async def run():
+        operation = AwaitableOperation(
+            workspace.entity.execute({}),
+            transport,
+            lambda entity: wrap(entity, transport),
+        )
+        return await operation.wait()
+
+    assert asyncio.run(run()).id == IDs.EXPERIMENT_ID_PRIMARY
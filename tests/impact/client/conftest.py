@@ -2,19 +2,20 @@ import collections
 import copy
 import json
 import os
-from unittest.mock import MagicMock
 
 import pytest
 import requests
 import requests_mock
 
 from modelon.impact.client import Client
+from modelon.impact.client.operations.polling import PollingStrategy
 from modelon.impact.client.options import (
     CompilerOptions,
     SimulationOptions,
     SolverOptions,
 )
 from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.context import Context
 from tests.impact.client.helpers import (
     UNVERSIONED_PROJECT,
     VERSIONED_PROJECT_BRANCH,
@@ -26,12 +27,14 @@ from tests.impact.client.helpers import (
     create_model_entity,
     create_model_exe_entity,
     create_published_workspace_entity,
+    create_service_mock,
     create_workspace_entity,
     get_test_get_fmu,
     get_test_published_workspace_definition,
     get_test_workspace_definition,
     with_exception,
     with_json_route,
+    with_octet_stream_route,
 )
 
 ExperimentMock = collections.namedtuple("ExperimentMock", ["entity", "service"])
@@ -44,8 +47,9 @@ ModelMock = collections.namedtuple("ModelMock", ["entity", "service"])
 MockedServer = collections.namedtuple("MockedServer", ["url", "context", "adapter"])
 
 
-class MockContex:
+class MockContex(Context):
     def __init__(self, session):
+        super().__init__()
         self.session = session
 
 
@@ -158,6 +162,11 @@ def get_with_ssl_exception(mock_server_base):
     return with_exception(mock_server_base, "GET", "", requests.exceptions.SSLError)
 
 
+@pytest.fixture
+def get_octet_stream(mock_server_base):
+    return with_octet_stream_route(mock_server_base, "GET", "", bytes(range(256)) * 64)
+
+
 def get_upload_status_data(status):
     resource_uri = f"api/external-result/{IDs.EXTERNAL_RESULT_ID}"
     status_data = {
@@ -204,7 +213,7 @@ def get_external_result_data():
 
 @pytest.fixture
 def external_result_sal_upload():
-    service = MagicMock()
+    service = create_service_mock()
     external_result_service = service.external_result
     external_result_service.result_upload.return_value = get_result_upload_post_data()
     external_result_service.get_uploaded_result.return_value = (
@@ -296,7 +305,7 @@ def _custom_function_parameter_list():
 
 @pytest.fixture
 def publish_workspace():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     import_service = service.imports
     import_service.get_import_status.return_value = {
@@ -346,7 +355,7 @@ def publish_workspace():
 
 @pytest.fixture
 def workspace():
-    service = MagicMock()
+    service = create_service_mock()
     export_service = service.exports
     ws_service = service.workspace
     custom_function_service = service.custom_function
@@ -506,7 +515,7 @@ def workspace():
 
 @pytest.fixture
 def workspace_execute_running():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     exp_service = service.experiment
     ws_service.experiment_create.return_value = {
@@ -519,7 +528,7 @@ def workspace_execute_running():
 
 @pytest.fixture
 def workspace_execute_cancelled():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     exp_service = service.experiment
     ws_service.experiment_create.return_value = {
@@ -538,7 +547,7 @@ def workspace_ops(single_workspace):
 
 @pytest.fixture
 def custom_function():
-    service = MagicMock()
+    service = create_service_mock()
     custom_function_service = service.custom_function
     custom_function_service.custom_function_get.return_value = {
         "name": IDs.DYNAMIC_CF,
@@ -566,7 +575,7 @@ def custom_function():
 
 @pytest.fixture
 def custom_function_no_param():
-    service = MagicMock()
+    service = create_service_mock()
     custom_function_service = service.custom_function
     opts = {
         "compiler": {"c_compiler": "gcc"},
@@ -582,7 +591,7 @@ def custom_function_no_param():
 
 @pytest.fixture
 def model_compiled():
-    service = MagicMock()
+    service = create_service_mock()
     model_exe_service = service.model_executable
     model_exe_service.fmu_setup.return_value = (None, {})
     model_exe_service.compile_model.return_value = IDs.FMU_ID_PRIMARY
@@ -597,7 +606,7 @@ def model_compiled():
 
 @pytest.fixture
 def model_cached():
-    service = MagicMock()
+    service = create_service_mock()
     model_exe_service = service.model_executable
     model_exe_service.fmu_setup.return_value = (IDs.FMU_ID_PRIMARY, {})
     model_exe_service.compile_status.return_value = {"status": "done"}
@@ -611,7 +620,7 @@ def model_cached():
 
 @pytest.fixture
 def model_compiling():
-    service = MagicMock()
+    service = create_service_mock()
     model_exe_service = service.model_executable
     model_exe_service.fmu_setup.return_value = (None, {})
     model_exe_service.compile_model.return_value = IDs.FMU_ID_PRIMARY
@@ -626,7 +635,7 @@ def model_compiling():
 
 @pytest.fixture
 def model_compile_cancelled():
-    service = MagicMock()
+    service = create_service_mock()
     model_exe_service = service.model_executable
     model_exe_service.fmu_setup.return_value = (None, {})
     model_exe_service.compile_model.return_value = IDs.FMU_ID_PRIMARY
@@ -641,7 +650,7 @@ def model_compile_cancelled():
 
 @pytest.fixture
 def compiler_options():
-    service = MagicMock()
+    service = create_service_mock()
     custom_function_service = service.custom_function
     opts = {
         "compiler": {"c_compiler": "gcc"},
@@ -655,7 +664,7 @@ def compiler_options():
 
 @pytest.fixture
 def simulation_options():
-    service = MagicMock()
+    service = create_service_mock()
     custom_function_service = service.custom_function
     opts = {
         "compiler": {"c_compiler": "gcc"},
@@ -669,7 +678,7 @@ def simulation_options():
 
 @pytest.fixture
 def solver_options():
-    service = MagicMock()
+    service = create_service_mock()
     custom_function_service = service.custom_function
     opts = {
         "compiler": {"c_compiler": "gcc"},
@@ -683,7 +692,7 @@ def solver_options():
 
 @pytest.fixture
 def fmu():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     model_exe_service = service.model_executable
     ws_service.fmu_get.return_value = get_test_get_fmu()
@@ -702,7 +711,7 @@ def fmu():
 
 @pytest.fixture
 def fmu_with_modifiers():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     model_exe_service = service.model_executable
     ws_service.fmu_get.return_value = get_test_get_fmu()
@@ -724,7 +733,7 @@ def fmu_with_modifiers():
 
 @pytest.fixture
 def model():
-    service = MagicMock()
+    service = create_service_mock()
     import_service = service.imports
     import_service.get_import_status.return_value = {
         "data": {
@@ -769,7 +778,7 @@ def model():
 
 @pytest.fixture
 def fmu_compile_failed():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     model_exe_service = service.model_executable
     ws_service.fmu_get.return_value = {"run_info": {"status": "failed"}}
@@ -782,7 +791,7 @@ def fmu_compile_failed():
 
 @pytest.fixture
 def fmu_compile_cancelled():
-    service = MagicMock()
+    service = create_service_mock()
     ws_service = service.workspace
     model_exe_service = service.model_executable
     ws_service.fmu_get.return_value = {"run_info": {"status": "cancelled"}}
@@ -794,7 +803,7 @@ def fmu_compile_cancelled():
 
 @pytest.fixture
 def experiment():
-    service = MagicMock()
+    service = create_service_mock()
     exp_service = service.experiment
     exp_service.experiment_execute.return_value = IDs.EXPERIMENT_ID_PRIMARY
     exp_service.execute_status.return_value = {"status": "done"}
@@ -830,6 +839,8 @@ def experiment():
         }
     }
     exp_service.case_artifact_get.return_value = (bytes(4), IDs.RESULT_MAT)
+    exp_service.case_artifact_download_to.return_value = IDs.RESULT_MAT
+    exp_service.case_result_download_to.return_value = IDs.RESULT_MAT
     exp_service.trajectories_get.return_value = [[[1, 2, 3, 4]], [[5, 2, 9, 4]]]
     exp_service.case_trajectories_get.return_value = [[1, 2, 3, 4], [5, 2, 9, 4]]
     return ExperimentMock(
@@ -842,7 +853,7 @@ def experiment():
 
 @pytest.fixture
 def experiment_running():
-    service = MagicMock()
+    service = create_service_mock()
     exp_service = service.experiment
     exp_service.experiment_execute.return_value = IDs.EXPERIMENT_ID_PRIMARY
     exp_service.case_get.return_value = {"id": IDs.CASE_ID_PRIMARY}
@@ -854,7 +865,7 @@ def experiment_running():
 
 @pytest.fixture
 def experiment_cancelled():
-    service = MagicMock()
+    service = create_service_mock()
     exp_service = service.experiment
     exp_service.experiment_execute.return_value = IDs.EXPERIMENT_ID_PRIMARY
     exp_service.case_get.return_value = {"id": IDs.CASE_ID_PRIMARY}
@@ -975,17 +986,20 @@ def get_versioned_new_project_branch(user_with_license, mock_server_base):
 
 @pytest.fixture(name="client_helper")
 def setup_client():
+    polling = None
     if os.environ.get("UPDATE_CASSETTE", "False") not in ["True", "1"]:
         os.environ["MODELON_IMPACT_CLIENT_API_KEY"] = "dummy"
         os.environ["MODELON_IMPACT_USERNAME"] = IDs.USERNAME
         os.environ["MODELON_IMPACT_USERID"] = IDs.USER_ID
+        # Statuses are replayed in recorded order, no need to sleep between polls
+        polling = PollingStrategy.fixed(0)
     else:
         userid = json.loads(os.environ["MODELON_IMPACT_USERID_JSON"])
         os.environ["MODELON_IMPACT_USERNAME"] = userid["username"]
         os.environ["MODELON_IMPACT_USERID"] = userid["id"]
         os.environ["MODELON_IMPACT_TENANTID"] = userid["tenantId"]
 
-    client = Client()
+    client = Client(polling=polling)
     assert client.get_me().username.lower() in [
         os.environ.get("MODELON_IMPACT_USERNAME", "").lower(),
         IDs.USERNAME,
@@ -281,6 +281,22 @@ class TestCase:
         artifact_stream = artifact.get_data()
         assert artifact_stream == b"\x00\x00\x00\x00"
 
+    def test_download_result(self, experiment):
+        case = experiment.entity.get_case(IDs.CASE_ID_PRIMARY)
+        path = tempfile.mkdtemp()
+        download_to = experiment.service.experiment.case_result_download_to
+
+        def write_result(workspace_id, experiment_id, case_id, sink, result_format):
+            with open(sink, "wb") as f:
+                f.write(b"\x00")
+            return IDs.RESULT_MAT
+
+        download_to.side_effect = write_result
+        resp = case.download_result(path)
+        assert resp == os.path.join(path, IDs.RESULT_MAT)
+        assert os.listdir(path) == [IDs.RESULT_MAT]
+        download_to.assert_called_once()
+
     @pytest.mark.vcr()
     def test_get_csv_result(self, client_helper: ClientHelper):
         batch_experiment = client_helper.create_and_execute_experiment(
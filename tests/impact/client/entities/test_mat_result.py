@@ -0,0 +1,180 @@
+import mmap
+import struct
+import sys
+
+import pytest
+
+from modelon.impact.client.entities.mat_result import MatResult, MissingVariableError
+from tests.impact.client.helpers import IDs, create_case_entity, create_service_mock
+
+NAMES = ["time", "p", "x", "y", "z"]
+DESCRIPTIONS = ["Time", "A parameter", "State x", "Negated x", ""]
+DATA_INFO = [[0, 1, 0, -1], [1, 2, 0, 0], [2, 2, 0, 0], [2, -2, 0, 0], [2, 3, 0, 0]]
+DATA_1 = [[0.0, 5.0], [1.0, 5.0]]
+DATA_2 = [[0.0, 1.0, 3.0], [0.5, 2.0, 4.0], [1.0, 3.0, 5.0]]
+
+
+def _matrix(name, mopt, table, transposed, fmt, byte_order="<"):
+    rows, columns = len(table), len(table[0]) if table else 0
+    if transposed:
+        values = [value for row in table for value in row]
+        rows, columns = columns, rows
+    else:
+        values = [table[i][j] for j in range(columns) for i in range(rows)]
+    header = struct.pack(
+        f"{byte_order}5i", mopt, rows, columns, 0, len(name.encode()) + 1
+    )
+    data = struct.pack(f"{byte_order}{len(values)}{fmt}", *values)
+    return header + name.encode() + b"\x00" + data
+
+
+def _text(name, strings, transposed):
+    width = max(len(string) for string in strings)
+    table = [list(string.ljust(width).encode()) for string in strings]
+    return _matrix(name, 51, table, transposed, "B")
+
+
+def _write_result(path, transposed=True, data_2_mopt=0, data_2_order="<"):
+    layout = "binTrans" if transposed else "binNormal"
+    content = (
+        _text("Aclass", ["Atrajectory", "1.1", "", layout], transposed=False)
+        + _text("name", NAMES, transposed)
+        + _text("description", DESCRIPTIONS, transposed)
+        + _matrix("dataInfo", 20, DATA_INFO, transposed, "i")
+        + _matrix("data_1", 0, DATA_1, transposed, "d")
+        + _matrix(
+            "data_2",
+            data_2_mopt,
+            DATA_2,
+            transposed,
+            "f" if data_2_mopt % 100 == 10 else "d",
+            data_2_order,
+        )
+    )
+    path.write_bytes(content)
+    return str(path)
+
+
+@pytest.fixture
+def np():
+    return pytest.importorskip("numpy")
+
+
+def test_requires_numpy(tmp_path, monkeypatch):
+    path = _write_result(tmp_path / "result.mat")
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(
+        ImportError, match=r"pip install modelon-impact-client\[numpy\]"
+    ):
+        MatResult(path)
+
+
+class TestMatResult:
+    @pytest.mark.parametrize("transposed", [True, False])
+    def test_trajectories(self, np, tmp_path, transposed):
+        with MatResult(_write_result(tmp_path / "r.mat", transposed)) as result:
+            assert list(result.keys()) == NAMES
+            assert len(result) == 5
+            assert result["time"].tolist() == [0.0, 0.5, 1.0]
+            assert result["x"].tolist() == [1.0, 2.0, 3.0]
+            assert result["y"].tolist() == [-1.0, -2.0, -3.0]
+            assert result["z"].tolist() == [3.0, 4.0, 5.0]
+            assert result["p"].tolist() == [5.0, 5.0]
+            assert result.description("x") == "State x"
+            assert result.description("z") == ""
+
+    def test_values_are_views_of_the_file(self, np, tmp_path):
+        with MatResult(_write_result(tmp_path / "r.mat")) as result:
+            x = result["x"]
+            assert x.dtype == np.float64
+            assert not x.flags.owndata
+            assert not x.flags.writeable
+
+    @pytest.mark.parametrize("mopt,byte_order", [(10, "<"), (1000, ">"), (1010, ">")])
+    def test_data_types_and_byte_order(self, np, tmp_path, mopt, byte_order):
+        path = _write_result(
+            tmp_path / "r.mat", data_2_mopt=mopt, data_2_order=byte_order
+        )
+        with MatResult(path) as result:
+            assert result["x"].tolist() == [1.0, 2.0, 3.0]
+            assert result["time"].tolist() == [0.0, 0.5, 1.0]
+
+    def test_missing_variable(self, np, tmp_path):
+        with MatResult(_write_result(tmp_path / "r.mat")) as result:
+            assert "x" in result
+            assert "w" not in result
+            pytest.raises(ValueError, result.__getitem__, "w")
+            with pytest.raises(MissingVariableError) as exc_info:
+                result["w"]
+            assert str(exc_info.value) == (
+                "Variable(s) 'w' is not present in the result"
+            )
+
+    def test_get(self, np, tmp_path):
+        with MatResult(_write_result(tmp_path / "r.mat")) as result:
+            assert result.get("x").tolist() == [1.0, 2.0, 3.0]
+            assert result.get("w") is None
+            assert result.get("w", "default") == "default"
+
+    def test_closed(self, np, tmp_path):
+        result = MatResult(_write_result(tmp_path / "r.mat"))
+        x = result["x"]
+        result.close()
+        result.close()
+
+        assert x.tolist() == [1.0, 2.0, 3.0]
+        pytest.raises(ValueError, result.__getitem__, "z")
+
+    def test_invalid_file(self, np, tmp_path):
+        empty = tmp_path / "empty.mat"
+        empty.write_bytes(b"")
+        invalid = tmp_path / "invalid.mat"
+        invalid.write_bytes(b"not a result file at all")
+        truncated = tmp_path / "truncated.mat"
+        _write_result(truncated)
+        truncated.write_bytes(truncated.read_bytes()[:-8])
+
+        pytest.raises(ValueError, MatResult, str(empty))
+        pytest.raises(ValueError, MatResult, str(invalid))
+        pytest.raises(ValueError, MatResult, str(truncated))
+
+    def test_invalid_file_closed(self, np, tmp_path, monkeypatch):
+        mapped = []
+
+        class RecordingMmap(mmap.mmap):
+            def __init__(self, *args, **kwargs):
+                mapped.append(self)
+
+        monkeypatch.setattr(mmap, "mmap", RecordingMmap)
+        invalid = tmp_path / "invalid.mat"
+        invalid.write_bytes(b"not a result file at all")
+
+        pytest.raises(ValueError, MatResult, str(invalid))
+        assert len(mapped) == 1
+        assert mapped[0].closed
+
+    def test_case_download_mat_result(self, np, tmp_path):
+        source = tmp_path / "source.mat"
+        _write_result(source)
+        content = source.read_bytes()
+
+        def download(workspace_id, exp_id, case_id, path, result_format):
+            with open(path, "wb") as f:
+                f.write(content)
+            return "result.mat"
+
+        service = create_service_mock()
+        service.experiment.case_get.return_value = {
+            "run_info": {"status": "successful", "consistent": True}
+        }
+        service.experiment.case_result_download_to.side_effect = download
+        case = create_case_entity(
+            IDs.CASE_ID_PRIMARY,
+            IDs.WORKSPACE_ID_PRIMARY,
+            IDs.EXPERIMENT_ID_PRIMARY,
+            service,
+        )
+
+        with case.download_mat_result(str(tmp_path / "downloads")) as result:
+            assert result.path == str(tmp_path / "downloads" / "result.mat")
+            assert result["x"].tolist() == [1.0, 2.0, 3.0]
@@ -0,0 +1,152 @@
+import threading
+from unittest.mock import call
+
+import pytest
+
+from modelon.impact.client.entities.result import Result
+from modelon.impact.client.sal import deadline
+from tests.impact.client.helpers import IDs, create_service_mock
+
+VARIABLES = ["a", "b", "c", "d", "e"]
+
+
+def _result(batch_size=2):
+    service = create_service_mock()
+    service.experiment.case_trajectories_get.side_effect = (
+        lambda workspace_id, exp_id, case_id, variables, last_point_only: [
+            [float(ord(variable))] for variable in variables
+        ]
+    )
+    result = Result(
+        VARIABLES,
+        IDs.CASE_ID_PRIMARY,
+        IDs.WORKSPACE_ID_PRIMARY,
+        IDs.EXPERIMENT_ID_PRIMARY,
+        service,
+        batch_size=batch_size,
+    )
+    return result, service.experiment.case_trajectories_get
+
+
+def _fetched(variables):
+    return call(
+        IDs.WORKSPACE_ID_PRIMARY,
+        IDs.EXPERIMENT_ID_PRIMARY,
+        IDs.CASE_ID_PRIMARY,
+        variables,
+        False,
+    )
+
+
+class TestResult:
+    def test_iterate_in_batches(self):
+        result, fetch = _result(batch_size=2)
+
+        assert dict(result.items()) == {
+            variable: [float(ord(variable))] for variable in VARIABLES
+        }
+        assert fetch.call_args_list == [
+            _fetched(["a", "b"]),
+            _fetched(["c", "d"]),
+            _fetched(["e"]),
+        ]
+
+    def test_only_case_scoped_requests(self):
+        result, _ = _result()
+        list(result)
+        result._sal.experiment.trajectories_get.assert_not_called()
+
+    def test_memoized(self):
+        result, fetch = _result(batch_size=10)
+
+        assert result["c"] == [99.0]
+        assert result["c"] == [99.0]
+        assert list(result) == VARIABLES
+        assert list(result.values())[0] == [97.0]
+
+        assert fetch.call_args_list == [
+            _fetched(["c"]),
+            _fetched(["a", "b", "d", "e"]),
+        ]
+
+    def test_missing_variable(self):
+        result, fetch = _result()
+
+        assert "a" in result
+        assert "x" not in result
+        pytest.raises(ValueError, result.__getitem__, "x")
+        fetch.assert_not_called()
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            _result(batch_size=0)
+
+    def test_prefetch_batches_concurrently(self):
+        result, fetch = _result(batch_size=2)
+        barrier = threading.Barrier(3, timeout=5)
+        fetch_one = fetch.side_effect
+
+        def fetch_concurrently(*args):
+            barrier.wait()
+            return fetch_one(*args)
+
+        fetch.side_effect = fetch_concurrently
+        result.prefetch(max_workers=3)
+
+        assert sorted(c.args[3] for c in fetch.call_args_list) == [
+            ["a", "b"],
+            ["c", "d"],
+            ["e"],
+        ]
+        assert result["e"] == [101.0]
+        assert fetch.call_count == 3
+
+    def test_prefetch_only_missing(self):
+        result, fetch = _result(batch_size=10)
+
+        result["b"]
+        result.prefetch(["a", "b", "c", "a"])
+        result.prefetch(["c"])
+
+        assert fetch.call_args_list == [_fetched(["b"]), _fetched(["a", "c"])]
+
+    def test_prefetch_keeps_deadline(self):
+        result, fetch = _result(batch_size=1)
+        remaining = []
+        fetch_one = fetch.side_effect
+
+        def fetch_with_deadline(*args):
+            remaining.append(deadline.remaining())
+            return fetch_one(*args)
+
+        fetch.side_effect = fetch_with_deadline
+        with deadline.deadline(60):
+            result.prefetch(["a", "b"])
+
+        assert len(remaining) == 2
+        assert all(left is not None and left <= 60 for left in remaining)
+
+    def test_prefetch_error_raised(self):
+        result, fetch = _result(batch_size=1)
+        fetch.side_effect = RuntimeError("Unavailable")
+
+        with pytest.raises(RuntimeError):
+            result.prefetch(["a", "b"])
+
+    def test_prefetch_invalid(self):
+        result, fetch = _result()
+
+        pytest.raises(ValueError, result.prefetch, ["a", "x"])
+        pytest.raises(ValueError, result.prefetch, ["a"], max_workers=0)
+        fetch.assert_not_called()
+
+    def test_get_many(self):
+        result, fetch = _result(batch_size=2)
+
+        assert result.get_many(["d", "a", "c"]) == {
+            "d": [100.0],
+            "a": [97.0],
+            "c": [99.0],
+        }
+        assert result["a"] == [97.0]
+        assert fetch.call_count == 2
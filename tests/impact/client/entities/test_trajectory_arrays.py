@@ -0,0 +1,119 @@
+import sys
+
+import pytest
+
+from modelon.impact.client.entities.trajectory_arrays import TrajectoryArrays
+from tests.impact.client.helpers import (
+    IDs,
+    create_case_entity,
+    create_experiment_entity,
+    create_service_mock,
+)
+
+
+@pytest.fixture
+def np():
+    return pytest.importorskip("numpy")
+
+
+def test_requires_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(
+        ImportError, match=r"pip install modelon-impact-client\[numpy\]"
+    ):
+        TrajectoryArrays.from_trajectories(["case_1"], ["h"], [[[1.0]]])
+
+
+class TestTrajectoryArrays:
+    def test_rectangular(self, np):
+        trajectories = [[[1.0, 2.0], [3.0, 4.0]], [[0.0, 1.0], [0.0, 1.0]]]
+
+        arrays = TrajectoryArrays.from_trajectories(
+            ["case_1", "case_2"], ["h", "time"], trajectories
+        )
+
+        assert list(arrays) == ["h", "time"]
+        assert arrays["h"].dtype == np.float64
+        assert arrays["h"].shape == (2, 2)
+        assert arrays["h"].flags["C_CONTIGUOUS"]
+        assert not arrays.is_ragged("h")
+        assert arrays.offsets("h") is None
+        assert arrays.case_index == {"case_1": 0, "case_2": 1}
+        assert arrays.case("case_2", "h").tolist() == [3.0, 4.0]
+        # The lists are released once converted
+        assert trajectories == [None, None]
+
+    def test_ragged(self, np):
+        arrays = TrajectoryArrays.from_trajectories(
+            ["case_1", "case_2", "case_3"], ["h"], [[[1.0, 2.0, 3.0], None, [4.0]]]
+        )
+
+        assert arrays.is_ragged("h")
+        assert arrays["h"].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert arrays.offsets("h").tolist() == [0, 3, 3, 4]
+        assert arrays.case("case_1", "h").tolist() == [1.0, 2.0, 3.0]
+        assert arrays.case("case_2", "h").tolist() == []
+        assert arrays.case("case_3", "h").tolist() == [4.0]
+
+    def test_missing_values_are_nan(self, np):
+        arrays = TrajectoryArrays.from_trajectories(
+            ["case_1", "case_2"], ["h", "x"], [[[1.0, None], [2.0, 3.0]], [[None], []]]
+        )
+
+        assert np.isnan(arrays["h"][0, 1])
+        assert np.isnan(arrays["x"][0])
+
+    def test_no_cases(self, np):
+        arrays = TrajectoryArrays.from_trajectories([], ["h"], [[]])
+        assert arrays["h"].shape == (0, 0)
+
+
+class TestGetTrajectoryArrays:
+    def test_experiment(self, np):
+        service = create_service_mock()
+        service.experiment.experiment_result_variables_get.return_value = ["h", "time"]
+        service.experiment.trajectories_get.return_value = [
+            [[1.0, 2.0], [3.0, 4.0]],
+            [[0.0, 1.0], [0.0, 1.0]],
+        ]
+        experiment = create_experiment_entity(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        arrays = experiment.get_trajectory_arrays(["h", "time"])
+
+        assert arrays.cases == [IDs.CASE_ID_PRIMARY, IDs.CASE_ID_SECONDARY]
+        assert arrays["h"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+        assert arrays["time"][:, -1].tolist() == [1.0, 1.0]
+
+    def test_experiment_invalid_variables(self, np):
+        service = create_service_mock()
+        service.experiment.experiment_result_variables_get.return_value = ["h"]
+        experiment = create_experiment_entity(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        pytest.raises(TypeError, experiment.get_trajectory_arrays, "h")
+        pytest.raises(ValueError, experiment.get_trajectory_arrays, ["s"])
+
+    def test_case(self, np):
+        service = create_service_mock()
+        service.experiment.case_get.return_value = {
+            "run_info": {"status": "successful", "consistent": True}
+        }
+        service.experiment.case_result_variables_get.return_value = ["h", "time"]
+        service.experiment.case_trajectories_get.return_value = [
+            [1.0, 2.0],
+            [0.0, 1.0],
+        ]
+        case = create_case_entity(
+            IDs.CASE_ID_PRIMARY,
+            IDs.WORKSPACE_ID_PRIMARY,
+            IDs.EXPERIMENT_ID_PRIMARY,
+            service,
+        )
+
+        arrays = case.get_trajectory_arrays(["h", "time"])
+
+        assert arrays["h"].shape == (1, 2)
+        assert arrays.case(IDs.CASE_ID_PRIMARY, "time").tolist() == [0.0, 1.0]
@@ -394,49 +394,67 @@ def get_test_workspace_definition(name=None):
     }
 
 
+def create_service_mock():
+    """Returns a mocked service without any of the optional client features."""
+    service = MagicMock()
+    service.polling = None
+    service.workspace_events = None
+    service.journal = None
+    service.experiment.trajectory_cache = None
+    return service
+
+
 def create_workspace_entity(workspace_id, definition=None, service=None):
-    service = service or MagicMock()
+    service = service or create_service_mock()
     if definition:
         service.workspace_get.return_value = {
             "definition": definition,
             "id": workspace_id,
         }
-    return Workspace(workspace_id, service or MagicMock())
+    return Workspace(workspace_id, service or create_service_mock())
 
 
 def create_published_workspace_entity(id, name, definition=None, service=None):
     definition = definition or get_test_published_workspace_definition(name)
     definition = PublishedWorkspaceDefinition.from_dict(definition)
-    return PublishedWorkspace(id, definition, service or MagicMock())
+    return PublishedWorkspace(id, definition, service or create_service_mock())
 
 
 def create_model_entity(class_name, workspace_id, project_id, service=None):
-    return Model(class_name, workspace_id, project_id, service or MagicMock())
+    return Model(class_name, workspace_id, project_id, service or create_service_mock())
 
 
 def create_model_exe_entity(
     workspace_id, fmu_id, service=None, info=None, modifiers=None
 ):
     return ModelExecutable(
-        workspace_id, fmu_id, service or MagicMock(), info, modifiers
+        workspace_id, fmu_id, service or create_service_mock(), info, modifiers
     )
 
 
 def create_experiment_entity(workspace_id, exp_id, service=None, info=None):
-    return Experiment(workspace_id, exp_id, service or MagicMock(), info)
+    return Experiment(workspace_id, exp_id, service or create_service_mock(), info)
 
 
 def create_experiment_reference(workspace_id, exp_id, service=None, info=None):
-    return ExperimentReference(workspace_id, exp_id, service or MagicMock(), info)
+    return ExperimentReference(
+        workspace_id, exp_id, service or create_service_mock(), info
+    )
 
 
 def create_case_reference(workspace_id, case_id, exp_id, service=None, info=None):
-    return CaseReference(case_id, workspace_id, exp_id, service or MagicMock(), info)
+    return CaseReference(
+        case_id, workspace_id, exp_id, service or create_service_mock(), info
+    )
 
 
 def create_case_entity(case_id, workspace_id, exp_id, service=None, info=None):
     return Case(
-        case_id, workspace_id, exp_id, service or MagicMock(), info or MagicMock()
+        case_id,
+        workspace_id,
+        exp_id,
+        service or create_service_mock(),
+        info or MagicMock(),
     )
 
 
@@ -445,20 +463,23 @@ def create_custom_artifact_uri_entity(case_id, exp_id, artifact_id):
 
 
 def create_external_result_entity(result_id, service=None):
-    return ExternalResult(result_id, service or MagicMock())
+    return ExternalResult(result_id, service or create_service_mock())
 
 
 def create_custom_function_entity(
     workspace_id, name, parameter_data=None, service=None
 ):
     return CustomFunction(
-        workspace_id, name, parameter_data or [], service or MagicMock()
+        workspace_id, name, parameter_data or [], service or create_service_mock()
     )
 
 
 def create_experiment_operation(workspace_id, exp_id, service=None):
     return ExperimentOperation[Experiment](
-        workspace_id, exp_id, service or MagicMock(), Experiment.from_operation
+        workspace_id,
+        exp_id,
+        service or create_service_mock(),
+        Experiment.from_operation,
     )
 
 
@@ -468,7 +489,7 @@ def create_cached_model_exe_operation(
     return CachedModelExecutableOperation[ModelExecutable](
         workspace_id,
         fmu_id,
-        service or MagicMock(),
+        service or create_service_mock(),
         ModelExecutable.from_operation,
         info=info,
         modifiers=modifiers,
@@ -477,14 +498,17 @@ def create_cached_model_exe_operation(
 
 def create_model_exe_operation(workspace_id, fmu_id, service=None):
     return ModelExecutableOperation[ModelExecutable](
-        workspace_id, fmu_id, service or MagicMock(), ModelExecutable.from_operation
+        workspace_id,
+        fmu_id,
+        service or create_service_mock(),
+        ModelExecutable.from_operation,
     )
 
 
 def create_workspace_conversion_operation(ws_conversion_id, service=None):
     return WorkspaceConversionOperation[Workspace](
         f"api/workspace-conversions/{ws_conversion_id}",
-        service or MagicMock(),
+        service or create_service_mock(),
         Workspace.from_conversion_operation,
     )
 
@@ -1,8 +1,18 @@
+from unittest.mock import call
+
 import pytest
 
 from modelon.impact.client import exceptions
 from modelon.impact.client.operations.base import Status
-from tests.impact.client.helpers import IDs, create_experiment_entity
+from modelon.impact.client.operations.polling import PollingStrategy
+from modelon.impact.client.sal import deadline
+from modelon.impact.client.sal.exceptions import DeadlineExceededError
+from tests.impact.client.helpers import (
+    IDs,
+    create_experiment_entity,
+    create_experiment_operation,
+    create_service_mock,
+)
 
 
 class TestExperimentOperation:
@@ -46,3 +56,79 @@ class TestExperimentOperation:
         assert exp.id == IDs.EXPERIMENT_ID_PRIMARY
         assert exp.status == Status.CANCELLED
         pytest.raises(exceptions.OperationTimeOutError, exp.wait, 1e-10, Status.DONE)
+
+    def test_progress(self):
+        service = create_service_mock()
+        service.experiment.execute_status.side_effect = [
+            _execution_status("pending", 0, 3),
+            _execution_status("running", 0, 3),
+            _execution_status("running", 0, 3),
+            _execution_status("running", 2, 3),
+            _execution_status("done", 3, 3),
+        ]
+        exp = create_experiment_operation(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        progresses = list(exp.progress(polling=PollingStrategy.fixed(0)))
+
+        assert [(p.status, p.finished, p.not_finished) for p in progresses] == [
+            (Status.PENDING, 0, 3),
+            (Status.RUNNING, 0, 3),
+            (Status.RUNNING, 2, 1),
+            (Status.DONE, 3, 0),
+        ]
+        assert progresses[0].eta is None
+        assert progresses[-1].eta == 0.0
+        assert progresses[-1].fraction == 1.0
+        # No other requests than the execution status
+        assert service.experiment.execute_status.call_count == 5
+        assert (
+            service.method_calls
+            == [
+                call.experiment.execute_status(
+                    IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY
+                )
+            ]
+            * 5
+        )
+
+    def test_progress_timeout(self):
+        service = create_service_mock()
+        service.experiment.execute_status.return_value = _execution_status(
+            "running", 0, 3
+        )
+        exp = create_experiment_operation(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        progress = exp.progress(timeout=1e-10, polling=PollingStrategy.fixed(0))
+
+        assert next(progress).status == Status.RUNNING
+        pytest.raises(exceptions.OperationTimeOutError, next, progress)
+
+    def test_wait_status_request_bounded_by_timeout(self):
+        remaining = []
+
+        def stuck(workspace_id, experiment_id):
+            remaining.append(deadline.remaining())
+            raise DeadlineExceededError("The deadline for the request has passed")
+
+        service = create_service_mock()
+        service.experiment.execute_status.side_effect = stuck
+        exp = create_experiment_operation(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        with pytest.raises(exceptions.OperationTimeOutError):
+            exp.wait(timeout=30, polling=PollingStrategy.fixed(0))
+        assert 0 < remaining[0] <= 30
+
+
+def _execution_status(status, finished, total):
+    return {
+        "finished_executions": finished,
+        "total_executions": total,
+        "status": status,
+        "progresses": [],
+    }
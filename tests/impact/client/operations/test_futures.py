@@ -0,0 +1,142 @@
+import concurrent.futures
+import threading
+
+import pytest
+
+from modelon.impact.client import to_future
+from modelon.impact.client.operations.futures import OperationPoller
+from modelon.impact.client.operations.polling import PollingStrategy
+from modelon.impact.client.sal.exceptions import CommunicationError
+from tests.impact.client.helpers import (
+    IDs,
+    create_cached_model_exe_operation,
+    create_experiment_entity,
+    create_experiment_operation,
+    create_service_mock,
+)
+
+FAST = PollingStrategy.fixed(0.01)
+
+
+def _executions(*experiment_ids):
+    return {
+        "data": {
+            "items": [
+                {
+                    "status": "running",
+                    "workspace": {"id": IDs.WORKSPACE_ID_PRIMARY},
+                    "kind": "EXPERIMENT",
+                    "experiment": {"id": exp_id},
+                }
+                for exp_id in experiment_ids
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def service():
+    service = create_service_mock()
+    service.get_executions.return_value = _executions()
+    service.experiment.execute_status.return_value = {"status": "done"}
+    return service
+
+
+@pytest.fixture
+def poller():
+    return OperationPoller(polling=FAST)
+
+
+def _operation(service, exp_id=IDs.EXPERIMENT_ID_PRIMARY):
+    return create_experiment_operation(IDs.WORKSPACE_ID_PRIMARY, exp_id, service)
+
+
+def test_future_result_is_entity(service, poller):
+    future = to_future(_operation(service), poller=poller)
+
+    assert future.result(timeout=5) == create_experiment_entity(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY
+    )
+
+
+def test_futures_wait_and_as_completed(service, poller):
+    service.get_executions.side_effect = [
+        _executions("exp_1", "exp_2"),
+        _executions("exp_1"),
+    ] + [_executions()] * 100
+    futures = [
+        to_future(_operation(service, exp_id), poller) for exp_id in ("exp_1", "exp_2")
+    ]
+
+    completed = [
+        future.result().id
+        for future in concurrent.futures.as_completed(futures, timeout=5)
+    ]
+    done, not_done = concurrent.futures.wait(futures, timeout=5)
+
+    assert completed == ["exp_2", "exp_1"]
+    assert len(done) == 2 and not not_done
+
+
+def test_done_callback(service, poller):
+    called = threading.Event()
+    future = to_future(_operation(service), poller)
+    future.add_done_callback(lambda f: called.set())
+
+    assert called.wait(5)
+
+
+def test_single_poller_thread(service, poller):
+    service.get_executions.return_value = _executions(*[f"exp_{i}" for i in range(20)])
+    futures = [to_future(_operation(service, f"exp_{i}"), poller) for i in range(20)]
+
+    pollers = [t for t in threading.enumerate() if t.name == "impact-operation-poller"]
+    assert len(pollers) == 1
+
+    service.get_executions.return_value = _executions()
+    done, not_done = concurrent.futures.wait(futures, timeout=5)
+    assert not not_done
+    # Operations listed as active don't have their status requested
+    assert service.experiment.execute_status.call_count == 20
+
+
+def test_cancel_cancels_operation(service, poller):
+    service.get_executions.return_value = _executions(IDs.EXPERIMENT_ID_PRIMARY)
+    future = to_future(_operation(service), poller)
+
+    assert future.cancel()
+    done, _ = concurrent.futures.wait([future], timeout=5)
+
+    assert future in done
+    assert future.cancelled()
+    service.experiment.execute_cancel.assert_called_once_with(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY
+    )
+
+
+def test_cancel_done_future(service, poller):
+    future = to_future(_operation(service), poller)
+    future.result(timeout=5)
+
+    assert not future.cancel()
+    service.experiment.execute_cancel.assert_not_called()
+
+
+def test_cancel_not_supported(poller):
+    service = create_service_mock()
+    service.model_executable.compile_status.return_value = {"status": "running"}
+    operation = create_cached_model_exe_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.FMU_ID_PRIMARY, service
+    )
+    future = to_future(operation, poller)
+
+    assert not future.cancel()
+    assert future.result(timeout=5) is not None
+
+
+def test_status_error_sets_exception(service, poller):
+    service.experiment.execute_status.side_effect = CommunicationError("Failed")
+    future = to_future(_operation(service), poller)
+
+    with pytest.raises(CommunicationError):
+        future.result(timeout=5)
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+
+from modelon.impact.client import wait_all
+from modelon.impact.client.operations.base import Status
+from modelon.impact.client.operations.journal import (
+    JournalEntry,
+    OperationJournal,
+    OperationKind,
+)
+from modelon.impact.client.operations.polling import PollingStrategy
+from tests.impact.client.helpers import (
+    IDs,
+    create_experiment_entity,
+    create_experiment_operation,
+    create_model_exe_operation,
+    create_service_mock,
+)
+
+NO_SLEEP = PollingStrategy.fixed(0)
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "operations.jsonl")
+
+
+@pytest.fixture
+def service(journal_path):
+    service = create_service_mock()
+    service.journal = OperationJournal(journal_path)
+    service.get_executions.return_value = {"data": {"items": []}}
+    service.experiment.execute_status.return_value = {"status": "done"}
+    service.model_executable.compile_status.return_value = {"status": "done"}
+    return service
+
+
+def _entry(id):
+    return JournalEntry(OperationKind.EXPERIMENT, IDs.WORKSPACE_ID_PRIMARY, id)
+
+
+def test_entries_survive_reopening(journal_path):
+    journal = OperationJournal(journal_path)
+    journal.record(_entry("exp_1"))
+    journal.record(_entry("exp_2"))
+    journal.discard(OperationKind.EXPERIMENT, "exp_1")
+
+    entries = OperationJournal(journal_path).entries()
+
+    assert [entry.id for entry in entries] == ["exp_2"]
+    assert entries[0].kind == OperationKind.EXPERIMENT
+    assert entries[0].workspace_id == IDs.WORKSPACE_ID_PRIMARY
+    assert entries[0].recorded > 0
+
+
+def test_record_twice_is_noop(journal_path):
+    journal = OperationJournal(journal_path)
+    journal.record(_entry("exp_1"))
+    journal.record(_entry("exp_1"))
+
+    with open(journal_path) as journal_file:
+        assert len(journal_file.readlines()) == 1
+
+
+def test_reopening_compacts_file(journal_path):
+    journal = OperationJournal(journal_path)
+    for i in range(5):
+        journal.record(_entry(f"exp_{i}"))
+        journal.discard(OperationKind.EXPERIMENT, f"exp_{i}")
+    journal.record(_entry("exp_pending"))
+
+    OperationJournal(journal_path)
+
+    with open(journal_path) as journal_file:
+        lines = [json.loads(line) for line in journal_file]
+    assert [line["entry"]["id"] for line in lines] == ["exp_pending"]
+
+
+def test_truncated_line_skipped(journal_path):
+    journal = OperationJournal(journal_path)
+    journal.record(_entry("exp_1"))
+    with open(journal_path, "a") as journal_file:
+        journal_file.write('{"action": "add", "entry": {"ki')
+
+    assert [entry.id for entry in OperationJournal(journal_path).entries()] == ["exp_1"]
+
+
+def test_operations_recorded_when_submitted(service):
+    service.experiment.experiment_execute.return_value = IDs.EXPERIMENT_ID_PRIMARY
+    create_experiment_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_SECONDARY, service
+    )
+    assert service.journal.entries() == []
+
+    create_experiment_entity(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+    ).execute()
+
+    assert [entry.key for entry in service.journal.entries()] == [
+        (OperationKind.EXPERIMENT, IDs.EXPERIMENT_ID_PRIMARY)
+    ]
+
+
+def test_operations_recorded_until_waited_for(service):
+    experiment = create_experiment_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+    )
+    compilation = create_model_exe_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.FMU_ID_PRIMARY, service
+    )
+    experiment._record_in_journal()
+    compilation._record_in_journal()
+    assert [entry.key for entry in service.journal.entries()] == [
+        (OperationKind.EXPERIMENT, IDs.EXPERIMENT_ID_PRIMARY),
+        (OperationKind.COMPILATION, IDs.FMU_ID_PRIMARY),
+    ]
+
+    experiment.wait(polling=NO_SLEEP)
+    assert [entry.id for entry in service.journal.entries()] == [IDs.FMU_ID_PRIMARY]
+
+    wait_all([compilation], polling=NO_SLEEP)
+    assert service.journal.entries() == []
+
+
+def test_operation_kept_when_waiting_for_other_status(service):
+    service.experiment.execute_status.return_value = {"status": "running"}
+    operation = create_experiment_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+    )
+    operation._record_in_journal()
+
+    operation.wait(status=Status.RUNNING, polling=NO_SLEEP)
+
+    assert len(service.journal.entries()) == 1
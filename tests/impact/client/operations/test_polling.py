@@ -0,0 +1,128 @@
+import pytest
+
+from modelon.impact.client import exceptions
+from modelon.impact.client.operations.base import Status
+from modelon.impact.client.operations.polling import (
+    DEFAULT_POLLING,
+    PollingStrategy,
+    resolve_polling_strategy,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(
+        "modelon.impact.client.operations.base.time.sleep", recorded.append
+    )
+    return recorded
+
+
+class TestPollingStrategy:
+    def test_exponential_backoff_up_to_max_interval(self):
+        strategy = PollingStrategy(
+            initial_interval=1.0, max_interval=5.0, multiplier=2.0, jitter=0.0
+        )
+        schedule = strategy.schedule()
+        assert [schedule.next_interval() for _ in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_fixed(self):
+        schedule = PollingStrategy.fixed(0.5).schedule()
+        assert [schedule.next_interval() for _ in range(3)] == [0.5, 0.5, 0.5]
+
+    def test_jitter(self):
+        strategy = PollingStrategy(initial_interval=1.0, multiplier=1.0, jitter=0.2)
+        intervals = [strategy.schedule().next_interval() for _ in range(50)]
+        assert all(0.8 <= interval <= 1.2 for interval in intervals)
+        assert len(set(intervals)) > 1
+
+    def test_jitter_with_seed_is_reproducible(self):
+        strategy = PollingStrategy(jitter=0.5, seed=1)
+        first, second = strategy.schedule(), strategy.schedule()
+        assert [first.next_interval() for _ in range(5)] == [
+            second.next_interval() for _ in range(5)
+        ]
+
+    def test_server_hint(self):
+        schedule = PollingStrategy.fixed(0.5).schedule()
+        assert schedule.next_interval(server_hint=3.0) == 3.0
+        assert schedule.next_interval(server_hint=0.1) == 0.5
+
+    def test_server_hint_ignored(self):
+        strategy = PollingStrategy(multiplier=1.0, jitter=0.0, use_server_hints=False)
+        assert strategy.schedule().next_interval(server_hint=3.0) == 0.5
+
+    def test_interval_limited_by_remaining_time(self):
+        schedule = PollingStrategy.fixed(2.0).schedule()
+        assert schedule.next_interval(server_hint=5.0, remaining=0.25) == 0.25
+        assert schedule.next_interval(remaining=-1.0) == 0.0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"initial_interval": -1.0},
+            {"initial_interval": 2.0, "max_interval": 1.0},
+            {"multiplier": 0.5},
+            {"jitter": 1.0},
+        ],
+    )
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            PollingStrategy(**kwargs)
+
+    def test_resolve(self, workspace):
+        strategy = PollingStrategy.fixed(1.0)
+        assert resolve_polling_strategy(strategy, None) is strategy
+        assert resolve_polling_strategy(None, workspace.service) is DEFAULT_POLLING
+        workspace.service.polling = strategy
+        assert resolve_polling_strategy(None, workspace.service) is strategy
+
+
+class TestWaitPolling:
+    def test_single_status_request_per_poll(self, workspace_execute_running, sleeps):
+        operation = workspace_execute_running.execute({})
+        exp_service = workspace_execute_running._sal.experiment
+        exp_service.execute_status.reset_mock()
+        with pytest.raises(exceptions.OperationTimeOutError):
+            operation.wait(timeout=1.0, polling=PollingStrategy.fixed(0.25))
+        assert exp_service.execute_status.call_count == len(sleeps) + 1
+
+    def test_done_after_single_status_request(self, workspace, sleeps):
+        operation = workspace.entity.execute({})
+        workspace.service.experiment.execute_status.reset_mock()
+        operation.wait()
+        assert workspace.service.experiment.execute_status.call_count == 1
+        assert sleeps == []
+
+    def test_backoff_between_polls(self, workspace_execute_running, sleeps):
+        experiment_service = workspace_execute_running._sal.experiment
+        experiment_service.execute_status.side_effect = [{"status": "running"}] * 3 + [
+            {"status": "done"}
+        ]
+        polling = PollingStrategy(initial_interval=0.1, multiplier=2.0, jitter=0.0)
+        workspace_execute_running.execute({}).wait(polling=polling)
+        assert sleeps == [0.1, 0.2, 0.4]
+
+    def test_client_polling_strategy_used(self, workspace_execute_running, sleeps):
+        workspace_execute_running._sal.polling = PollingStrategy.fixed(0.125)
+        experiment_service = workspace_execute_running._sal.experiment
+        experiment_service.execute_status.side_effect = [
+            {"status": "running"},
+            {"status": "done"},
+        ]
+        workspace_execute_running.execute({}).wait(status=Status.DONE)
+        assert sleeps == [0.125]
+
+    def test_server_retry_after_hint(
+        self, workspace_execute_running, sleeps, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "modelon.impact.client.operations.base.retry_after.pop_hint", lambda: 4.0
+        )
+        experiment_service = workspace_execute_running._sal.experiment
+        experiment_service.execute_status.side_effect = [
+            {"status": "running"},
+            {"status": "done"},
+        ]
+        workspace_execute_running.execute({}).wait(polling=PollingStrategy.fixed(0.5))
+        assert sleeps == [4.0]
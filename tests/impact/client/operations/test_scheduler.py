@@ -0,0 +1,179 @@
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+
+from modelon.impact.client import SubmissionScheduler, exceptions
+from modelon.impact.client.operations.polling import PollingStrategy
+from tests.impact.client.helpers import (
+    create_experiment_entity,
+    create_experiment_operation,
+    create_service_mock,
+)
+
+NO_SLEEP = PollingStrategy.fixed(0)
+
+
+class FakeServer:
+    """Lists each executed experiment as pending, then running, then done."""
+
+    def __init__(self, queued_elsewhere=0):
+        self.queued_elsewhere = queued_elsewhere
+        self.executions = {}
+        self.submitted = []
+        self.max_active = 0
+        self.max_active_per_workspace = Counter()
+        self.service = create_service_mock()
+        self.service.get_executions.side_effect = self._get_executions
+        self.service.experiment.execute_status.return_value = {"status": "done"}
+
+    def workspace(self, workspace_id):
+        workspace = MagicMock()
+        workspace.id = workspace_id
+        workspace._sal = self.service
+        workspace.execute.side_effect = lambda definition, user_data: self._execute(
+            workspace_id, definition
+        )
+        return workspace
+
+    def _execute(self, workspace_id, exp_id):
+        self.submitted.append(exp_id)
+        self.executions[exp_id] = (workspace_id, ["pending", "running"])
+        self.max_active = max(self.max_active, len(self.executions))
+        per_workspace = Counter(ws_id for ws_id, _ in self.executions.values())
+        self.max_active_per_workspace[workspace_id] = max(
+            self.max_active_per_workspace[workspace_id], per_workspace[workspace_id]
+        )
+        return create_experiment_operation(workspace_id, exp_id, self.service)
+
+    def _get_executions(self):
+        items = []
+        for exp_id, (workspace_id, statuses) in list(self.executions.items()):
+            if not statuses:
+                del self.executions[exp_id]
+                continue
+            items.append(
+                {
+                    "status": statuses.pop(0),
+                    "workspace": {"id": workspace_id},
+                    "kind": "EXPERIMENT",
+                    "experiment": {"id": exp_id},
+                }
+            )
+        for i in range(self.queued_elsewhere):
+            items.append(
+                {
+                    "status": "pending",
+                    "workspace": {"id": "other"},
+                    "kind": "EXPERIMENT",
+                    "experiment": {"id": f"other_{i}"},
+                }
+            )
+        return {"data": {"items": items}}
+
+
+def test_max_in_flight():
+    server = FakeServer()
+    workspace = server.workspace("ws")
+    scheduler = SubmissionScheduler(max_in_flight=2, polling=NO_SLEEP)
+    jobs = [scheduler.execute(workspace, f"exp_{i}") for i in range(5)]
+
+    completed = scheduler.run()
+
+    assert sorted(completed, key=jobs.index) == jobs
+    assert server.max_active == 2
+    assert [job.result() for job in jobs] == [
+        create_experiment_entity("ws", f"exp_{i}") for i in range(5)
+    ]
+    for job in jobs:
+        assert job.scheduled_at <= job.submitted_at <= job.started_at
+        assert job.started_at <= job.finished_at
+        assert job.queue_time >= 0 and job.run_time >= 0
+
+
+def test_max_in_flight_per_workspace():
+    server = FakeServer()
+    workspaces = [server.workspace("ws_1"), server.workspace("ws_2")]
+    scheduler = SubmissionScheduler(
+        max_in_flight=10, max_in_flight_per_workspace=1, polling=NO_SLEEP
+    )
+    for i in range(6):
+        scheduler.execute(workspaces[i % 2], f"exp_{i}")
+
+    assert len(scheduler.run()) == 6
+    assert server.max_active == 2
+    assert server.max_active_per_workspace == {"ws_1": 1, "ws_2": 1}
+
+
+def test_priorities():
+    server = FakeServer()
+    workspace = server.workspace("ws")
+    scheduler = SubmissionScheduler(max_in_flight=1, polling=NO_SLEEP)
+    scheduler.execute(workspace, "low", priority=-1)
+    scheduler.execute(workspace, "normal_1")
+    scheduler.execute(workspace, "high", priority=5)
+    scheduler.execute(workspace, "normal_2")
+
+    scheduler.run()
+
+    assert server.submitted == ["high", "normal_1", "normal_2", "low"]
+
+
+def test_max_queued_holds_back_submissions():
+    server = FakeServer(queued_elsewhere=3)
+    workspace = server.workspace("ws")
+    listings = []
+
+    def execute(definition, user_data):
+        listings.append(server.service.get_executions.call_count)
+        return server._execute("ws", definition)
+
+    workspace.execute.side_effect = execute
+    scheduler = SubmissionScheduler(max_queued=2, polling=NO_SLEEP)
+    scheduler.execute(workspace, "exp_1")
+    get_executions = server._get_executions
+
+    def draining_get_executions():
+        executions = get_executions()
+        server.queued_elsewhere -= 1
+        return executions
+
+    server.service.get_executions.side_effect = draining_get_executions
+
+    assert len(scheduler.run()) == 1
+    # Submitted once the queue listed 3, then 2, then 1 other execution
+    assert listings == [3]
+
+
+def test_submission_error_yields_job():
+    workspace = MagicMock()
+    workspace.id = "ws"
+    workspace.execute.side_effect = exceptions.Error("Invalid definition")
+    scheduler = SubmissionScheduler(polling=NO_SLEEP)
+    job = scheduler.execute(workspace, {})
+
+    assert scheduler.run() == [job]
+    assert job.done()
+    with pytest.raises(exceptions.Error):
+        job.result()
+
+
+def test_timeout():
+    server = FakeServer()
+    server.service.experiment.execute_status.return_value = {"status": "running"}
+    workspace = server.workspace("ws")
+    scheduler = SubmissionScheduler(polling=PollingStrategy.fixed(0.01))
+    job = scheduler.execute(workspace, "exp_1")
+
+    with pytest.raises(exceptions.OperationTimeOutError):
+        scheduler.run(timeout=0.05)
+    assert not job.done()
+    with pytest.raises(exceptions.OperationNotCompleteError):
+        job.result()
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        SubmissionScheduler(max_in_flight=0)
+    with pytest.raises(ValueError):
+        SubmissionScheduler(max_in_flight_per_workspace=0)
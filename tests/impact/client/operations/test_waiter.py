@@ -0,0 +1,139 @@
+import pytest
+
+from modelon.impact.client import as_completed, exceptions, wait_all
+from modelon.impact.client.operations.polling import PollingStrategy
+from tests.impact.client.helpers import (
+    IDs,
+    create_cached_model_exe_operation,
+    create_experiment_entity,
+    create_experiment_operation,
+    create_model_exe_operation,
+    create_service_mock,
+)
+
+NO_SLEEP = PollingStrategy.fixed(0)
+
+
+def _execution(kind, entity_id):
+    entity = {"id": entity_id}
+    return {
+        "status": "running",
+        "workspace": {"id": IDs.WORKSPACE_ID_PRIMARY},
+        "kind": kind,
+        "fmu" if kind == "COMPILATION" else "experiment": entity,
+    }
+
+
+def _executions(*executions):
+    return {"data": {"items": list(executions)}}
+
+
+@pytest.fixture
+def service():
+    service = create_service_mock()
+    service.experiment.execute_status.return_value = {"status": "done"}
+    service.model_executable.compile_status.return_value = {"status": "done"}
+    return service
+
+
+def test_as_completed_in_completion_order(service):
+    service.get_executions.side_effect = [
+        _executions(
+            _execution("EXPERIMENT", "exp_1"),
+            _execution("EXPERIMENT", "exp_2"),
+            _execution("COMPILATION", "fmu_1"),
+        ),
+        _executions(_execution("EXPERIMENT", "exp_1")),
+        _executions(),
+    ]
+    operations = [
+        create_experiment_operation(IDs.WORKSPACE_ID_PRIMARY, "exp_1", service),
+        create_experiment_operation(IDs.WORKSPACE_ID_PRIMARY, "exp_2", service),
+        create_model_exe_operation(IDs.WORKSPACE_ID_PRIMARY, "fmu_1", service),
+    ]
+
+    completed = list(as_completed(operations, polling=NO_SLEEP))
+
+    assert [operation.id for operation in completed] == ["exp_2", "fmu_1", "exp_1"]
+    assert service.get_executions.call_count == 3
+    # Each operation status is only requested once, when no longer active
+    assert service.experiment.execute_status.call_count == 2
+    assert service.model_executable.compile_status.call_count == 1
+
+
+def test_status_confirmed_for_unlisted_operation(service):
+    service.get_executions.return_value = _executions()
+    service.experiment.execute_status.side_effect = [
+        {"status": "pending"},
+        {"status": "done"},
+    ]
+    operation = create_experiment_operation(IDs.WORKSPACE_ID_PRIMARY, "exp_1", service)
+
+    assert list(as_completed([operation], polling=NO_SLEEP)) == [operation]
+    assert service.experiment.execute_status.call_count == 2
+
+
+def test_operations_of_other_kinds_polled_individually(service):
+    operation = create_cached_model_exe_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.FMU_ID_PRIMARY, service
+    )
+    assert list(as_completed([operation], polling=NO_SLEEP)) == [operation]
+    service.get_executions.assert_not_called()
+
+
+def test_executions_requested_once_per_service():
+    services = [create_service_mock(), create_service_mock()]
+    operations = []
+    for i, service in enumerate(services):
+        service.get_executions.return_value = _executions()
+        service.experiment.execute_status.return_value = {"status": "cancelled"}
+        operations += [
+            create_experiment_operation(
+                IDs.WORKSPACE_ID_PRIMARY, f"exp_{i}_{j}", service
+            )
+            for j in range(5)
+        ]
+
+    assert len(list(as_completed(operations, polling=NO_SLEEP))) == 10
+    for service in services:
+        service.get_executions.assert_called_once()
+
+
+def test_timeout(service):
+    service.get_executions.return_value = _executions(_execution("EXPERIMENT", "exp_1"))
+    operations = [
+        create_experiment_operation(IDs.WORKSPACE_ID_PRIMARY, "exp_1", service),
+        create_experiment_operation(IDs.WORKSPACE_ID_PRIMARY, "exp_2", service),
+    ]
+
+    completed = []
+    with pytest.raises(exceptions.OperationTimeOutError):
+        for operation in as_completed(
+            operations, timeout=0.05, polling=PollingStrategy.fixed(0.01)
+        ):
+            completed.append(operation.id)
+    assert completed == ["exp_2"]
+
+
+def test_wait_all_returns_entities_in_order(service):
+    service.get_executions.side_effect = [
+        _executions(_execution("EXPERIMENT", IDs.EXPERIMENT_ID_PRIMARY)),
+        _executions(),
+    ]
+    operations = [
+        create_experiment_operation(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        ),
+        create_experiment_operation(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_SECONDARY, service
+        ),
+    ]
+
+    assert wait_all(operations, polling=NO_SLEEP) == [
+        create_experiment_entity(IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY),
+        create_experiment_entity(IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_SECONDARY),
+    ]
+
+
+def test_wait_all_no_operations():
+    assert wait_all([]) == []
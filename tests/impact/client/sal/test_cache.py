@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from modelon.impact.client.sal.cache import ResponseCache
+from modelon.impact.client.sal.http import HTTPClient
+
+WORKSPACE = {"id": "AwesomeWorkspace", "definition": {"name": "AwesomeWorkspace"}}
+
+
+def _etag_route(server, url, body, etag='"v1"'):
+    def callback(request, context):
+        context.headers["ETag"] = etag
+        context.headers["content-type"] = "application/json"
+        if request.headers.get("If-None-Match") == etag:
+            context.status_code = 304
+            return ""
+        context.status_code = 200
+        return json.dumps(body)
+
+    server.adapter.register_uri("GET", f"{server.url}/{url}", text=callback)
+    return server
+
+
+@pytest.fixture
+def cached_client(mock_server_base):
+    cache = ResponseCache(max_entries=2)
+    mock_server_base.context.response_cache = cache
+    return HTTPClient(context=mock_server_base.context), cache
+
+
+class TestResponseCache:
+    def test_revalidated_response_served_from_cache(
+        self, mock_server_base, cached_client
+    ):
+        client, cache = cached_client
+        server = _etag_route(mock_server_base, "api/workspaces/ws", WORKSPACE)
+        url = f"{server.url}/api/workspaces/ws"
+
+        assert client.get_json(url) == WORKSPACE
+        assert client.get_json(url) == WORKSPACE
+        assert client.get_json(url) == WORKSPACE
+
+        assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
+        assert server.adapter.last_request.headers["If-None-Match"] == '"v1"'
+
+    def test_changed_resource_is_downloaded(self, mock_server_base, cached_client):
+        client, cache = cached_client
+        server = _etag_route(mock_server_base, "api/workspaces/ws", WORKSPACE)
+        url = f"{server.url}/api/workspaces/ws"
+        client.get_json(url)
+
+        changed = {**WORKSPACE, "definition": {"name": "Renamed"}}
+        _etag_route(server, "api/workspaces/ws", changed, etag='"v2"')
+        assert client.get_json(url) == changed
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_accept_header_and_params_are_part_of_key(
+        self, mock_server_base, cached_client
+    ):
+        client, cache = cached_client
+        server = _etag_route(mock_server_base, "api/workspaces/ws", WORKSPACE)
+        url = f"{server.url}/api/workspaces/ws"
+        client.get_json(url)
+        client.get_json(url, headers={"Accept": "application/vnd.impact+json"})
+        client.get_json(url, params={"sizeInfo": True})
+        assert cache.hits == 0
+        assert "If-None-Match" not in server.adapter.last_request.headers
+
+    def test_least_recently_used_evicted(self, mock_server_base, cached_client):
+        client, cache = cached_client
+        for name in ["a", "b", "c"]:
+            _etag_route(mock_server_base, f"api/{name}", {"name": name})
+            client.get_json(f"{mock_server_base.url}/api/{name}")
+        assert len(cache) == 2
+        client.get_json(f"{mock_server_base.url}/api/a")
+        assert cache.hits == 0
+
+    def test_responses_without_validator_not_cached(
+        self, mock_server_base, cached_client
+    ):
+        client, cache = cached_client
+        mock_server_base.adapter.register_uri(
+            "GET",
+            f"{mock_server_base.url}/api/plain",
+            json={"a": 1},
+            headers={"content-type": "application/json"},
+        )
+        client.get_json(f"{mock_server_base.url}/api/plain")
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+    def test_persisted_to_directory(self, mock_server_base, tmp_path):
+        server = _etag_route(mock_server_base, "api/workspaces/ws", WORKSPACE)
+        url = f"{server.url}/api/workspaces/ws"
+        server.context.response_cache = ResponseCache(directory=str(tmp_path))
+        HTTPClient(context=server.context).get_json(url)
+
+        cache = ResponseCache(directory=str(tmp_path))
+        server.context.response_cache = cache
+        assert HTTPClient(context=server.context).get_json(url) == WORKSPACE
+        assert cache.hits == 1
+
+    def test_clear(self, mock_server_base, tmp_path):
+        server = _etag_route(mock_server_base, "api/workspaces/ws", WORKSPACE)
+        cache = ResponseCache(directory=str(tmp_path))
+        server.context.response_cache = cache
+        HTTPClient(context=server.context).get_json(f"{server.url}/api/workspaces/ws")
+        cache.clear()
+        assert cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,126 @@
+import glob
+import json
+import os
+import time
+
+import pytest
+import yaml
+
+from modelon.impact.client.sal.codec import (
+    JSONCodec,
+    OrjsonCodec,
+    fastest_available_codec,
+)
+from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.http import HTTPClient
+from tests.impact.client.helpers import with_json_route
+
+CASSETTE_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, os.pardir, "fixtures"
+)
+CODECS = [JSONCodec]
+try:
+    import orjson  # noqa: F401
+
+    CODECS.append(OrjsonCodec)
+except ImportError:
+    pass
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def encode(self, obj):
+        self.encoded += 1
+        return super().encode(obj)
+
+    def decode(self, data):
+        self.decoded += 1
+        return super().decode(data)
+
+
+def _recorded_trajectories():
+    pattern = os.path.join(CASSETTE_DIR, "vcr_cassettes", "*", "*.yaml")
+    payloads = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            cassette = yaml.safe_load(f)
+        for interaction in cassette["interactions"]:
+            if interaction["request"]["uri"].endswith("/trajectories"):
+                payloads.append(interaction["response"]["body"]["string"])
+    return payloads
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("codec_cls", CODECS)
+    def test_round_trip(self, codec_cls):
+        codec = codec_cls()
+        obj = {"variable_names": ["inertia1.w"], "values": [[0.0, 1.5, -2e-10]]}
+        assert codec.decode(codec.encode(obj)) == obj
+
+    @pytest.mark.parametrize("codec_cls", CODECS)
+    @pytest.mark.parametrize(
+        "value", [float("nan"), float("inf"), -float("inf"), [1.0, float("nan")]]
+    )
+    def test_encode_non_finite_floats_raises(self, codec_cls, value):
+        with pytest.raises(ValueError):
+            codec_cls().encode({"parameters": {"inertia1.J": value}})
+
+    @pytest.mark.parametrize("codec_cls", CODECS)
+    def test_encode_same_as_json(self, codec_cls):
+        obj = {
+            "keys": {1: "int", 2.5: "float", False: "bool", None: "none"},
+            "values": [None, 1.0, "null"],
+        }
+        encoded = codec_cls().encode(obj)
+        assert json.loads(encoded) == json.loads(JSONCodec().encode(obj))
+
+    def test_encode_same_as_requests(self):
+        obj = {"filter": {"lastPointOnly": False}, "variable_names": ["a", "b"]}
+        assert JSONCodec().encode(obj) == json.dumps(obj).encode()
+
+    def test_fastest_available_codec(self):
+        assert type(fastest_available_codec()) is CODECS[-1]
+
+    def test_context_codec_used(self, mock_server_base):
+        codec = CountingCodec()
+        mock_server_base.context.json_codec = codec
+        server = with_json_route(mock_server_base, "POST", "api/trajectories", [[1.0]])
+        client = HTTPClient(context=server.context)
+        data = client.post_json(f"{server.url}/api/trajectories", body={"a": 1})
+        assert data == [[1.0]]
+        assert server.adapter.last_request.json() == {"a": 1}
+        assert server.adapter.last_request.headers["Content-Type"] == (
+            "application/json"
+        )
+        assert (codec.encoded, codec.decoded) == (1, 1)
+
+    def test_default_codec(self):
+        assert type(Context().json_codec) is JSONCodec
+
+
+@pytest.mark.benchmark
+class TestJSONCodecBenchmark:
+    def test_decode_recorded_trajectories(self, capsys):
+        payloads = _recorded_trajectories()
+        assert payloads
+        # Scale the recorded trajectories up to a payload of a large experiment
+        cases = [case for payload in payloads for case in json.loads(payload)]
+        large_payload = json.dumps(cases * max(1, 2000 // len(cases))).encode()
+
+        timings = {}
+        expected = json.loads(large_payload)
+        for codec_cls in CODECS:
+            codec = codec_cls()
+            start = time.perf_counter()
+            for _ in range(3):
+                decoded = codec.decode(large_payload)
+            timings[codec.name] = (time.perf_counter() - start) / 3
+            assert decoded == expected
+
+        with capsys.disabled():
+            size = len(large_payload) / 1024**2
+            for name, seconds in timings.items():
+                print(f"\n{name}: decoded {size:.1f} MB in {seconds * 1000:.1f} ms")
@@ -0,0 +1,97 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.http import HTTPClient
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_GET(self):
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        if self.headers.get("Connection", "").lower() == "close":
+            # Tell the client the connection is closed, so it is not pooled
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connection_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/api/"
+
+
+class TestContext:
+    def test_default_pool_settings(self):
+        context = Context()
+        adapter = context.session.get_adapter("https://impact.modelon.cloud")
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 10
+        assert adapter._pool_block is False
+        assert context.session.headers["Connection"] == "keep-alive"
+
+    def test_custom_pool_settings(self):
+        context = Context(pool_connections=2, pool_maxsize=32, pool_block=True)
+        for url in ["http://localhost", "https://impact.modelon.cloud"]:
+            adapter = context.session.get_adapter(url)
+            assert adapter._pool_connections == 2
+            assert adapter._pool_maxsize == 32
+            assert adapter._pool_block is True
+
+    def test_keep_alive_disabled(self):
+        context = Context(keep_alive=False)
+        assert context.session.headers["Connection"] == "close"
+
+    def test_connections_are_reused(self, local_server):
+        client = HTTPClient(context=Context())
+        for _ in range(20):
+            assert client.get_json(_url(local_server)) == {"ok": True}
+        assert local_server.connection_count == 1
+
+    def test_connections_not_reused_without_keep_alive(self, local_server):
+        client = HTTPClient(context=Context(keep_alive=False))
+        for _ in range(20):
+            assert client.get_json(_url(local_server)) == {"ok": True}
+        assert local_server.connection_count == 20
+
+    def test_pool_bounds_connections_for_concurrent_threads(self, local_server):
+        client = HTTPClient(context=Context(pool_maxsize=4, pool_block=True))
+
+        def fetch():
+            for _ in range(25):
+                client.get_json(_url(local_server))
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert local_server.connection_count <= 4
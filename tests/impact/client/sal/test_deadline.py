@@ -0,0 +1,143 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from modelon.impact.client.sal import deadline, exceptions
+from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.retry import RetryPolicy
+from tests.impact.client.helpers import (
+    json_request_list_item,
+    with_exception,
+    with_json_request_list_route,
+    with_json_route,
+)
+
+
+def _client(mock_server_base):
+    return HTTPClient(context=mock_server_base.context)
+
+
+class TestDeadline:
+    def test_no_deadline(self):
+        assert deadline.remaining() is None
+        assert deadline.limit(5.0) == 5.0
+        assert deadline.request_timeout(None, None) is None
+        deadline.check()
+
+    def test_remaining(self):
+        with deadline.deadline(60):
+            assert 59 < deadline.remaining() <= 60
+            assert deadline.limit(5.0) == 5.0
+            assert 59 < deadline.limit(None) <= 60
+            assert deadline.request_timeout(1.0, None)[0] == 1.0
+        assert deadline.remaining() is None
+
+    def test_nested_never_extends(self):
+        with deadline.deadline(10):
+            with deadline.deadline(60):
+                assert deadline.remaining() <= 10
+            with deadline.deadline(1):
+                assert deadline.remaining() <= 1
+            with deadline.deadline(None):
+                assert deadline.remaining() <= 10
+
+    def test_expired(self):
+        with deadline.deadline(0):
+            assert deadline.expired()
+            pytest.raises(exceptions.DeadlineExceededError, deadline.check)
+
+    def test_not_shared_with_other_threads(self):
+        remaining = []
+        with deadline.deadline(60):
+            thread = threading.Thread(
+                target=lambda: remaining.append(deadline.remaining())
+            )
+            thread.start()
+            thread.join()
+        assert remaining == [None]
+
+
+class TestRequestTimeouts:
+    def test_context_timeouts_used(self, mock_server_base):
+        mock_server_base.context.connect_timeout = 3.0
+        mock_server_base.context.read_timeout = 30.0
+        with_json_route(mock_server_base, "GET", "api/workspaces", {})
+
+        _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+
+        assert mock_server_base.adapter.last_request.timeout == (3.0, 30.0)
+
+    def test_default_timeouts(self):
+        context = Context()
+        assert context.connect_timeout == 10.0
+        assert context.read_timeout == 300.0
+
+    def test_timeouts_capped_by_deadline(self, mock_server_base):
+        mock_server_base.context.connect_timeout = 3.0
+        mock_server_base.context.read_timeout = None
+        with_json_route(mock_server_base, "POST", "api/workspaces", {})
+
+        with deadline.deadline(1.0):
+            _client(mock_server_base).post_json(
+                f"{mock_server_base.url}/api/workspaces", body={}
+            )
+
+        connect, read = mock_server_base.adapter.last_request.timeout
+        assert 0 < connect <= 1.0
+        assert 0 < read <= 1.0
+
+    def test_not_sent_after_deadline(self, mock_server_base):
+        with_json_route(mock_server_base, "GET", "api/workspaces", {})
+
+        with deadline.deadline(0):
+            with pytest.raises(exceptions.DeadlineExceededError):
+                _client(mock_server_base).get_json(
+                    f"{mock_server_base.url}/api/workspaces"
+                )
+        assert not mock_server_base.adapter.called
+
+    def test_timeout_raised(self, mock_server_base):
+        with_exception(
+            mock_server_base, "GET", "api/workspaces", requests.exceptions.ReadTimeout
+        )
+
+        with pytest.raises(exceptions.RequestTimeoutError) as err:
+            _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+        assert not isinstance(err.value, exceptions.DeadlineExceededError)
+
+    def test_timeout_after_deadline_raised(self, mock_server_base):
+        def read_timeout(request, context):
+            time.sleep(0.02)
+            raise requests.exceptions.ReadTimeout
+
+        mock_server_base.adapter.register_uri(
+            "GET", f"{mock_server_base.url}/api/workspaces", json=read_timeout
+        )
+
+        with deadline.deadline(0.01):
+            with pytest.raises(exceptions.DeadlineExceededError):
+                _client(mock_server_base).get_json(
+                    f"{mock_server_base.url}/api/workspaces"
+                )
+
+    def test_no_retry_past_deadline(self, mock_server_base):
+        sleeps = []
+        policy = RetryPolicy(backoff_factor=5.0, jitter=0.0, sleep=sleeps.append)
+        mock_server_base.context.retry_policy = policy
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [{"exc": requests.exceptions.ConnectionError}, json_request_list_item({})],
+        )
+
+        with deadline.deadline(1.0):
+            with pytest.raises(exceptions.CommunicationError):
+                _client(mock_server_base).get_json(
+                    f"{mock_server_base.url}/api/workspaces"
+                )
+        assert sleeps == []
+        assert policy.retries == 0
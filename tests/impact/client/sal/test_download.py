@@ -0,0 +1,209 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modelon.impact.client.sal import deadline, exceptions
+from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.download import RangedDownload
+from modelon.impact.client.sal.http import HTTPClient
+
+DATA = bytes(range(256)) * 1000
+MAT_CONTENT_TYPE = "application/vnd.impact.mat.v1+octet-stream"
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        data = server.data
+        headers = {
+            "content-type": MAT_CONTENT_TYPE,
+            "content-disposition": 'attachment; filename="result.mat"',
+            "etag": server.etag,
+        }
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if not server.ranges or match is None:
+            with server.lock:
+                server.requested.append(None)
+            self._send(200, data, headers)
+            return
+
+        start, end = int(match.group(1)), min(int(match.group(2)), len(data) - 1)
+        if start >= len(data):
+            with server.lock:
+                server.requested.append(start)
+            error = json.dumps({"error": {"message": "Not satisfiable", "code": 0}})
+            self._send(
+                416,
+                error.encode(),
+                {
+                    "content-type": "application/json",
+                    "content-range": f"bytes */{len(data)}",
+                },
+            )
+            return
+        if server.range_limit:
+            end = min(end, start + server.range_limit - 1)
+        with server.lock:
+            server.requested.append(start)
+            fail = start in server.fail_at
+        if fail:
+            error = json.dumps({"error": {"message": "Failed", "code": 0}})
+            self._send(500, error.encode(), {"content-type": "application/json"})
+            return
+        headers["content-range"] = f"bytes {start}-{end}/{len(data)}"
+        self._send(206, data[start : end + 1], headers)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def range_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.data = DATA
+    server.etag = '"v1"'
+    server.ranges = True
+    server.range_limit = None
+    server.fail_at = set()
+    server.requested = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _fetcher(server):
+    client = HTTPClient(context=Context())
+    url = f"http://127.0.0.1:{server.server_address[1]}/result"
+    return lambda byte_range: client.get_mat(
+        url, headers={"Range": byte_range}, stream=True
+    )
+
+
+class TestRangedDownload:
+    def test_parallel_ranges(self, range_server, tmp_path):
+        path = tmp_path / "result.mat"
+        download = RangedDownload(
+            _fetcher(range_server), path, part_size=10000, max_workers=4
+        )
+        resp = download.run()
+        assert path.read_bytes() == DATA
+        assert resp.file_name == "result.mat"
+        assert sorted(range_server.requested) == list(range(0, len(DATA), 10000))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["result.mat"]
+
+    def test_single_request_when_file_fits_in_one_part(self, range_server, tmp_path):
+        path = tmp_path / "result.mat"
+        RangedDownload(_fetcher(range_server), path, part_size=len(DATA)).run()
+        assert path.read_bytes() == DATA
+        assert range_server.requested == [0]
+
+    def test_fallback_without_range_support(self, range_server, tmp_path):
+        range_server.ranges = False
+        path = tmp_path / "result.mat"
+        RangedDownload(_fetcher(range_server), path, part_size=10000).run()
+        assert path.read_bytes() == DATA
+        assert range_server.requested == [None]
+
+    def test_fallback_when_first_range_differs(self, range_server, tmp_path):
+        range_server.range_limit = 4000
+        path = tmp_path / "result.mat"
+        resp = RangedDownload(_fetcher(range_server), path, part_size=10000).run()
+        assert path.read_bytes() == DATA
+        assert resp.file_name == "result.mat"
+        assert range_server.requested == [0, None]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["result.mat"]
+
+    def test_deadline_applies_to_parts(self, range_server, tmp_path):
+        fetch = _fetcher(range_server)
+        remaining = []
+
+        def fetch_with_deadline(byte_range):
+            remaining.append(deadline.remaining())
+            return fetch(byte_range)
+
+        path = tmp_path / "result.mat"
+        with deadline.deadline(60):
+            RangedDownload(
+                fetch_with_deadline, path, part_size=10000, max_workers=4
+            ).run()
+
+        assert path.read_bytes() == DATA
+        assert len(remaining) == len(range(0, len(DATA), 10000))
+        assert all(left is not None and left <= 60 for left in remaining)
+
+    def test_resume_after_failure(self, range_server, tmp_path):
+        path = tmp_path / "result.mat"
+        range_server.fail_at = {50000}
+        download = RangedDownload(
+            _fetcher(range_server), path, part_size=10000, max_workers=1
+        )
+        with pytest.raises(exceptions.HTTPError):
+            download.run()
+        assert not path.exists()
+        progress = json.loads((tmp_path / "result.mat.part.progress").read_text())
+        assert 50000 // 10000 not in progress["completed"]
+
+        range_server.fail_at = set()
+        range_server.requested = []
+        RangedDownload(_fetcher(range_server), path, part_size=10000).run()
+        assert path.read_bytes() == DATA
+        assert 0 not in range_server.requested
+        assert 50000 in range_server.requested
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["result.mat"]
+
+    def test_resume_when_file_shrank(self, range_server, tmp_path):
+        path = tmp_path / "result.mat"
+        range_server.fail_at = {50000}
+        with pytest.raises(exceptions.HTTPError):
+            RangedDownload(
+                _fetcher(range_server), path, part_size=10000, max_workers=1
+            ).run()
+
+        range_server.fail_at = set()
+        range_server.data = DATA[:30000]
+        range_server.requested = []
+        RangedDownload(_fetcher(range_server), path, part_size=10000).run()
+
+        assert path.read_bytes() == DATA[:30000]
+        assert range_server.requested == [50000, None]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["result.mat"]
+
+    def test_empty_file(self, range_server, tmp_path):
+        range_server.data = b""
+        path = tmp_path / "result.mat"
+        RangedDownload(_fetcher(range_server), path, part_size=10000).run()
+
+        assert path.read_bytes() == b""
+        assert range_server.requested == [0, None]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["result.mat"]
+
+    def test_restart_when_file_changed(self, range_server, tmp_path):
+        path = tmp_path / "result.mat"
+        range_server.fail_at = {50000}
+        with pytest.raises(exceptions.HTTPError):
+            RangedDownload(
+                _fetcher(range_server), path, part_size=10000, max_workers=1
+            ).run()
+
+        range_server.fail_at = set()
+        range_server.data = DATA[::-1]
+        range_server.etag = '"v2"'
+        RangedDownload(_fetcher(range_server), path, part_size=10000).run()
+        assert path.read_bytes() == DATA[::-1]
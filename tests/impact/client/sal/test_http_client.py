@@ -1,3 +1,6 @@
+import io
+import os
+
 import pytest
 
 import modelon.impact.client.sal.exceptions
@@ -31,3 +34,36 @@ class TestHTTPClient:
             client.get_json,
             get_with_ssl_exception.url,
         )
+
+    def test_octet_stream_write_to_file_like(self, get_octet_stream):
+        client = modelon.impact.client.sal.service.HTTPClient(
+            context=get_octet_stream.context
+        )
+        resp = client.get_octet_response(get_octet_stream.url, stream=True)
+        sink = io.BytesIO()
+        written = resp.write_to(sink, chunk_size=1000)
+        assert written == 256 * 64
+        assert sink.getvalue() == bytes(range(256)) * 64
+
+    def test_octet_stream_write_to_path(self, get_octet_stream, tmp_path):
+        client = modelon.impact.client.sal.service.HTTPClient(
+            context=get_octet_stream.context
+        )
+        resp = client.get_octet_response(get_octet_stream.url, stream=True)
+        path = tmp_path / "result.mat"
+        resp.write_to(str(path))
+        assert path.read_bytes() == bytes(range(256)) * 64
+        assert resp.file_name == "BouncingBall_2020-09-01_14-33_case_1.mat"
+
+    def test_stream_wrong_content_type_removes_file(self, get_octet_stream, tmp_path):
+        client = modelon.impact.client.sal.service.HTTPClient(
+            context=get_octet_stream.context
+        )
+        resp = client.get_zip_response(get_octet_stream.url, stream=True)
+        path = tmp_path / "workspace.zip"
+        pytest.raises(
+            modelon.impact.client.sal.exceptions.InvalidContentTypeError,
+            resp.write_to,
+            str(path),
+        )
+        assert not os.path.exists(path)
@@ -0,0 +1,161 @@
+import pytest
+import requests
+
+from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.metrics import (
+    MetricsRegistry,
+    RequestRecord,
+    endpoint_template,
+)
+from tests.impact.client.helpers import with_exception, with_json_route
+
+
+@pytest.fixture
+def metrics(mock_server_base):
+    registry = MetricsRegistry()
+    mock_server_base.context.metrics = registry
+    return registry
+
+
+def _record(latency, status_code=200):
+    return RequestRecord(
+        method="GET",
+        endpoint="api/workspaces/{id}",
+        status_code=status_code,
+        latency=latency,
+        request_bytes=0,
+        response_bytes=10,
+        retries=0,
+    )
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("http://impact/api/", "api"),
+            ("http://impact/api/users/me", "api/users/me"),
+            (
+                "http://impact/api/workspaces/ws/experiments/exp/cases/case_1/result",
+                "api/workspaces/{id}/experiments/{id}/cases/{id}/result",
+            ),
+            (
+                "http://impact/api/workspaces/ws/model-executables/fmu/binary",
+                "api/workspaces/{id}/model-executables/{id}/binary",
+            ),
+            (
+                "https://hub/user/someone/impact/api/workspaces/ws",
+                "api/workspaces/{id}",
+            ),
+            ("https://hub/hub/api/user", "hub/api/user"),
+            (
+                "http://impact/api/published-workspaces/orphans/cleanup",
+                "api/published-workspaces/orphans/cleanup",
+            ),
+        ],
+    )
+    def test_ids_stripped(self, url, expected):
+        assert endpoint_template(url) == expected
+
+
+class TestMetricsRegistry:
+    def test_requests_recorded_per_endpoint(self, mock_server_base, metrics):
+        for workspace_id in ["a", "b", "c"]:
+            with_json_route(
+                mock_server_base, "GET", f"api/workspaces/{workspace_id}", {"id": 1}
+            )
+        with_json_route(mock_server_base, "POST", "api/workspaces", {"id": "a"})
+        client = HTTPClient(context=mock_server_base.context)
+        for workspace_id in ["a", "b", "c"]:
+            client.get_json(f"{mock_server_base.url}/api/workspaces/{workspace_id}")
+        client.post_json(f"{mock_server_base.url}/api/workspaces", body={"new": "a"})
+
+        snapshot = metrics.snapshot()
+        assert list(snapshot) == ["GET api/workspaces/{id}", "POST api/workspaces"]
+        get_stats = snapshot["GET api/workspaces/{id}"]
+        assert get_stats["count"] == 3
+        assert get_stats["statusCodes"] == {200: 3}
+        assert get_stats["responseBytes"] == 3 * len(b'{"id": 1}')
+        assert snapshot["POST api/workspaces"]["requestBytes"] == len(b'{"new": "a"}')
+
+    def test_errors_recorded(self, mock_server_base, metrics):
+        error = {"error": {"message": "Not found", "code": 404}}
+        with_json_route(mock_server_base, "GET", "api/workspaces/ws", error, 404)
+        with_exception(
+            mock_server_base, "GET", "api/users/me", requests.exceptions.ConnectTimeout
+        )
+        client = HTTPClient(context=mock_server_base.context)
+        with pytest.raises(exceptions.HTTPError):
+            client.get_json(f"{mock_server_base.url}/api/workspaces/ws")
+        with pytest.raises(exceptions.CommunicationError):
+            client.get_json(f"{mock_server_base.url}/api/users/me")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["GET api/workspaces/{id}"]["errors"] == 1
+        assert snapshot["GET api/users/me"]["statusCodes"] == {None: 1}
+
+    def test_percentiles(self):
+        registry = MetricsRegistry()
+        for latency in range(1, 101):
+            registry.record(_record(latency / 1000))
+        latency = registry.snapshot()["GET api/workspaces/{id}"]["latency"]
+        assert latency["p50"] == 0.05
+        assert latency["p90"] == 0.09
+        assert latency["p99"] == 0.099
+        assert latency["max"] == 0.1
+        assert latency["mean"] == pytest.approx(0.0505)
+
+    def test_percentiles_over_latest_sample(self):
+        registry = MetricsRegistry(sample_size=10)
+        for latency in [10.0] * 10 + [1.0] * 10:
+            registry.record(_record(latency))
+        stats = registry.get("GET", "api/workspaces/{id}")
+        assert stats.percentile(99) == 1.0
+        assert stats.max_latency == 10.0
+
+    def test_callbacks(self, mock_server_base, metrics):
+        records = []
+        metrics.add_callback(records.append)
+        with_json_route(mock_server_base, "GET", "api/users/me", {"data": {}})
+        HTTPClient(context=mock_server_base.context).get_json(
+            f"{mock_server_base.url}/api/users/me"
+        )
+        assert len(records) == 1
+        assert records[0].endpoint == "api/users/me"
+        assert records[0].status_code == 200
+        assert records[0].latency >= 0
+
+        metrics.remove_callback(records.append)
+        metrics.record(_record(0.1))
+        assert len(records) == 1
+
+    def test_failing_callback_does_not_change_outcome(self, mock_server_base, metrics):
+        def fail(record):
+            raise RuntimeError("Callback failed")
+
+        metrics.add_callback(fail)
+        with_json_route(mock_server_base, "GET", "api/users/me", {"data": {}})
+        with_exception(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            requests.exceptions.ConnectionError,
+        )
+        client = HTTPClient(context=mock_server_base.context)
+
+        assert client.get_json(f"{mock_server_base.url}/api/users/me") == {"data": {}}
+        with pytest.raises(exceptions.CommunicationError):
+            client.get_json(f"{mock_server_base.url}/api/workspaces")
+
+    def test_reset(self, metrics):
+        metrics.record(_record(0.1))
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_disabled_by_default(self, mock_server_base):
+        with_json_route(mock_server_base, "GET", "api/users/me", {"data": {}})
+        HTTPClient(context=mock_server_base.context).get_json(
+            f"{mock_server_base.url}/api/users/me"
+        )
+        assert mock_server_base.context.metrics is None
@@ -0,0 +1,73 @@
+import io
+import json
+
+from requests.models import RequestEncodingMixin
+
+from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.multipart import MultipartEncoder
+from tests.impact.client.helpers import with_json_route
+
+
+def _requests_encoded(fields, boundary):
+    body, content_type = RequestEncodingMixin._encode_files(fields, {})
+    requests_boundary = content_type.split("boundary=")[1]
+    return body.replace(requests_boundary.encode(), boundary.encode())
+
+
+class TestMultipartEncoder:
+    def test_same_body_as_requests(self, tmp_path):
+        path = tmp_path / "result.mat"
+        path.write_bytes(bytes(range(256)) * 100)
+        options = json.dumps({"overwrite": True})
+        with open(path, "rb") as f:
+            encoder = MultipartEncoder({"file": f, "options": options})
+            body = encoder.read()
+        with open(path, "rb") as f:
+            expected = _requests_encoded(
+                {"file": f, "options": options}, encoder.boundary
+            )
+        assert body == expected
+        assert len(encoder) == len(expected)
+        assert encoder.content_type == (
+            f"multipart/form-data; boundary={encoder.boundary}"
+        )
+
+    def test_tuple_fields(self):
+        fields = {"file": ("a.fmu", b"\x00\x01", "application/octet-stream")}
+        encoder = MultipartEncoder(fields)
+        assert encoder.read() == _requests_encoded(fields, encoder.boundary)
+
+    def test_chunks_are_bounded(self):
+        data = io.BytesIO(b"x" * 10000)
+        encoder = MultipartEncoder({"file": data}, chunk_size=1024)
+        chunks = list(encoder)
+        assert all(len(chunk) <= 1024 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == len(encoder)
+
+    def test_progress_callback(self):
+        progress = []
+        encoder = MultipartEncoder(
+            {"file": io.BytesIO(b"x" * 5000)},
+            progress_callback=lambda sent, total: progress.append((sent, total)),
+        )
+        while encoder.read(1000):
+            pass
+        assert progress[-1] == (len(encoder), len(encoder))
+        assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+        assert encoder.bytes_read == len(encoder)
+
+
+class TestMultipartUpload:
+    def test_post_json_streams_files(self, mock_server_base, tmp_path):
+        server = with_json_route(mock_server_base, "POST", "api/uploads", {"ok": 1})
+        path = tmp_path / "result.mat"
+        path.write_bytes(b"\x00" * 4096)
+        client = HTTPClient(context=server.context)
+        with open(path, "rb") as f:
+            data = client.post_json(
+                f"{server.url}/api/uploads", files={"file": f, "options": "{}"}
+            )
+        assert data == {"ok": 1}
+        request = server.adapter.last_request
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert int(request.headers["Content-Length"]) > 4096
@@ -0,0 +1,210 @@
+import threading
+
+import pytest
+
+from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.deadline import deadline
+from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.rate_limit import (
+    EndpointClass,
+    RateLimiter,
+    TokenBucket,
+    classify_endpoint,
+)
+from tests.impact.client.helpers import with_json_route
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.parametrize(
+    "method,url,expected",
+    [
+        ("GET", "http://impact/api/executions", EndpointClass.STATUS),
+        (
+            "GET",
+            "http://impact/api/workspaces/ws/experiments/exp/execution",
+            EndpointClass.STATUS,
+        ),
+        (
+            "GET",
+            "http://impact/api/workspaces/ws/model-executables/fmu/compilation",
+            EndpointClass.STATUS,
+        ),
+        ("GET", "http://impact/api/workspace-exports/export_id", EndpointClass.STATUS),
+        ("GET", "http://impact/api/uploads/results/upload_id", EndpointClass.STATUS),
+        (
+            "GET",
+            "http://impact/api/workspaces/ws/experiments/exp/cases/case_1/trajectories",
+            EndpointClass.RESULTS,
+        ),
+        (
+            "POST",
+            "http://impact/api/workspaces/ws/experiments/exp/trajectories",
+            EndpointClass.RESULTS,
+        ),
+        (
+            "GET",
+            "http://impact/api/workspaces/ws/experiments/exp/cases/case_1/result",
+            EndpointClass.RESULTS,
+        ),
+        (
+            "POST",
+            "http://impact/api/workspaces/ws/experiments/exp/execution",
+            EndpointClass.OTHER,
+        ),
+        ("GET", "http://impact/api/workspaces/ws", EndpointClass.OTHER),
+    ],
+)
+def test_classify_endpoint(method, url, expected):
+    assert classify_endpoint(method, url) == expected
+
+
+def test_classify_upload():
+    url = "http://impact/api/uploads/results"
+    assert classify_endpoint("POST", url, files={"file": b""}) == EndpointClass.UPLOAD
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self, clock):
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        assert [bucket.reserve() for _ in range(5)] == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now += 0.5
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.5
+        clock.now += 60
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_delay_takes_no_token(self, clock):
+        bucket = TokenBucket(rate=2, burst=1, clock=clock)
+        assert bucket.delay() == 0.0
+        bucket.reserve()
+        assert bucket.delay() == 0.5
+        assert bucket.delay() == 0.5
+        assert bucket.reserve() == 0.5
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+    def test_shared_by_threads(self):
+        bucket = TokenBucket(rate=10, burst=1, clock=lambda: 0.0)
+        waits = []
+        lock = threading.Lock()
+
+        def reserve():
+            for _ in range(10):
+                wait = bucket.reserve()
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=reserve) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every token is reserved exactly once, at 0.1 second intervals
+        assert sorted(waits) == pytest.approx([i / 10 for i in range(50)])
+
+
+class TestRateLimiter:
+    def test_endpoint_and_default_buckets(self, clock):
+        limiter = RateLimiter(
+            default=TokenBucket(rate=10, burst=10, clock=clock),
+            endpoints={EndpointClass.STATUS: TokenBucket(rate=1, clock=clock)},
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        assert limiter.acquire(EndpointClass.STATUS) == 0.0
+        assert limiter.acquire(EndpointClass.OTHER) == 0.0
+        assert limiter.acquire(EndpointClass.STATUS) == 1.0
+        assert clock.sleeps == [1.0]
+        assert limiter.waited == 1.0
+
+    def test_backoff(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep, max_backoff=30)
+        limiter.backoff(5)
+        assert limiter.acquire() == 5.0
+        assert limiter.acquire() == 0.0
+        limiter.backoff()
+        assert limiter.acquire() == 1.0
+        limiter.backoff(3600)
+        assert limiter.acquire() == 30.0
+
+    def test_pause_past_deadline_raises_without_sleeping(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.backoff(30)
+        with deadline(5), pytest.raises(exceptions.DeadlineExceededError):
+            limiter.acquire()
+        assert clock.sleeps == []
+
+    def test_token_wait_past_deadline_takes_no_token(self, clock):
+        limiter = RateLimiter(
+            default=TokenBucket(rate=1, clock=clock), clock=clock, sleep=clock.sleep
+        )
+        assert limiter.acquire() == 0.0
+        with deadline(0.5), pytest.raises(exceptions.DeadlineExceededError):
+            limiter.acquire()
+        assert clock.sleeps == []
+        with deadline(5):
+            assert limiter.acquire() == 1.0
+
+
+class TestRequestRateLimiting:
+    def test_requests_rate_limited(self, mock_server_base, clock):
+        limiter = RateLimiter(
+            default=TokenBucket(rate=1, clock=clock), clock=clock, sleep=clock.sleep
+        )
+        mock_server_base.context.rate_limiter = limiter
+        with_json_route(mock_server_base, "GET", "api/workspaces", {"data": {}})
+        client = HTTPClient(context=mock_server_base.context)
+
+        for _ in range(3):
+            client.get_json(f"{mock_server_base.url}/api/workspaces")
+
+        assert clock.sleeps == [1.0, 1.0]
+
+    @pytest.mark.parametrize("status_code", [429, 503])
+    def test_backs_off_on_retry_after(self, mock_server_base, clock, status_code):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        mock_server_base.context.rate_limiter = limiter
+        error = {"error": {"message": "Slow down", "code": status_code}}
+        with_json_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            error,
+            status_code,
+            extra_headers={"Retry-After": "7"},
+        )
+        client = HTTPClient(context=mock_server_base.context)
+
+        with pytest.raises(exceptions.HTTPError):
+            client.get_json(f"{mock_server_base.url}/api/workspaces")
+        with pytest.raises(exceptions.HTTPError):
+            client.get_json(f"{mock_server_base.url}/api/workspaces")
+
+        assert clock.sleeps == [7.0]
@@ -0,0 +1,218 @@
+import pytest
+import requests
+
+from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.experiment import ExperimentService
+from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.metrics import MetricsRegistry
+from modelon.impact.client.sal.retry import RetryPolicy
+from modelon.impact.client.sal.uri import URI
+from tests.impact.client.helpers import (
+    json_request_list_item,
+    with_json_request_list_route,
+)
+
+ERROR = {"error": {"message": "Unavailable", "code": 503}}
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def policy(mock_server_base, sleeps):
+    policy = RetryPolicy(max_retries=3, jitter=0.0, sleep=sleeps.append)
+    mock_server_base.context.retry_policy = policy
+    return policy
+
+
+def _client(mock_server_base):
+    return HTTPClient(context=mock_server_base.context)
+
+
+def _unavailable(retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after else None
+    return json_request_list_item(ERROR, 503, headers)
+
+
+class TestRetryPolicy:
+    def test_delay_backoff(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0, jitter=0.0)
+        assert [policy.delay(retry) for retry in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+    def test_delay_server_hint(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=30.0, jitter=0.0)
+        assert policy.delay(0, server_hint=5.0) == 5.0
+        assert policy.delay(0, server_hint=0.1) == 0.5
+        assert policy.delay(0, server_hint=600.0) == 30.0
+
+    def test_delay_jitter(self):
+        policy = RetryPolicy(backoff_factor=1.0, jitter=0.5, seed=1)
+        delays = [policy.delay(0) for _ in range(20)]
+        assert all(0.5 <= delay <= 1.5 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_allows(self):
+        policy = RetryPolicy()
+        assert policy.allows("GET")
+        assert policy.allows("PUT")
+        assert policy.allows("DELETE")
+        assert not policy.allows("POST")
+        assert not policy.allows("PATCH")
+        assert policy.allows("POST", retry_safe=True)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_retries=-1)
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter=1.0)
+
+
+class TestRequestRetries:
+    def test_retry_status_codes(self, mock_server_base, policy, sleeps):
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [
+                _unavailable(),
+                json_request_list_item(ERROR, 502),
+                json_request_list_item({"data": {"items": []}}),
+            ],
+        )
+
+        data = _client(mock_server_base).get_json(
+            f"{mock_server_base.url}/api/workspaces"
+        )
+
+        assert data == {"data": {"items": []}}
+        assert sleeps == [0.5, 1.0]
+        assert policy.retries == 2
+        assert policy.recovered == 1
+
+    def test_retry_connection_errors(self, mock_server_base, policy, sleeps):
+        with_json_request_list_route(
+            mock_server_base,
+            "DELETE",
+            "api/workspaces/ws",
+            [
+                {"exc": requests.exceptions.ConnectionError},
+                {"exc": requests.exceptions.ReadTimeout},
+                json_request_list_item({}),
+            ],
+        )
+
+        _client(mock_server_base).delete_json(
+            f"{mock_server_base.url}/api/workspaces/ws"
+        )
+
+        assert policy.retries == 2
+
+    def test_retry_after_used(self, mock_server_base, policy, sleeps):
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [_unavailable(retry_after="4"), json_request_list_item({})],
+        )
+
+        _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+
+        assert sleeps == [4.0]
+
+    def test_gives_up_after_max_retries(self, mock_server_base, policy, sleeps):
+        with_json_request_list_route(
+            mock_server_base, "GET", "api/workspaces", [_unavailable()]
+        )
+
+        with pytest.raises(exceptions.HTTPError) as err:
+            _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+
+        assert err.value.status_code == 503
+        assert sleeps == [0.5, 1.0, 2.0]
+        assert policy.recovered == 0
+
+    def test_connection_error_raised_after_max_retries(
+        self, mock_server_base, policy, sleeps
+    ):
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [{"exc": requests.exceptions.ConnectionError}],
+        )
+
+        with pytest.raises(exceptions.CommunicationError):
+            _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+        assert policy.retries == 3
+
+    def test_post_not_retried(self, mock_server_base, policy, sleeps):
+        with_json_request_list_route(
+            mock_server_base,
+            "POST",
+            "api/workspaces",
+            [_unavailable(), json_request_list_item({})],
+        )
+
+        with pytest.raises(exceptions.HTTPError):
+            _client(mock_server_base).post_json(
+                f"{mock_server_base.url}/api/workspaces", body={}
+            )
+        assert policy.retries == 0
+
+    def test_safe_post_retried(self, mock_server_base, policy, sleeps):
+        url = "api/workspaces/ws/experiments/exp/trajectories"
+        with_json_request_list_route(
+            mock_server_base,
+            "POST",
+            url,
+            [_unavailable(), json_request_list_item([[[1.0]]])],
+        )
+        service = ExperimentService(
+            URI(mock_server_base.url), _client(mock_server_base)
+        )
+
+        assert service.trajectories_get("ws", "exp", ["h"], False) == [[[1.0]]]
+        assert policy.retries == 1
+
+    def test_ssl_error_not_retried(self, mock_server_base, policy, sleeps):
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [{"exc": requests.exceptions.SSLError}],
+        )
+
+        with pytest.raises(exceptions.SSLError):
+            _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+        assert policy.retries == 0
+
+    def test_retries_recorded_in_metrics(self, mock_server_base, policy):
+        metrics = MetricsRegistry()
+        mock_server_base.context.metrics = metrics
+        records = []
+        metrics.add_callback(records.append)
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [_unavailable(), json_request_list_item({})],
+        )
+
+        _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
+
+        assert [(record.status_code, record.retries) for record in records] == [
+            (200, 1)
+        ]
+
+    def test_disabled_by_default(self, mock_server_base):
+        with_json_request_list_route(
+            mock_server_base,
+            "GET",
+            "api/workspaces",
+            [_unavailable(), json_request_list_item({})],
+        )
+
+        with pytest.raises(exceptions.HTTPError):
+            _client(mock_server_base).get_json(f"{mock_server_base.url}/api/workspaces")
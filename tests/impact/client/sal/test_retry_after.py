@@ -0,0 +1,36 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from modelon.impact.client.sal import retry_after
+from modelon.impact.client.sal.http import HTTPClient
+from tests.impact.client.helpers import with_json_route
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, None), ("5", 5.0), (" 1.5 ", 1.5), ("-3", 0.0), ("soon", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert retry_after.parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(time.time() + 30, usegmt=True)
+    assert 28 <= retry_after.parse_retry_after(value) <= 30
+
+
+def test_hint_recorded_for_response(mock_server_base):
+    with_json_route(
+        mock_server_base,
+        "GET",
+        "api/workspaces/ws",
+        {},
+        extra_headers={"Retry-After": "7"},
+    )
+    HTTPClient(context=mock_server_base.context).get_json(
+        f"{mock_server_base.url}/api/workspaces/ws"
+    )
+    assert retry_after.pop_hint() == 7.0
+    assert retry_after.pop_hint() is None
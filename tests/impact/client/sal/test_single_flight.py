@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.context import Context
+from modelon.impact.client.sal.deadline import deadline
+from modelon.impact.client.sal.http import HTTPClient
+from modelon.impact.client.sal.single_flight import SingleFlight
+
+N_THREADS = 8
+
+
+class _SlowJSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.request_count += 1
+        time.sleep(0.3)
+        status = 500 if self.path.startswith("/api/fail") else 200
+        body = {"path": self.path}
+        if status == 500:
+            body = {"error": {"message": "Failed", "code": 0}}
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowJSONHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.request_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}/api/{path}"
+
+
+def _get_concurrently(client, urls, **kwargs):
+    barrier = threading.Barrier(len(urls))
+
+    def get(url):
+        barrier.wait()
+        return client.get_json(url, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(get, urls))
+
+
+class TestSingleFlight:
+    def test_identical_requests_coalesced(self, slow_server):
+        context = Context(coalesce_requests=True)
+        client = HTTPClient(context=context)
+        url = _url(slow_server, "experiments/exp")
+        results = _get_concurrently(client, [url] * N_THREADS)
+        assert results == [{"path": "/api/experiments/exp"}] * N_THREADS
+        assert slow_server.request_count == 1
+        assert context.single_flight.saved == N_THREADS - 1
+
+    def test_results_are_not_shared_objects(self, slow_server):
+        client = HTTPClient(context=Context(coalesce_requests=True))
+        results = _get_concurrently(client, [_url(slow_server, "cases")] * 2)
+        assert results[0] is not results[1]
+
+    def test_different_params_not_coalesced(self, slow_server):
+        context = Context(coalesce_requests=True)
+        client = HTTPClient(context=context)
+        url = _url(slow_server, "cases")
+        barrier = threading.Barrier(2)
+
+        def get(params):
+            barrier.wait()
+            return client.get_json(url, params=params)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(get, [{"page": 1}, {"page": 2}]))
+        assert slow_server.request_count == 2
+        assert context.single_flight.saved == 0
+
+    def test_disabled_by_default(self, slow_server):
+        context = Context()
+        client = HTTPClient(context=context)
+        _get_concurrently(client, [_url(slow_server, "cases")] * 4)
+        assert context.single_flight is None
+        assert slow_server.request_count == 4
+
+    def test_error_shared_with_waiting_threads(self, slow_server):
+        client = HTTPClient(context=Context(coalesce_requests=True))
+        url = _url(slow_server, "fail")
+        errors = []
+
+        def get():
+            try:
+                client.get_json(url)
+            except exceptions.HTTPError as exce:
+                errors.append(exce)
+
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == 4
+        assert slow_server.request_count == 1
+
+    def test_sequential_calls_not_coalesced(self):
+        single_flight = SingleFlight()
+        key = single_flight.key("GET", "http://impact/api/cases")
+        assert single_flight.do(key, lambda: 1) == 1
+        assert single_flight.do(key, lambda: 2) == 2
+        assert single_flight.saved == 0
+
+    def _in_flight(self, single_flight, key, fn):
+        """Starts a thread calling fn through single_flight and returns once the call
+        is in flight."""
+        started = threading.Event()
+
+        def leader():
+            started.set()
+            return fn()
+
+        def call():
+            with pytest.raises(exceptions.CommunicationError):
+                single_flight.do(key, leader)
+
+        thread = threading.Thread(target=call)
+        thread.start()
+        started.wait()
+        return thread
+
+    def test_waiting_stops_at_deadline(self):
+        single_flight = SingleFlight()
+        key = single_flight.key("GET", "http://impact/api/cases")
+        release = threading.Event()
+
+        def stuck():
+            release.wait()
+            raise exceptions.CommunicationError("Stuck")
+
+        thread = self._in_flight(single_flight, key, stuck)
+        with deadline(0.1), pytest.raises(exceptions.DeadlineExceededError):
+            single_flight.do(key, lambda: 2)
+        release.set()
+        thread.join()
+
+    def test_timeout_not_shared_with_waiting_threads(self):
+        single_flight = SingleFlight()
+        key = single_flight.key("GET", "http://impact/api/cases")
+        release = threading.Event()
+
+        def timed_out():
+            release.wait()
+            raise exceptions.DeadlineExceededError("The deadline has passed")
+
+        thread = self._in_flight(single_flight, key, timed_out)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            follower = executor.submit(single_flight.do, key, lambda: 2)
+            while single_flight.saved == 0:
+                time.sleep(0.01)
+            release.set()
+            assert follower.result() == 2
+        thread.join()
+        assert single_flight.saved == 0
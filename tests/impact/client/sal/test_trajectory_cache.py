@@ -0,0 +1,269 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from modelon.impact.client.sal.trajectory_cache import TrajectoryCache, TrajectoryKey
+from tests.impact.client.helpers import (
+    IDs,
+    create_case_entity,
+    create_experiment_entity,
+    create_service_mock,
+)
+
+SERVER = "http://impact"
+
+
+def _key(variable="h", case_id=IDs.CASE_ID_PRIMARY, last_point_only=False):
+    return TrajectoryKey(
+        SERVER,
+        IDs.WORKSPACE_ID_PRIMARY,
+        IDs.EXPERIMENT_ID_PRIMARY,
+        case_id,
+        variable,
+        last_point_only,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TrajectoryCache(str(tmp_path / "trajectories"))
+
+
+class TestTrajectoryCache:
+    def test_put_get(self, cache):
+        assert cache.get(_key(), "1") == (False, None)
+        cache.put(_key(), "1", [0.0, 0.5, 1.0])
+
+        assert cache.get(_key(), "1") == (True, [0.0, 0.5, 1.0])
+        assert cache.get(_key(last_point_only=True), "1") == (False, None)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.parametrize(
+        "value", [[1, 2.5], [None, 1.0], ["a"], {"trajectory": [1.0]}, None, []]
+    )
+    def test_values_round_trip(self, cache, value):
+        cache.put(_key(), "1", value)
+        assert cache.get(_key(), "1") == (True, value)
+
+    def test_floats_stored_packed(self, cache):
+        cache.put(_key("floats"), "1", [float(i) for i in range(1000)])
+        cache.put(_key("ints"), "1", list(range(1000)))
+        assert cache.size < 8000 + 2 * 4000
+
+    def test_other_version_discarded(self, cache):
+        cache.put(_key(), "1", [1.0])
+
+        assert cache.get(_key(), "2") == (False, None)
+        assert len(cache) == 0
+        assert cache.get(_key(), "1") == (False, None)
+
+    def test_lru_eviction(self, tmp_path):
+        cache = TrajectoryCache(str(tmp_path), max_bytes=1000)
+        for variable in ["a", "b", "c"]:
+            cache.put(_key(variable), "1", [1.0] * 20)
+        assert len(cache) == 3
+
+        cache.get(_key("a"), "1")
+        cache.put(_key("d"), "1", [1.0] * 20)
+
+        assert cache.size <= 1000
+        assert cache.get(_key("b"), "1") == (False, None)
+        assert cache.get(_key("a"), "1")[0]
+        assert cache.get(_key("d"), "1")[0]
+
+    def test_too_large_not_cached(self, tmp_path):
+        cache = TrajectoryCache(str(tmp_path), max_bytes=100)
+        cache.put(_key(), "1", [1.0] * 100)
+        assert len(cache) == 0
+
+    def test_persisted(self, tmp_path, cache):
+        cache.put(_key(), "1", [1.0, 2.0])
+
+        reloaded = TrajectoryCache(str(tmp_path / "trajectories"))
+
+        assert len(reloaded) == 1
+        assert reloaded.size == cache.size
+        assert reloaded.get(_key(), "1") == (True, [1.0, 2.0])
+
+    def test_corrupt_file_ignored(self, tmp_path, cache):
+        cache.put(_key(), "1", [1.0, 2.0])
+        for root, _, names in os.walk(tmp_path / "trajectories"):
+            for name in names:
+                with open(os.path.join(root, name), "wb") as f:
+                    f.write(b"garbage")
+
+        assert cache.get(_key(), "1") == (False, None)
+        assert len(cache) == 0
+
+    def test_invalidate_case(self, cache):
+        cache.put(_key("h"), "1", [1.0])
+        cache.put(_key("x"), "1", [2.0])
+        cache.put(_key("h", case_id=IDs.CASE_ID_SECONDARY), "1", [3.0])
+
+        cache.invalidate_case(
+            SERVER, IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, "case_1"
+        )
+
+        assert len(cache) == 1
+        assert cache.get(_key("h", case_id=IDs.CASE_ID_SECONDARY), "1")[0]
+
+    def test_get_or_fetch(self, cache):
+        fetch = MagicMock(
+            side_effect=lambda variables: [[[1.0], [2.0]]] * len(variables)
+        )
+        versions = {"case_1": "1", "case_2": None}
+
+        def get(variables):
+            return cache.get_or_fetch(
+                SERVER,
+                IDs.WORKSPACE_ID_PRIMARY,
+                IDs.EXPERIMENT_ID_PRIMARY,
+                {"case_1": "1", "case_2": "1"},
+                variables,
+                False,
+                fetch,
+            )
+
+        assert get(["h"]) == [[[1.0], [2.0]]]
+        assert get(["h", "x"]) == [[[1.0], [2.0]], [[1.0], [2.0]]]
+        assert get(["x", "h"]) == [[[1.0], [2.0]], [[1.0], [2.0]]]
+        assert [c.args for c in fetch.call_args_list] == [(["h"],), (["x"],)]
+
+        # Cases without a version are always fetched
+        cache.get_or_fetch(
+            SERVER,
+            IDs.WORKSPACE_ID_PRIMARY,
+            IDs.EXPERIMENT_ID_PRIMARY,
+            versions,
+            ["h"],
+            False,
+            fetch,
+        )
+        assert fetch.call_count == 3
+
+
+def _service(cache):
+    service = create_service_mock()
+    service.experiment.trajectory_cache = cache
+    service.experiment.base_url = SERVER
+    return service
+
+
+def _cases(finished):
+    return {
+        "data": {
+            "items": [
+                {"id": f"case_{i + 1}", "run_info": {"datetime_finished": time}}
+                for i, time in enumerate(finished)
+            ]
+        }
+    }
+
+
+class TestCachedTrajectories:
+    def test_experiment_trajectories(self, cache):
+        service = _service(cache)
+        service.experiment.experiment_result_variables_get.return_value = ["h", "x"]
+        service.experiment.cases_get.return_value = _cases([1000, 2000])
+        service.experiment.trajectories_get.return_value = [[[1.0], [2.0]]]
+        experiment = create_experiment_entity(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        first = experiment.get_trajectories(["h"])
+        second = experiment.get_trajectories(["h"])
+
+        assert first == second == {"case_1": {"h": [1.0]}, "case_2": {"h": [2.0]}}
+        assert service.experiment.trajectories_get.call_count == 1
+
+        # Re-executing a case discards its cached trajectories
+        service.experiment.cases_get.return_value = _cases([1000, 3000])
+        experiment.get_trajectories(["h"])
+        assert service.experiment.trajectories_get.call_count == 2
+
+    def test_experiment_last_point(self, cache):
+        service = _service(cache)
+        service.experiment.experiment_result_variables_get.return_value = ["h", "x"]
+        service.experiment.cases_get.return_value = _cases([1000])
+        service.experiment.trajectories_get.return_value = {
+            "data": {
+                "items": [
+                    {
+                        "caseId": "case_1",
+                        "items": [{"trajectory": [1.0]}, {"trajectory": [2.0]}],
+                    }
+                ]
+            }
+        }
+        experiment = create_experiment_entity(
+            IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+        )
+
+        first = experiment.get_last_point()
+        second = experiment.get_last_point(["x"])
+
+        assert first.as_lists() == [[1.0, 2.0]]
+        assert second.as_lists() == [[2.0]]
+        assert second.cases == ["case_1"]
+        assert service.experiment.trajectories_get.call_count == 1
+
+    def test_case_result_and_import(self, cache):
+        service = _service(cache)
+        service.experiment.case_get.return_value = {
+            "run_info": {
+                "status": "successful",
+                "consistent": True,
+                "datetime_finished": 1000,
+            }
+        }
+        service.experiment.case_result_variables_get.return_value = ["h"]
+        service.experiment.case_trajectories_get.return_value = [[1.0, 2.0]]
+        service.experiment.case_result_upload.return_value = {
+            "data": {"location": "api/uploads/results/upload_id"}
+        }
+        case = create_case_entity(
+            IDs.CASE_ID_PRIMARY,
+            IDs.WORKSPACE_ID_PRIMARY,
+            IDs.EXPERIMENT_ID_PRIMARY,
+            service,
+        )
+
+        assert case.get_trajectories()["h"] == [1.0, 2.0]
+        assert case.get_trajectories()["h"] == [1.0, 2.0]
+        assert service.experiment.case_trajectories_get.call_count == 1
+
+        service.imports.get_import_status.return_value = {"data": {"status": "running"}}
+        operation = case.import_result("result.mat", overwrite=True)
+        assert case.get_trajectories()["h"] == [1.0, 2.0]
+        assert service.experiment.case_trajectories_get.call_count == 2
+
+        # Trajectories cached while the import was running are discarded when it
+        # finishes
+        service.experiment.case_trajectories_get.return_value = [[3.0, 4.0]]
+        service.imports.get_import_status.return_value = {"data": {"status": "ready"}}
+        operation.wait()
+        assert case.get_trajectories()["h"] == [3.0, 4.0]
+        assert service.experiment.case_trajectories_get.call_count == 3
+
+    def test_not_cached_without_finished_time(self, cache):
+        service = _service(cache)
+        service.experiment.case_get.return_value = {
+            "run_info": {"status": "successful", "consistent": True}
+        }
+        service.experiment.case_result_variables_get.return_value = ["h"]
+        service.experiment.case_trajectories_get.return_value = [[1.0]]
+        case = create_case_entity(
+            IDs.CASE_ID_PRIMARY,
+            IDs.WORKSPACE_ID_PRIMARY,
+            IDs.EXPERIMENT_ID_PRIMARY,
+            service,
+        )
+
+        case.get_trajectories()["h"]
+        case.get_trajectories()["h"]
+
+        assert service.experiment.case_trajectories_get.call_count == 2
+        assert len(cache) == 0
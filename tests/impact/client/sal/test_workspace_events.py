@@ -0,0 +1,148 @@
+import json
+import queue
+import threading
+import time
+
+import pytest
+from websockets.sync.server import serve
+
+from modelon.impact.client.operations.polling import PollingStrategy
+from modelon.impact.client.sal.uri import URI
+from modelon.impact.client.sal.workspace_events import WorkspaceEvents
+from modelon.impact.client.sal.ws import SyncWebSocketClient
+from tests.impact.client.helpers import (
+    IDs,
+    create_experiment_operation,
+    create_service_mock,
+)
+
+
+class NotifyingServer:
+    """WebSocket server answering workspace subscriptions and pushing queued
+    notifications."""
+
+    def __init__(self):
+        self.notifications = queue.Queue()
+        self.subscriptions = []
+        self._server = serve(self._handle, "127.0.0.1", 0)
+        self.port = self._server.socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _handle(self, connection):
+        request = json.loads(connection.recv())
+        self.subscriptions.append(request["params"])
+        # Notifications may arrive before the response to the subscription
+        connection.send(self._notification({"message": "Subscribing"}))
+        connection.send(
+            json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {}})
+        )
+        while True:
+            params = self.notifications.get()
+            if params is None:
+                return
+            connection.send(self._notification(params))
+
+    @staticmethod
+    def _notification(params):
+        return json.dumps(
+            {"jsonrpc": "2.0", "method": "impact/workspace", "params": params}
+        )
+
+    def connect(self, on_notification):
+        return SyncWebSocketClient(
+            URI(f"ws://127.0.0.1:{self.port}"), on_notification=on_notification
+        )
+
+    def shutdown(self):
+        self.notifications.put(None)
+        self._server.shutdown()
+
+
+@pytest.fixture
+def server():
+    server = NotifyingServer()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def events(server):
+    events = WorkspaceEvents(server.connect, fallback_interval=60.0)
+    yield events
+    events.close()
+
+
+def _wait_connected(subscription):
+    assert subscription._listener.wait_connected(5.0)
+
+
+def test_notification_mentioning_entity_notifies(server, events):
+    with events.subscribe(IDs.WORKSPACE_ID_PRIMARY, ["exp_1"]) as subscription:
+        _wait_connected(subscription)
+        assert server.subscriptions == [IDs.WORKSPACE_ID_PRIMARY]
+        server.notifications.put(
+            {"message": "Experiment done", "data": {"experiment": {"id": "exp_1"}}}
+        )
+        assert subscription.wait(5.0)
+
+
+def test_notification_for_other_entity_ignored(server, events):
+    with events.subscribe(IDs.WORKSPACE_ID_PRIMARY, ["exp_1"]) as subscription:
+        _wait_connected(subscription)
+        server.notifications.put({"message": "Experiment done", "id": "exp_2"})
+        assert not subscription.wait(0.2)
+
+
+def test_one_connection_per_workspace(server, events):
+    first = events.subscribe(IDs.WORKSPACE_ID_PRIMARY, ["exp_1"])
+    second = events.subscribe(IDs.WORKSPACE_ID_PRIMARY, ["fmu_1"])
+    _wait_connected(first)
+    server.notifications.put({"ids": ["exp_1", "fmu_1"]})
+    assert first.wait(5.0)
+    assert second.wait(5.0)
+    assert server.subscriptions == [IDs.WORKSPACE_ID_PRIMARY]
+
+
+def test_operation_completed_by_push(server, events):
+    service = create_service_mock()
+    service.workspace_events = events
+    done = threading.Event()
+    service.experiment.execute_status.side_effect = lambda *args: {
+        "status": "done" if done.is_set() else "running"
+    }
+    operation = create_experiment_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+    )
+    # Connect ahead of waiting, so that the wait does not start out polling
+    _wait_connected(events.subscribe(IDs.WORKSPACE_ID_PRIMARY, []))
+
+    def finish():
+        done.set()
+        server.notifications.put({"experimentId": IDs.EXPERIMENT_ID_PRIMARY})
+
+    threading.Timer(0.2, finish).start()
+    start = time.time()
+    operation.wait(polling=PollingStrategy.fixed(60.0))
+
+    assert time.time() - start < 5.0
+    assert service.experiment.execute_status.call_count == 2
+
+
+def test_polling_used_without_connection():
+    def connect(on_notification):
+        raise OSError("Connection refused")
+
+    events = WorkspaceEvents(connect)
+    service = create_service_mock()
+    service.workspace_events = events
+    service.experiment.execute_status.side_effect = [
+        {"status": "running"},
+        {"status": "done"},
+    ]
+    operation = create_experiment_operation(
+        IDs.WORKSPACE_ID_PRIMARY, IDs.EXPERIMENT_ID_PRIMARY, service
+    )
+    operation.wait(polling=PollingStrategy.fixed(0.01))
+    assert service.experiment.execute_status.call_count == 2
+    events.close()
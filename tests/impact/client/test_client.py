@@ -11,7 +11,14 @@ from modelon.impact.client.entities.experiment import Experiment
 from modelon.impact.client.entities.project import Project
 from modelon.impact.client.entities.workspace import Workspace, WorkspaceDefinition
 from modelon.impact.client.operations.experiment import ExperimentOperation
+from modelon.impact.client.operations.journal import (
+    JournalEntry,
+    OperationJournal,
+    OperationKind,
+)
 from modelon.impact.client.operations.model_executable import ModelExecutableOperation
+from modelon.impact.client.operations.workspace.exports import WorkspaceExportOperation
+from modelon.impact.client.sal.metrics import MetricsRegistry
 from tests.files.paths import get_archived_project_path, get_archived_workspace_path
 from tests.impact.client.helpers import (
     ClientHelper,
@@ -345,3 +352,86 @@ def test_client_login_fail_lets_user_enter_new_key(key_validation_fails):
     )
 
     cred_manager.get_key_from_prompt.assert_called()
+
+
+def test_client_metrics(user_with_license):
+    cred_manager = MagicMock()
+    cred_manager.get_key.return_value = "test_client_metrics_key"
+    user_with_license.context.metrics = MetricsRegistry()
+    client = Client(
+        url=user_with_license.url,
+        context=user_with_license.context,
+        credential_manager=cred_manager,
+    )
+    snapshot = client.metrics.snapshot()
+    assert snapshot["GET api/users/me"]["count"] == 1
+    assert snapshot["GET api"]["statusCodes"] == {200: 1}
+
+
+def test_client_metrics_disabled_by_default(user_with_license):
+    cred_manager = MagicMock()
+    cred_manager.get_key.return_value = "test_client_metrics_key"
+    client = Client(
+        url=user_with_license.url,
+        context=user_with_license.context,
+        credential_manager=cred_manager,
+    )
+    assert client.metrics is None
+
+
+def test_client_resume_operations(user_with_license, tmp_path):
+    journal = OperationJournal(str(tmp_path / "operations.jsonl"))
+    journal.record(
+        JournalEntry(
+            OperationKind.EXPERIMENT,
+            IDs.WORKSPACE_ID_PRIMARY,
+            IDs.EXPERIMENT_ID_PRIMARY,
+        )
+    )
+    journal.record(
+        JournalEntry(
+            OperationKind.COMPILATION, IDs.WORKSPACE_ID_PRIMARY, IDs.FMU_ID_PRIMARY
+        )
+    )
+    journal.record(
+        JournalEntry(
+            OperationKind.WORKSPACE_EXPORT,
+            None,
+            "export_id",
+            location="api/workspace-exports/export_id",
+        )
+    )
+    cred_manager = MagicMock()
+    cred_manager.get_key.return_value = "test_client_resume_operations_key"
+    client = Client(
+        url=user_with_license.url,
+        context=user_with_license.context,
+        credential_manager=cred_manager,
+        journal=journal,
+    )
+
+    operations = client.resume_operations()
+
+    assert [type(operation) for operation in operations] == [
+        ExperimentOperation,
+        ModelExecutableOperation,
+        WorkspaceExportOperation,
+    ]
+    assert [operation.id for operation in operations] == [
+        IDs.EXPERIMENT_ID_PRIMARY,
+        IDs.FMU_ID_PRIMARY,
+        "export_id",
+    ]
+    assert len(journal.entries()) == 3
+
+
+def test_client_resume_operations_without_journal(user_with_license):
+    cred_manager = MagicMock()
+    cred_manager.get_key.return_value = "test_client_resume_operations_key"
+    client = Client(
+        url=user_with_license.url,
+        context=user_with_license.context,
+        credential_manager=cred_manager,
+    )
+    with pytest.raises(ValueError):
+        client.resume_operations()
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+
+import pytest
+
+from modelon.impact.client import tracing
+from modelon.impact.client.sal import exceptions
+from modelon.impact.client.sal.http import HTTPClient
+from tests.impact.client.helpers import IDs, with_json_route
+
+
+class RecordedSpan:
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def is_recording(self):
+        return True
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        parent = self._stack[-1] if self._stack else None
+        span = RecordedSpan(name, attributes, parent)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.pop()
+
+    def get(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+class Traced:
+    def __init__(self, http_client, url):
+        self._workspace_id = IDs.WORKSPACE_ID_PRIMARY
+        self._exp_id = IDs.EXPERIMENT_ID_PRIMARY
+        self._http_client = http_client
+        self._url = url
+
+    @tracing.traced
+    def fetch(self):
+        return self._http_client.get_json(self._url)
+
+
+@pytest.fixture
+def tracer():
+    tracer = RecordingTracer()
+    tracing.set_tracer(tracer)
+    yield tracer
+    tracing.set_tracer(None)
+
+
+def test_no_op_by_default():
+    assert not tracing.is_enabled()
+    with tracing.start_span("span", {"a": 1}) as span:
+        assert not span.is_recording()
+
+
+def test_request_span(mock_server_base, tracer):
+    server = with_json_route(mock_server_base, "GET", "api/workspaces/ws", {})
+    HTTPClient(context=server.context).get_json(f"{server.url}/api/workspaces/ws")
+
+    (span,) = tracer.get("HTTP GET")
+    assert span.attributes == {
+        "http.request.method": "GET",
+        "url.full": f"{server.url}/api/workspaces/ws",
+        "impact.endpoint": "api/workspaces/{id}",
+        "http.response.status_code": 200,
+    }
+
+
+def test_request_span_for_error_response(mock_server_base, tracer):
+    error = {"error": {"message": "Not found", "code": 404}}
+    server = with_json_route(mock_server_base, "GET", "api/workspaces/ws", error, 404)
+    with pytest.raises(exceptions.HTTPError):
+        HTTPClient(context=server.context).get_json(f"{server.url}/api/workspaces/ws")
+    (span,) = tracer.get("HTTP GET")
+    assert span.attributes["http.response.status_code"] == 404
+
+
+def test_spans_are_nested(mock_server_base, tracer):
+    server = with_json_route(mock_server_base, "GET", "api/workspaces/ws", {})
+    client = HTTPClient(context=server.context)
+    Traced(client, f"{server.url}/api/workspaces/ws").fetch()
+
+    (entity_span,) = tracer.get("Traced.fetch")
+    assert entity_span.attributes == {
+        "impact.workspace.id": IDs.WORKSPACE_ID_PRIMARY,
+        "impact.experiment.id": IDs.EXPERIMENT_ID_PRIMARY,
+    }
+    (request_span,) = tracer.get("HTTP GET")
+    assert request_span.parent is entity_span
+
+
+def test_entity_and_operation_spans(workspace, tracer):
+    operation = workspace.entity.execute({})
+    operation.wait()
+
+    (execute_span,) = tracer.get("Workspace.execute")
+    assert execute_span.attributes == {"impact.workspace.id": IDs.WORKSPACE_ID_PRIMARY}
+    (wait_span,) = tracer.get("ExperimentOperation.wait")
+    assert wait_span.attributes == {
+        "impact.workspace.id": IDs.WORKSPACE_ID_PRIMARY,
+        "impact.experiment.id": IDs.EXPERIMENT_ID_PRIMARY,
+        "impact.operation.name": "Execution",
+        "impact.operation.polls": 1,
+    }